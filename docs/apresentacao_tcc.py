@@ -3,873 +3,873 @@
 """
 Script para gerar apresentação PowerPoint do TCC VivaFit Seniors
 Baseado no modelo de apresentação perante banca
+
+O conteúdo dos slides é descrito como dados em SLIDES e renderizado pelo
+motor em `gerador/`.
 """
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
-from pptx.dml.color import RGBColor
+import argparse
+import glob
+import os
+import sys
 
-def criar_apresentacao():
-    """Cria apresentação PowerPoint do TCC"""
-    
-    # Criar apresentação
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
-    
-    # Definir cores do tema
-    COR_PRIMARIA = RGBColor(14, 165, 163)  # #0ea5a3 (teal)
-    COR_TEXTO = RGBColor(51, 51, 51)
-    COR_SECUNDARIA = RGBColor(102, 102, 102)
-    
+# Só módulos leves aqui: python-pptx e lxml são importados quando há o que renderizar
+from gerador.esquema import carregar_esquema, slides_esquema
+from gerador.i18n import (IDIOMA_ORIGEM, IDIOMAS, atualizar_catalogos, pendentes, textos_do_codigo,
+                          textos_dos_slides, traduzir, traduzir_slides, usar_idioma)
+from gerador.imagens import galeria
+from gerador.padroes import CACHE_PADRAO, EPOCA_REPRODUTIVEL, NIVEIS_COMPRESSAO, NOMES_TEMAS, SOCKET_PADRAO
+from gerador.parametros import carregar_parametros, personalizar
+from gerador.telemetria import ler_telemetria, parametros_metricas, slide_metricas
+from gerador.variantes import Variante, derivar
+
+DIR_DOCS = os.path.dirname(os.path.abspath(__file__))
+SAIDA_PADRAO = os.path.join(DIR_DOCS, 'Apresentacao_TCC_VivaFit_Seniors.pptx')
+
+# Fotos dos exercícios do app e QR code de download do APK
+FOTOS_EXERCICIOS = sorted(glob.glob(os.path.join(DIR_DOCS, '..', 'assets', 'exercises', '*.jpg')))
+QRCODE = os.path.join(DIR_DOCS, 'qrcode.png')
+
+# Esquema do banco para os slides do modelo de dados (--esquema)
+SCHEMA_SQL = os.path.join(DIR_DOCS, 'lucidchart-import', 'schema.sql')
+DB_CSV = os.path.join(DIR_DOCS, 'DB.csv')
+
+# Dump da tabela profiles para os slides de cadastros e nível de atividade (--perfis)
+PERFIS_SQL = os.path.join(DIR_DOCS, 'profiles_rows.sql')
+
+# Diagrama entidade-relacionamento, depois da visão geral do modelo de dados (--esquema)
+DIAGRAMA_ER = {
+    "nome": "diagrama_er",
+    "tipo": "er",
+    "titulo": "DIAGRAMA ENTIDADE-RELACIONAMENTO",
+    "tamanho_titulo": 32,
+    "arquivo": os.path.join(DIR_DOCS, 'lucidchart-import', 'vivafit_seniors.json'),
+    "relacoes": os.path.join(DIR_DOCS, 'lucidchart-import', 'relationships.csv'),
+}
+
+# Diagramas do draw.io inseridos depois do slide de mesmo nome (--diagramas)
+DIAGRAMAS = {
+    "arquitetura": {
+        "nome": "arquitetura_diagrama",
+        "tipo": "diagrama",
+        "titulo": "ARQUITETURA DO SISTEMA",
+        "arquivo": os.path.join(DIR_DOCS, 'arquitetura-fluxograma-pt.drawio'),
+    },
+    "cache": {
+        "nome": "cache_diagrama",
+        "tipo": "diagrama",
+        "titulo": "SISTEMA DE CACHE OFFLINE-FIRST",
+        "tamanho_titulo": 36,
+        "arquivo": os.path.join(DIR_DOCS, 'arquitetura-cache-performance.drawio'),
+    },
+}
+
+# Campos personalizáveis por apresentação ({autor}, {data}, {link_apk} nos slides);
+# {taxa_cache} e {reducao_latencia} são substituídos pelos valores medidos com --metricas
+DECK_PADRAO = {
+    "autor": "Guilherme Antony",
+    "data": "Novembro de 2025",
+    "link_apk": "https://expo.dev/artifacts/eas/s8rCmPjY3mcTXJXSYWtgqx.apk",
+    "taxa_cache": "~85%",
+    "reducao_latencia": "73%",
+}
+
+# Títulos e seções em tamanho maior (slides 2 e 3)
+SECAO_24 = {"tamanho": 24}
+
+SLIDES = [
     # ==================== SLIDE 1: CAPA ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Layout em branco
-    
-    # Título
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "VIVAFIT SENIORS"
-    title_p = title_frame.paragraphs[0]
-    title_p.font.size = Pt(48)
-    title_p.font.bold = True
-    title_p.font.color.rgb = COR_PRIMARIA
-    title_p.alignment = PP_ALIGN.CENTER
-    
-    # Subtítulo
-    subtitle_box = slide.shapes.add_textbox(Inches(0.5), Inches(3.2), Inches(9), Inches(1))
-    subtitle_frame = subtitle_box.text_frame
-    subtitle_frame.text = "Aplicativo Mobile de Fitness para Idosos com\nArquitetura Offline-First"
-    subtitle_p = subtitle_frame.paragraphs[0]
-    subtitle_p.font.size = Pt(24)
-    subtitle_p.font.color.rgb = COR_TEXTO
-    subtitle_p.alignment = PP_ALIGN.CENTER
-    
-    # Autor e data
-    info_box = slide.shapes.add_textbox(Inches(0.5), Inches(5.5), Inches(9), Inches(1.5))
-    info_frame = info_box.text_frame
-    info_frame.text = "Guilherme Antony\nTrabalho de Conclusão de Curso\nNovembro de 2025"
-    for p in info_frame.paragraphs:
-        p.font.size = Pt(18)
-        p.font.color.rgb = COR_SECUNDARIA
-        p.alignment = PP_ALIGN.CENTER
-    
+    {
+        "nome": "capa",
+        "tipo": "caixas",
+        "caixas": [
+            ((0.5, 2, 9, 1), "VIVAFIT SENIORS", "destaque"),
+            ((0.5, 3.2, 9, 1), "Aplicativo Mobile de Fitness para Idosos com\nArquitetura Offline-First", "subtitulo"),
+            ((0.5, 5.5, 9, 1.5), "{autor}\nTrabalho de Conclusão de Curso\n{data}", "rodape"),
+        ],
+    },
     # ==================== SLIDE 2: INTRODUÇÃO ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "INTRODUÇÃO"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    # Objetivo Geral
-    p = tf.paragraphs[0]
-    p.text = "OBJETIVO GERAL"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    p = tf.add_paragraph()
-    p.text = "Desenvolver um aplicativo mobile de exercícios físicos para o público idoso, implementando arquitetura em camadas com padrão offline-first para garantir disponibilidade contínua."
-    p.font.size = Pt(18)
-    p.font.color.rgb = COR_TEXTO
-    p.space_after = Pt(20)
-    p.level = 0
-    
-    # Objetivos Específicos
-    p = tf.add_paragraph()
-    p.text = "OBJETIVOS ESPECÍFICOS"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    objetivos = [
-        "Implementar arquitetura em 4 camadas com separação de responsabilidades",
-        "Desenvolver sistema de cache offline com taxa de acerto ~85%",
-        "Criar catálogo de 10+ exercícios em 4 categorias",
-        "Implementar autenticação segura com OAuth 2.0 e JWT"
-    ]
-    
-    for obj in objetivos:
-        p = tf.add_paragraph()
-        p.text = f"• {obj}"
-        p.font.size = Pt(16)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "introducao",
+        "tipo": "conteudo",
+        "titulo": "INTRODUÇÃO",
+        "blocos": [
+            ("secao", "OBJETIVO GERAL", SECAO_24),
+            ("texto", "Desenvolver um aplicativo mobile de exercícios físicos para o público idoso, implementando arquitetura em camadas com padrão offline-first para garantir disponibilidade contínua."),
+            ("secao", "OBJETIVOS ESPECÍFICOS", SECAO_24),
+            ("lista", [
+                "Implementar arquitetura em 4 camadas com separação de responsabilidades",
+                "Desenvolver sistema de cache offline com taxa de acerto {taxa_cache}",
+                "Criar catálogo de 10+ exercícios em 4 categorias",
+                "Implementar autenticação segura com OAuth 2.0 e JWT",
+            ]),
+        ],
+    },
     # ==================== SLIDE 3: PROBLEMA E JUSTIFICATIVA ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "PROBLEMA DE PESQUISA E JUSTIFICATIVA"
-    title.text_frame.paragraphs[0].font.size = Pt(36)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    # Problema
-    p = tf.paragraphs[0]
-    p.text = "PROBLEMA DE PESQUISA"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    p = tf.add_paragraph()
-    p.text = "Como desenvolver um aplicativo mobile de fitness para idosos que mantenha funcionalidade mesmo sem conexão à internet, garantindo disponibilidade contínua dos recursos essenciais?"
-    p.font.size = Pt(18)
-    p.font.color.rgb = COR_TEXTO
-    p.space_after = Pt(20)
-    
-    # Justificativa
-    p = tf.add_paragraph()
-    p.text = "JUSTIFICATIVA"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    justificativas = [
-        "Envelhecimento populacional crescente (ONU, 2019)",
-        "Necessidade de soluções tecnológicas acessíveis para idosos",
-        "Falhas de conectividade não devem impedir exercícios físicos",
-        "Conformidade com LGPD para dados sensíveis de saúde",
-        "Gap no mercado de apps fitness focados no público sênior"
-    ]
-    
-    for just in justificativas:
-        p = tf.add_paragraph()
-        p.text = f"• {just}"
-        p.font.size = Pt(16)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "problema",
+        "tipo": "conteudo",
+        "titulo": "PROBLEMA DE PESQUISA E JUSTIFICATIVA",
+        "tamanho_titulo": 36,
+        "blocos": [
+            ("secao", "PROBLEMA DE PESQUISA", SECAO_24),
+            ("texto", "Como desenvolver um aplicativo mobile de fitness para idosos que mantenha funcionalidade mesmo sem conexão à internet, garantindo disponibilidade contínua dos recursos essenciais?"),
+            ("secao", "JUSTIFICATIVA", SECAO_24),
+            ("lista", [
+                "Envelhecimento populacional crescente (ONU, 2019)",
+                "Necessidade de soluções tecnológicas acessíveis para idosos",
+                "Falhas de conectividade não devem impedir exercícios físicos",
+                "Conformidade com LGPD para dados sensíveis de saúde",
+                "Gap no mercado de apps fitness focados no público sênior",
+            ]),
+        ],
+    },
     # ==================== SLIDE 4: FUNDAMENTAÇÃO TEÓRICA ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "FUNDAMENTAÇÃO TEÓRICA"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    topicos = [
-        ("Arquitetura em Camadas", "Fowler (2002), Bass et al. (2012)", 
-         "Separação de responsabilidades, manutenibilidade e escalabilidade"),
-        
-        ("Padrão Offline-First", "Firtman (2016), Taivalsaari & Mikkonen (2021)",
-         "Prioriza funcionamento local, sincronização em background"),
-        
-        ("React Native e Expo", "Facebook (2023), Expo (2023)",
-         "Desenvolvimento multiplataforma, hot reload, APIs nativas"),
-        
-        ("Autenticação e Segurança", "Stallings & Brown (2018), Hardt (2012)",
-         "OAuth 2.0, JWT, Row Level Security (RLS)"),
-        
-        ("Backend-as-a-Service", "Supabase (2023)",
-         "PostgreSQL, autenticação, storage, APIs em tempo real")
-    ]
-    
-    for topico, autores, desc in topicos:
-        p = tf.paragraphs[0] if topico == topicos[0][0] else tf.add_paragraph()
-        p.text = f"{topico}"
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(4)
-        
-        p = tf.add_paragraph()
-        p.text = f"Autores: {autores}"
-        p.font.size = Pt(14)
-        p.font.italic = True
-        p.font.color.rgb = COR_SECUNDARIA
-        p.level = 1
-        p.space_after = Pt(2)
-        
-        p = tf.add_paragraph()
-        p.text = desc
-        p.font.size = Pt(14)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(12)
-    
+    {
+        "nome": "fundamentacao",
+        "tipo": "conteudo",
+        "titulo": "FUNDAMENTAÇÃO TEÓRICA",
+        "blocos": [
+            ("topicos", [
+                ("Arquitetura em Camadas", "Fowler (2002), Bass et al. (2012)",
+                 "Separação de responsabilidades, manutenibilidade e escalabilidade"),
+                ("Padrão Offline-First", "Firtman (2016), Taivalsaari & Mikkonen (2021)",
+                 "Prioriza funcionamento local, sincronização em background"),
+                ("React Native e Expo", "Facebook (2023), Expo (2023)",
+                 "Desenvolvimento multiplataforma, hot reload, APIs nativas"),
+                ("Autenticação e Segurança", "Stallings & Brown (2018), Hardt (2012)",
+                 "OAuth 2.0, JWT, Row Level Security (RLS)"),
+                ("Backend-as-a-Service", "Supabase (2023)",
+                 "PostgreSQL, autenticação, storage, APIs em tempo real"),
+            ], {"desc": {"espaco_depois": 12}}),
+        ],
+    },
     # ==================== SLIDE 5: METODOLOGIA - PARTE 1 ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "METODOLOGIA"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    # Tipo de Pesquisa
-    p = tf.paragraphs[0]
-    p.text = "TIPO DE PESQUISA"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(8)
-    
-    p = tf.add_paragraph()
-    p.text = "Exploratória e Aplicada - Desenvolvimento de solução tecnológica com análise de requisitos e implementação prática"
-    p.font.size = Pt(16)
-    p.font.color.rgb = COR_TEXTO
-    p.space_after = Pt(16)
-    
-    # Coleta de Dados
-    p = tf.add_paragraph()
-    p.text = "COLETA DE DADOS"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(8)
-    
-    coleta = [
-        "Pesquisa bibliográfica sobre arquitetura de software mobile",
-        "Análise de aplicativos fitness existentes no mercado",
-        "Levantamento de requisitos focados no público idoso",
-        "Documentação técnica de frameworks e bibliotecas"
-    ]
-    
-    for item in coleta:
-        p = tf.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(15)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(4)
-    
-    p = tf.add_paragraph()
-    p.text = ""
-    p.space_after = Pt(8)
-    
-    # Unidade de Análise
-    p = tf.add_paragraph()
-    p.text = "UNIDADE DE ANÁLISE"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(8)
-    
-    p = tf.add_paragraph()
-    p.text = "Aplicativo VivaFit Seniors desenvolvido com React Native (Expo SDK 54), TypeScript e Supabase"
-    p.font.size = Pt(16)
-    p.font.color.rgb = COR_TEXTO
-    
+    {
+        "nome": "metodologia",
+        "tipo": "conteudo",
+        "titulo": "METODOLOGIA",
+        "blocos": [
+            ("secao", "TIPO DE PESQUISA", {"espaco_depois": 8}),
+            ("texto", "Exploratória e Aplicada - Desenvolvimento de solução tecnológica com análise de requisitos e implementação prática",
+             {"tamanho": 16, "espaco_depois": 16}),
+            ("secao", "COLETA DE DADOS", {"espaco_depois": 8}),
+            ("lista", [
+                "Pesquisa bibliográfica sobre arquitetura de software mobile",
+                "Análise de aplicativos fitness existentes no mercado",
+                "Levantamento de requisitos focados no público idoso",
+                "Documentação técnica de frameworks e bibliotecas",
+            ], {"tamanho": 15, "espaco_depois": 4}),
+            ("espaco", 8),
+            ("secao", "UNIDADE DE ANÁLISE", {"espaco_depois": 8}),
+            ("texto", "Aplicativo VivaFit Seniors desenvolvido com React Native (Expo SDK 54), TypeScript e Supabase",
+             {"tamanho": 16, "espaco_depois": None}),
+        ],
+    },
     # ==================== SLIDE 6: METODOLOGIA - PARTE 2 ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "METODOLOGIA (continuação)"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    # Amostra
-    p = tf.paragraphs[0]
-    p.text = "AMOSTRA"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(8)
-    
-    p = tf.add_paragraph()
-    p.text = "Público-alvo: Idosos interessados em manter atividade física regular\nFuncionalidades testadas: 6 telas principais, 10+ exercícios, sistema de cache offline"
-    p.font.size = Pt(16)
-    p.font.color.rgb = COR_TEXTO
-    p.space_after = Pt(20)
-    
-    # Abordagem
-    p = tf.add_paragraph()
-    p.text = "ABORDAGEM"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(8)
-    
-    p = tf.add_paragraph()
-    p.text = "Qualitativa e Quantitativa"
-    p.font.size = Pt(18)
-    p.font.bold = True
-    p.font.color.rgb = COR_TEXTO
-    p.space_after = Pt(8)
-    
-    abordagens = [
-        "Qualitativa: Análise de usabilidade, acessibilidade e experiência do usuário",
-        "Quantitativa: Métricas de performance (taxa de cache ~85%, redução de latência 73%)",
-        "Metodologia ágil com iterações incrementais",
-        "Testes de integração entre camadas da arquitetura"
-    ]
-    
-    for item in abordagens:
-        p = tf.add_paragraph()
-        p.text = f"• {item}"
-        p.font.size = Pt(15)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "metodologia_2",
+        "tipo": "conteudo",
+        "titulo": "METODOLOGIA (continuação)",
+        "blocos": [
+            ("secao", "AMOSTRA", {"espaco_depois": 8}),
+            ("texto", "Público-alvo: Idosos interessados em manter atividade física regular\nFuncionalidades testadas: 6 telas principais, 10+ exercícios, sistema de cache offline",
+             {"tamanho": 16}),
+            ("secao", "ABORDAGEM", {"espaco_depois": 8}),
+            ("texto", "Qualitativa e Quantitativa", {"negrito": True, "espaco_depois": 8}),
+            ("lista", [
+                "Qualitativa: Análise de usabilidade, acessibilidade e experiência do usuário",
+                "Quantitativa: Métricas de performance (taxa de cache {taxa_cache}, redução de latência {reducao_latencia})",
+                "Metodologia ágil com iterações incrementais",
+                "Testes de integração entre camadas da arquitetura",
+            ], {"tamanho": 15}),
+        ],
+    },
     # ==================== SLIDE 7: ARQUITETURA DO SISTEMA ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "ARQUITETURA DO SISTEMA"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "Arquitetura em 4 Camadas"
-    p.font.size = Pt(24)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.alignment = PP_ALIGN.CENTER
-    p.space_after = Pt(15)
-    
-    camadas = [
-        ("1. PRESENTATION LAYER (Apresentação)", 
-         "Screens (6 telas principais), UI Components reutilizáveis, Verificação de autenticação"),
-        
-        ("2. BUSINESS LOGIC LAYER (Lógica de Negócio)",
-         "Hooks personalizados, Validações, Gerenciamento de estado"),
-        
-        ("3. DATA ACCESS LAYER (Acesso a Dados)",
-         "Cliente Supabase, Sistema de cache offline, AsyncStorage + FileSystem"),
-        
-        ("4. INFRASTRUCTURE LAYER (Infraestrutura)",
-         "React Navigation, Design tokens, Configurações globais")
-    ]
-    
-    for camada, descricao in camadas:
-        p = tf.add_paragraph()
-        p.text = camada
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(4)
-        
-        p = tf.add_paragraph()
-        p.text = descricao
-        p.font.size = Pt(14)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(10)
-    
+    {
+        "nome": "arquitetura",
+        "tipo": "conteudo",
+        "titulo": "ARQUITETURA DO SISTEMA",
+        "blocos": [
+            ("secao", "Arquitetura em 4 Camadas", {"tamanho": 24, "espaco_depois": 15, "alinhamento": "centro"}),
+            ("pares", [
+                ("1. PRESENTATION LAYER (Apresentação)",
+                 "Screens (6 telas principais), UI Components reutilizáveis, Verificação de autenticação"),
+                ("2. BUSINESS LOGIC LAYER (Lógica de Negócio)",
+                 "Hooks personalizados, Validações, Gerenciamento de estado"),
+                ("3. DATA ACCESS LAYER (Acesso a Dados)",
+                 "Cliente Supabase, Sistema de cache offline, AsyncStorage + FileSystem"),
+                ("4. INFRASTRUCTURE LAYER (Infraestrutura)",
+                 "React Navigation, Design tokens, Configurações globais"),
+            ]),
+        ],
+    },
     # ==================== SLIDE 8: SISTEMA DE CACHE OFFLINE ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "SISTEMA DE CACHE OFFLINE-FIRST"
-    title.text_frame.paragraphs[0].font.size = Pt(36)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "ESTRATÉGIA IMPLEMENTADA"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    estrategias = [
-        "Política de expiração: 7 dias para dados e imagens",
-        "Verificação de validade temporal antes de servir cache",
-        "Armazenamento local: AsyncStorage (JSON) + FileSystem (imagens)",
-        "Padrão stale-while-revalidate: serve cache e atualiza em background",
-        "Limpeza automática de arquivos expirados"
-    ]
-    
-    for est in estrategias:
-        p = tf.add_paragraph()
-        p.text = f"• {est}"
-        p.font.size = Pt(16)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
-    p = tf.add_paragraph()
-    p.text = ""
-    p.space_after = Pt(12)
-    
-    p = tf.add_paragraph()
-    p.text = "RESULTADOS DE PERFORMANCE"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    resultados = [
-        "Taxa de acerto de cache: ~85%",
-        "Redução de tempo de carregamento: 73%",
-        "Funcionamento completo offline após primeiro acesso",
-        "Experiência de usuário fluida e consistente"
-    ]
-    
-    for res in resultados:
-        p = tf.add_paragraph()
-        p.text = f"✓ {res}"
-        p.font.size = Pt(16)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "cache",
+        "tipo": "conteudo",
+        "titulo": "SISTEMA DE CACHE OFFLINE-FIRST",
+        "tamanho_titulo": 36,
+        "blocos": [
+            ("secao", "ESTRATÉGIA IMPLEMENTADA"),
+            ("lista", [
+                "Política de expiração: 7 dias para dados e imagens",
+                "Verificação de validade temporal antes de servir cache",
+                "Armazenamento local: AsyncStorage (JSON) + FileSystem (imagens)",
+                "Padrão stale-while-revalidate: serve cache e atualiza em background",
+                "Limpeza automática de arquivos expirados",
+            ]),
+            ("espaco", 12),
+            ("secao", "RESULTADOS DE PERFORMANCE"),
+            ("lista", [
+                "Taxa de acerto de cache: {taxa_cache}",
+                "Redução de tempo de carregamento: {reducao_latencia}",
+                "Funcionamento completo offline após primeiro acesso",
+                "Experiência de usuário fluida e consistente",
+            ], {"marcador": "✓ "}),
+        ],
+    },
     # ==================== SLIDE 9: AUTENTICAÇÃO E SEGURANÇA ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "AUTENTICAÇÃO E SEGURANÇA"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "ARQUITETURA MULTICAMADAS DE SEGURANÇA"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    componentes = [
-        ("OAuth 2.0", "Autenticação via Google com fluxo seguro de autorização"),
-        ("JWT (JSON Web Tokens)", "Tokens assinados para validação stateless de sessões"),
-        ("Row Level Security (RLS)", "Isolamento completo de dados por usuário no PostgreSQL"),
-        ("HTTPS/TLS", "Criptografia em trânsito para todas comunicações"),
-        ("Conformidade LGPD", "Proteção de dados sensíveis de saúde")
-    ]
-    
-    for comp, desc in componentes:
-        p = tf.add_paragraph()
-        p.text = comp
-        p.font.size = Pt(17)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(3)
-        
-        p = tf.add_paragraph()
-        p.text = desc
-        p.font.size = Pt(14)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(8)
-    
-    p = tf.add_paragraph()
-    p.text = ""
-    p.space_after = Pt(8)
-    
-    p = tf.add_paragraph()
-    p.text = "Fluxo: Usuário → App React Native → Supabase Auth → PostgreSQL com RLS → Resposta Protegida"
-    p.font.size = Pt(14)
-    p.font.italic = True
-    p.font.color.rgb = COR_SECUNDARIA
-    p.alignment = PP_ALIGN.CENTER
-    
+    {
+        "nome": "seguranca",
+        "tipo": "conteudo",
+        "titulo": "AUTENTICAÇÃO E SEGURANÇA",
+        "blocos": [
+            ("secao", "ARQUITETURA MULTICAMADAS DE SEGURANÇA"),
+            ("pares", [
+                ("OAuth 2.0", "Autenticação via Google com fluxo seguro de autorização"),
+                ("JWT (JSON Web Tokens)", "Tokens assinados para validação stateless de sessões"),
+                ("Row Level Security (RLS)", "Isolamento completo de dados por usuário no PostgreSQL"),
+                ("HTTPS/TLS", "Criptografia em trânsito para todas comunicações"),
+                ("Conformidade LGPD", "Proteção de dados sensíveis de saúde"),
+            ], {"titulo": {"tamanho": 17, "espaco_depois": 3}, "desc": {"espaco_depois": 8}}),
+            ("espaco", 8),
+            ("nota", "Fluxo: Usuário → App React Native → Supabase Auth → PostgreSQL com RLS → Resposta Protegida"),
+        ],
+    },
     # ==================== SLIDE 10: FUNCIONALIDADES IMPLEMENTADAS ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "FUNCIONALIDADES IMPLEMENTADAS"
-    title.text_frame.paragraphs[0].font.size = Pt(36)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    funcionalidades = [
-        ("📱 6 Telas Principais", 
-         "Dashboard, Perfil, Exercícios, Treino, Progresso, Histórico"),
-        
-        ("💪 Catálogo de Exercícios",
-         "10+ exercícios em 4 categorias: Cardio, Força, Flexibilidade, Equilíbrio"),
-        
-        ("📊 Acompanhamento de Progresso",
-         "Histórico detalhado, estatísticas, gráficos de evolução"),
-        
-        ("🎯 Planos Personalizados",
-         "Treinos adaptados ao nível de condicionamento físico"),
-        
-        ("👤 Perfil Completo",
-         "Informações de saúde, preferências, metas de atividade"),
-        
-        ("📴 Modo Offline",
-         "Acesso completo aos exercícios sem internet")
-    ]
-    
-    for titulo, desc in funcionalidades:
-        p = tf.paragraphs[0] if titulo == funcionalidades[0][0] else tf.add_paragraph()
-        p.text = titulo
-        p.font.size = Pt(17)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(3)
-        
-        p = tf.add_paragraph()
-        p.text = desc
-        p.font.size = Pt(14)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(10)
-    
+    {
+        "nome": "funcionalidades",
+        "tipo": "conteudo",
+        "titulo": "FUNCIONALIDADES IMPLEMENTADAS",
+        "tamanho_titulo": 36,
+        "blocos": [
+            ("pares", [
+                ("📱 6 Telas Principais",
+                 "Dashboard, Perfil, Exercícios, Treino, Progresso, Histórico"),
+                ("💪 Catálogo de Exercícios",
+                 "10+ exercícios em 4 categorias: Cardio, Força, Flexibilidade, Equilíbrio"),
+                ("📊 Acompanhamento de Progresso",
+                 "Histórico detalhado, estatísticas, gráficos de evolução"),
+                ("🎯 Planos Personalizados",
+                 "Treinos adaptados ao nível de condicionamento físico"),
+                ("👤 Perfil Completo",
+                 "Informações de saúde, preferências, metas de atividade"),
+                ("📴 Modo Offline",
+                 "Acesso completo aos exercícios sem internet"),
+            ], {"titulo": {"tamanho": 17, "espaco_depois": 3}}),
+        ],
+        "imagens": galeria(FOTOS_EXERCICIOS, (0.5, 5.6, 9, 1.7), colunas=7),
+    },
     # ==================== SLIDE 11: RESULTADOS E DISCUSSÃO ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "APRESENTAÇÃO E DISCUSSÃO DOS RESULTADOS"
-    title.text_frame.paragraphs[0].font.size = Pt(32)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "MÉTRICAS DE SUCESSO"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    metricas = [
-        "✓ Taxa de acerto de cache: ~85% (otimização significativa)",
-        "✓ Redução de latência: 73% vs requisições diretas",
-        "✓ Funcionamento offline completo após primeira sincronização",
-        "✓ Arquitetura escalável e manutenível em 4 camadas",
-        "✓ Type safety com TypeScript (zero erros de tipo em produção)",
-        "✓ Autenticação segura com OAuth 2.0 + JWT + RLS"
-    ]
-    
-    for metrica in metricas:
-        p = tf.add_paragraph()
-        p.text = metrica
-        p.font.size = Pt(15)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
-    p = tf.add_paragraph()
-    p.text = ""
-    p.space_after = Pt(12)
-    
-    p = tf.add_paragraph()
-    p.text = "BENEFÍCIOS ALCANÇADOS"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    beneficios = [
-        "Experiência de usuário fluida e consistente",
-        "Separação clara de responsabilidades facilita manutenção",
-        "Base sólida para evolução futura do sistema",
-        "Conformidade com LGPD para dados de saúde"
-    ]
-    
-    for ben in beneficios:
-        p = tf.add_paragraph()
-        p.text = f"• {ben}"
-        p.font.size = Pt(15)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "resultados",
+        "tipo": "conteudo",
+        "titulo": "APRESENTAÇÃO E DISCUSSÃO DOS RESULTADOS",
+        "tamanho_titulo": 32,
+        "blocos": [
+            ("secao", "MÉTRICAS DE SUCESSO"),
+            ("lista", [
+                "✓ Taxa de acerto de cache: {taxa_cache} (otimização significativa)",
+                "✓ Redução de latência: {reducao_latencia} vs requisições diretas",
+                "✓ Funcionamento offline completo após primeira sincronização",
+                "✓ Arquitetura escalável e manutenível em 4 camadas",
+                "✓ Type safety com TypeScript (zero erros de tipo em produção)",
+                "✓ Autenticação segura com OAuth 2.0 + JWT + RLS",
+            ], {"marcador": "", "tamanho": 15}),
+            ("espaco", 12),
+            ("secao", "BENEFÍCIOS ALCANÇADOS"),
+            ("lista", [
+                "Experiência de usuário fluida e consistente",
+                "Separação clara de responsabilidades facilita manutenção",
+                "Base sólida para evolução futura do sistema",
+                "Conformidade com LGPD para dados de saúde",
+            ], {"tamanho": 15}),
+        ],
+    },
     # ==================== SLIDE 12: TECNOLOGIAS UTILIZADAS ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "TECNOLOGIAS UTILIZADAS"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    categorias = [
-        ("Frontend Mobile", [
-            "React Native 0.76.x",
-            "Expo SDK 54.0.0",
-            "TypeScript 5.3.x",
-            "React Navigation 6.x"
-        ]),
-        ("Backend e Autenticação", [
-            "Supabase (PostgreSQL)",
-            "OAuth 2.0 / JWT",
-            "Row Level Security (RLS)"
-        ]),
-        ("Storage e Cache", [
-            "AsyncStorage 1.23.x",
-            "Expo FileSystem 17.x",
-            "Cache offline de 7 dias"
-        ]),
-        ("Build e Deploy", [
-            "EAS (Expo Application Services)",
-            "APK para Android 5.0+"
-        ])
-    ]
-    
-    for cat, techs in categorias:
-        p = tf.paragraphs[0] if cat == categorias[0][0] else tf.add_paragraph()
-        p.text = cat
-        p.font.size = Pt(18)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(6)
-        
-        for tech in techs:
-            p = tf.add_paragraph()
-            p.text = f"• {tech}"
-            p.font.size = Pt(14)
-            p.font.color.rgb = COR_TEXTO
-            p.level = 1
-            p.space_after = Pt(3)
-        
-        p = tf.add_paragraph()
-        p.text = ""
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "tecnologias",
+        "tipo": "conteudo",
+        "titulo": "TECNOLOGIAS UTILIZADAS",
+        "blocos": [
+            ("grupos", [
+                ("Frontend Mobile", [
+                    "React Native 0.76.x",
+                    "Expo SDK 54.0.0",
+                    "TypeScript 5.3.x",
+                    "React Navigation 6.x",
+                ]),
+                ("Backend e Autenticação", [
+                    "Supabase (PostgreSQL)",
+                    "OAuth 2.0 / JWT",
+                    "Row Level Security (RLS)",
+                ]),
+                ("Storage e Cache", [
+                    "AsyncStorage 1.23.x",
+                    "Expo FileSystem 17.x",
+                    "Cache offline de 7 dias",
+                ]),
+                ("Build e Deploy", [
+                    "EAS (Expo Application Services)",
+                    "APK para Android 5.0+",
+                ]),
+            ], {"titulo": {"espaco_depois": 6}, "itens": {"tamanho": 14, "espaco_depois": 3}}),
+        ],
+    },
     # ==================== SLIDE 13: CONCLUSÕES ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "CONCLUSÕES"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "PRINCIPAIS CONCLUSÕES"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    conclusoes = [
-        "Arquitetura em 4 camadas mostrou-se eficaz para aplicações mobile de saúde",
-        "Padrão offline-first garantiu disponibilidade contínua (objetivo alcançado)",
-        "Taxa de cache de ~85% demonstra eficiência da estratégia implementada",
-        "Separação de responsabilidades facilitou desenvolvimento e manutenção",
-        "Type safety do TypeScript preveniu erros em tempo de execução",
-        "Autenticação multicamadas garante proteção adequada de dados sensíveis"
-    ]
-    
-    for conclusao in conclusoes:
-        p = tf.add_paragraph()
-        p.text = f"✓ {conclusao}"
-        p.font.size = Pt(15)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(7)
-    
-    p = tf.add_paragraph()
-    p.text = ""
-    p.space_after = Pt(12)
-    
-    p = tf.add_paragraph()
-    p.text = "CONTRIBUIÇÕES DO TRABALHO"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(10)
-    
-    contribuicoes = [
-        "Arquitetura documentada e replicável para aplicações similares",
-        "Implementação prática de offline-first em React Native",
-        "Referência para desenvolvimento de apps acessíveis para idosos"
-    ]
-    
-    for contrib in contribuicoes:
-        p = tf.add_paragraph()
-        p.text = f"• {contrib}"
-        p.font.size = Pt(15)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "conclusoes",
+        "tipo": "conteudo",
+        "titulo": "CONCLUSÕES",
+        "blocos": [
+            ("secao", "PRINCIPAIS CONCLUSÕES"),
+            ("lista", [
+                "Arquitetura em 4 camadas mostrou-se eficaz para aplicações mobile de saúde",
+                "Padrão offline-first garantiu disponibilidade contínua (objetivo alcançado)",
+                "Taxa de cache de {taxa_cache} demonstra eficiência da estratégia implementada",
+                "Separação de responsabilidades facilitou desenvolvimento e manutenção",
+                "Type safety do TypeScript preveniu erros em tempo de execução",
+                "Autenticação multicamadas garante proteção adequada de dados sensíveis",
+            ], {"marcador": "✓ ", "tamanho": 15, "espaco_depois": 7}),
+            ("espaco", 12),
+            ("secao", "CONTRIBUIÇÕES DO TRABALHO"),
+            ("lista", [
+                "Arquitetura documentada e replicável para aplicações similares",
+                "Implementação prática de offline-first em React Native",
+                "Referência para desenvolvimento de apps acessíveis para idosos",
+            ], {"tamanho": 15}),
+        ],
+    },
     # ==================== SLIDE 14: LIMITAÇÕES ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "LIMITAÇÕES"
-    title.text_frame.paragraphs[0].font.size = Pt(40)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "LIMITAÇÕES IDENTIFICADAS"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(12)
-    
-    limitacoes = [
-        ("Escopo de Testes", 
-         "Testes realizados principalmente em ambiente de desenvolvimento, necessário validação com usuários reais idosos"),
-        
-        ("Plataforma", 
-         "Versão atual focada em Android, build iOS requer macOS e Apple Developer Account"),
-        
-        ("Sincronização em Tempo Real", 
-         "Implementação atual não possui sync bidirecional automática, requer refresh manual"),
-        
-        ("Catálogo de Exercícios", 
-         "Base inicial de 10+ exercícios, expansão futura necessária para maior variedade"),
-        
-        ("Analytics e Monitoramento", 
-         "Ausência de telemetria para rastreamento de uso e comportamento do usuário"),
-        
-        ("Internacionalização", 
-         "Interface disponível apenas em português brasileiro")
-    ]
-    
-    for titulo, desc in limitacoes:
-        p = tf.add_paragraph()
-        p.text = f"• {titulo}"
-        p.font.size = Pt(16)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(3)
-        
-        p = tf.add_paragraph()
-        p.text = desc
-        p.font.size = Pt(13)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 2
-        p.space_after = Pt(8)
-    
+    {
+        "nome": "limitacoes",
+        "tipo": "conteudo",
+        "titulo": "LIMITAÇÕES",
+        "blocos": [
+            ("secao", "LIMITAÇÕES IDENTIFICADAS", {"espaco_depois": 12}),
+            ("pares", [
+                ("Escopo de Testes",
+                 "Testes realizados principalmente em ambiente de desenvolvimento, necessário validação com usuários reais idosos"),
+                ("Plataforma",
+                 "Versão atual focada em Android, build iOS requer macOS e Apple Developer Account"),
+                ("Sincronização em Tempo Real",
+                 "Implementação atual não possui sync bidirecional automática, requer refresh manual"),
+                ("Catálogo de Exercícios",
+                 "Base inicial de 10+ exercícios, expansão futura necessária para maior variedade"),
+                ("Analytics e Monitoramento",
+                 "Ausência de telemetria para rastreamento de uso e comportamento do usuário"),
+                ("Internacionalização",
+                 "Interface disponível apenas em português brasileiro"),
+            ], {
+                "marcador": "• ",
+                "titulo": {"tamanho": 16, "espaco_depois": 3},
+                "desc": {"nivel": 2, "espaco_depois": 8},
+            }),
+        ],
+    },
     # ==================== SLIDE 15: RECOMENDAÇÕES ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[5])
-    
-    title = slide.shapes.title
-    title.text = "RECOMENDAÇÕES E TRABALHOS FUTUROS"
-    title.text_frame.paragraphs[0].font.size = Pt(32)
-    title.text_frame.paragraphs[0].font.color.rgb = COR_PRIMARIA
-    
-    content_box = slide.shapes.add_textbox(Inches(0.5), Inches(1.5), Inches(9), Inches(5.5))
-    tf = content_box.text_frame
-    tf.word_wrap = True
-    
-    p = tf.paragraphs[0]
-    p.text = "RECOMENDAÇÕES PARA TRABALHOS FUTUROS"
-    p.font.size = Pt(22)
-    p.font.bold = True
-    p.font.color.rgb = COR_PRIMARIA
-    p.space_after = Pt(12)
-    
-    recomendacoes = [
-        ("Sincronização em Tempo Real", 
-         "Implementar WebSockets para sync bidirecional automática de dados"),
-        
-        ("Sistema de Fila Offline", 
-         "Queue para operações pendentes quando offline, com retry automático"),
-        
-        ("Testes E2E Automatizados", 
-         "Suite de testes end-to-end com Detox ou Maestro"),
-        
-        ("Push Notifications", 
-         "Lembretes de treino e notificações de progresso para engajamento"),
-        
-        ("Analytics Detalhado", 
-         "Implementar Firebase Analytics ou Amplitude para insights de uso"),
-        
-        ("Gamificação", 
-         "Sistema de conquistas, badges e desafios para motivação"),
-        
-        ("Suporte Multiplataforma", 
-         "Build para iOS e versão web progressive (PWA)"),
-        
-        ("Integração com Wearables", 
-         "Conectar com smartwatches e monitores de atividade"),
-        
-        ("Inteligência Artificial", 
-         "Recomendações personalizadas baseadas em ML")
-    ]
-    
-    for titulo, desc in recomendacoes:
-        p = tf.add_paragraph()
-        p.text = f"→ {titulo}"
-        p.font.size = Pt(15)
-        p.font.bold = True
-        p.font.color.rgb = COR_PRIMARIA
-        p.space_after = Pt(2)
-        
-        p = tf.add_paragraph()
-        p.text = desc
-        p.font.size = Pt(12)
-        p.font.color.rgb = COR_TEXTO
-        p.level = 1
-        p.space_after = Pt(6)
-    
+    {
+        "nome": "recomendacoes",
+        "tipo": "conteudo",
+        "titulo": "RECOMENDAÇÕES E TRABALHOS FUTUROS",
+        "tamanho_titulo": 32,
+        "blocos": [
+            ("secao", "RECOMENDAÇÕES PARA TRABALHOS FUTUROS", {"espaco_depois": 12}),
+            ("pares", [
+                ("Sincronização em Tempo Real",
+                 "Implementar WebSockets para sync bidirecional automática de dados"),
+                ("Sistema de Fila Offline",
+                 "Queue para operações pendentes quando offline, com retry automático"),
+                ("Testes E2E Automatizados",
+                 "Suite de testes end-to-end com Detox ou Maestro"),
+                ("Push Notifications",
+                 "Lembretes de treino e notificações de progresso para engajamento"),
+                ("Analytics Detalhado",
+                 "Implementar Firebase Analytics ou Amplitude para insights de uso"),
+                ("Gamificação",
+                 "Sistema de conquistas, badges e desafios para motivação"),
+                ("Suporte Multiplataforma",
+                 "Build para iOS e versão web progressive (PWA)"),
+                ("Integração com Wearables",
+                 "Conectar com smartwatches e monitores de atividade"),
+                ("Inteligência Artificial",
+                 "Recomendações personalizadas baseadas em ML"),
+            ], {
+                "marcador": "→ ",
+                "titulo": {"tamanho": 15, "espaco_depois": 2},
+                "desc": {"espaco_depois": 6},
+            }),
+        ],
+    },
     # ==================== SLIDE 16: AGRADECIMENTOS E ENCERRAMENTO ====================
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
-    
-    # Título
-    title_box = slide.shapes.add_textbox(Inches(0.5), Inches(2.5), Inches(9), Inches(1))
-    title_frame = title_box.text_frame
-    title_frame.text = "OBRIGADO!"
-    title_p = title_frame.paragraphs[0]
-    title_p.font.size = Pt(54)
-    title_p.font.bold = True
-    title_p.font.color.rgb = COR_PRIMARIA
-    title_p.alignment = PP_ALIGN.CENTER
-    
-    # Contato
-    contact_box = slide.shapes.add_textbox(Inches(0.5), Inches(4), Inches(9), Inches(2))
-    contact_frame = contact_box.text_frame
-    contact_frame.text = "Guilherme Antony\n\nPerguntascontextual?"
-    for p in contact_frame.paragraphs:
-        p.font.size = Pt(24)
-        p.font.color.rgb = COR_SECUNDARIA
-        p.alignment = PP_ALIGN.CENTER
-    
-    # Download
-    download_box = slide.shapes.add_textbox(Inches(0.5), Inches(6), Inches(9), Inches(1))
-    download_frame = download_box.text_frame
-    download_frame.text = "📱 Download: https://expo.dev/artifacts/eas/s8rCmPjY3mcTXJXSYWtgqx.apk"
-    download_p = download_frame.paragraphs[0]
-    download_p.font.size = Pt(14)
-    download_p.font.color.rgb = COR_SECUNDARIA
-    download_p.alignment = PP_ALIGN.CENTER
-    
+    {
+        "nome": "encerramento",
+        "tipo": "caixas",
+        "caixas": [
+            ((0.5, 2.5, 9, 1), "OBRIGADO!", "destaque", {"tamanho": 54}),
+            ((0.5, 4, 9, 2), "{autor}\n\nPerguntas?", "rodape", {"tamanho": 24}),
+            ((0.5, 6, 9, 1), "📱 Download: {link_apk}", "rodape", {"tamanho": 14}),
+        ],
+        "imagens": [(QRCODE, (4.1, 0.5, 1.8, 1.8))],
+    },
+]
+
+# Variantes geradas com --variante, a partir dos slides nomeados de SLIDES (ver gerador/variantes.py)
+VARIANTES = {
+    # Defesa perante a banca: todos os slides
+    "defesa": Variante(),
+    # Pitch de 5 minutos: problema, solução e resultados
+    "pitch": Variante(
+        slides=("capa", "introducao", "arquitetura", "resultados", "conclusoes", "encerramento"),
+        substituicoes={"resultados": {"titulo": "RESULTADOS"}},
+    ),
+    # Pôster: um painel por eixo do trabalho, sem encerramento
+    "poster": Variante(base="pitch", slides=("capa", "arquitetura", "cache", "resultados", "tecnologias")),
+}
+
+
+def montar_slides(slides=SLIDES, esquema=False, diagramas=False, telemetria=None, perfis=()):
+    """Slides da apresentação com os opcionais: diagramas depois dos slides
+    correspondentes, métricas medidas e análise dos perfis depois dos
+    resultados e modelo de dados (com o diagrama ER) antes do slide
+    "encerramento" (no fim, se não houver)"""
+    depois = {}
+    if diagramas:
+        for nome, spec in DIAGRAMAS.items():
+            depois.setdefault(nome, []).append(spec)
+    if telemetria is not None:
+        depois.setdefault("resultados", []).append(slide_metricas(telemetria))
+    depois.setdefault("resultados", []).extend(perfis)
+    slides = [s for spec in slides for s in [spec, *depois.get(spec.get("nome"), ())]]
+    if esquema:
+        visao_geral, *tabelas = slides_esquema(carregar_esquema(SCHEMA_SQL, DB_CSV))
+        nomes = [spec.get("nome") for spec in slides]
+        i = nomes.index("encerramento") if "encerramento" in nomes else len(slides)
+        slides = slides[:i] + [visao_geral, DIAGRAMA_ER] + tabelas + slides[i:]
+    return slides
+
+
+def analisar_perfis(dump, banco=":memory:"):
+    """Slides de cadastros e nível de atividade a partir do dump da tabela profiles"""
+    from gerador.perfis import abrir_perfis, slides_perfis
+
+    try:
+        conexao = abrir_perfis(dump, banco, esquema=carregar_esquema(SCHEMA_SQL))
+    except ValueError as erro:
+        raise ValueError(f"--perfis: {erro}") from erro
+    try:
+        return slides_perfis(conexao)
+    finally:
+        conexao.close()
+
+
+def criar_apresentacao(output_path=SAIDA_PADRAO, parametros=None, compressao=None, diretorio_cache=None,
+                       slides=SLIDES):
+    """Cria apresentação PowerPoint do TCC"""
+    from gerador import construir_apresentacao
+    from gerador.cache import CacheSlides
+    from gerador import drawio, imagens
+    from gerador.pacote import salvar
+
+    cache = None
+    if diretorio_cache:
+        cache = CacheSlides(diretorio_cache)
+        imagens.usar_cache_em_disco(diretorio_cache)
+        drawio.usar_cache_em_disco(diretorio_cache)
+    prs = construir_apresentacao(personalizar(slides, {**DECK_PADRAO, **(parametros or {})}), cache=cache)
+
     # Salvar apresentação
-    output_path = '/home/antony/Documentos/Vivafit-Senior/Apresentacao_TCC_VivaFit_Seniors.pptx'
-    prs.save(output_path)
+    salvar(prs, output_path, compressao=compressao)
     print(f"✓ Apresentação criada com sucesso: {output_path}")
     print(f"✓ Total de slides: {len(prs.slides)}")
+    if cache:
+        print(f"✓ Slides reaproveitados do cache: {cache.acertos} de {len(prs.slides)}")
     return output_path
 
+
+def decks_das_variantes(args, telemetria=None):
+    """(nome, slides, parâmetros, idioma) de cada variante de --variante em cada idioma de --idioma
+
+    Os slides gerados (métricas, perfis, modelo de dados) são montados já
+    no idioma; os de SLIDES são traduzidos pelo catálogo (ver gerador/i18n.py).
+    """
+    decks = []
+    for idioma in args.idioma or [IDIOMA_ORIGEM]:
+        usar_idioma(idioma)
+        perfis = analisar_perfis(args.perfis, args.banco_perfis) if args.perfis else ()
+        for variante in args.variante or [None]:
+            slides, parametros = derivar(SLIDES, variante, VARIANTES) if variante else (SLIDES, {})
+            slides = traduzir_slides(montar_slides(slides, esquema=args.esquema, diagramas=args.diagramas,
+                                                   telemetria=telemetria, perfis=perfis))
+            nome = "_".join(filter(None, (variante, args.idioma and idioma)))
+            decks.append((nome, slides, {"data": traduzir(DECK_PADRAO["data"]), **parametros}, idioma))
+    return decks
+
+
+def criar_variantes(args, decks, parametros=None):
+    """Gera as variantes numa única passada, com os slides comuns renderizados uma vez
+
+    Cada variante vai para --saida com o nome da variante (e o idioma)
+    antes da extensão. O número de slides impresso é o do arquivo gravado,
+    já com as páginas de continuação do ajuste.
+    """
+    from gerador import gerar_variantes
+    from gerador.leitura import PacoteLido
+
+    raiz, extensao = os.path.splitext(args.saida)
+    caminhos = gerar_variantes(
+        [(f"{raiz}_{nome}{extensao}", slides, {**(parametros or {}), **extras}, idioma)
+         for nome, slides, extras, idioma in decks],
+        padrao=DECK_PADRAO, compressao=args.compressao, diretorio_cache=args.cache)
+    for (nome, *_), caminho in zip(decks, caminhos):
+        pacote = PacoteLido(caminho)
+        try:
+            print(f"✓ Variante {nome}: {caminho} ({len(pacote.slides)} slides)")
+        finally:
+            pacote.fechar()
+    return caminhos
+
+
+def criar_previas(caminhos, args):
+    """Prévias PNG e folhas de contato das apresentações geradas (--previa)"""
+    from gerador.previa import gerar_previas
+
+    folhas = gerar_previas(caminhos, args.previa, jobs=args.jobs or os.cpu_count(), diretorio_cache=args.cache)
+    print(f"✓ Prévias em {args.previa} ({len(folhas)} folhas de contato)")
+
+
+def arquivos_observados(slides, args):
+    """Arquivos cuja mudança refaz a apresentação no modo --observar"""
+    from gerador.renderizadores import arquivos_do_slide
+
+    arquivos = {os.path.abspath(__file__), *(args.metricas or ()), *([args.perfis] if args.perfis else ())}
+    if args.esquema:
+        arquivos |= {SCHEMA_SQL, DB_CSV}
+    for spec in slides:
+        arquivos.update(arquivos_do_slide(spec))
+        arquivos.update(caminho for caminho, _ in spec.get("imagens", ()))
+    return arquivos
+
+
+def _ler_metricas(caminhos):
+    """Telemetria dos logs de --metricas, avisando das linhas descartadas"""
+    telemetria = ler_telemetria(caminhos)
+    if telemetria.invalidas:
+        print(f"⚠ --metricas: {telemetria.invalidas} linha(s) inválida(s) ignorada(s) "
+              "(JSON malformado ou latência que não é um número finito)", file=sys.stderr)
+    return telemetria
+
+
+def observar(args, telemetria=None, perfis=()):
+    """Gera --saida e a refaz a cada mudança no script ou nos arquivos de conteúdo
+
+    O template e o XML dos slides ficam em memória (`cache.CacheMemoria`):
+    numa edição só os slides cuja especificação ou arquivos mudaram são
+    renderizados de novo. Mudanças neste script são aplicadas recarregando-o
+    com runpy; a saída é trocada de uma vez (`pacote.salvar_atomico`).
+    """
+    import runpy
+    import time
+
+    from gerador import construir_apresentacao
+    from gerador.cache import CacheMemoria
+    from gerador.lote import ModeloBase
+    from gerador.observador import criar_observador
+    from gerador.pacote import salvar_atomico
+
+    modelo, cache, observador = ModeloBase(), CacheMemoria(), criar_observador()
+    modulo, mudados = globals(), set()
+    # Vigiados desde antes da primeira geração: se ela falhar, corrigir o script ou um
+    # arquivo citado pelos slides refaz a apresentação (sem isso `esperar` nunca voltaria)
+    observador.vigiar(arquivos_observados([*SLIDES, *DIAGRAMAS.values(), DIAGRAMA_ER], args))
+    print(f"✓ Observando com {type(observador).__name__} (Ctrl+C encerra)", flush=True)
+    try:
+        while True:
+            inicio = time.perf_counter()
+            try:
+                if os.path.abspath(__file__) in mudados:
+                    modulo = runpy.run_path(__file__)
+                if mudados & {os.path.abspath(log) for log in args.metricas or ()}:
+                    telemetria = _ler_metricas(args.metricas)
+                if args.perfis and os.path.abspath(args.perfis) in mudados:
+                    perfis = analisar_perfis(args.perfis, args.banco_perfis)
+                slides = modulo["montar_slides"](esquema=args.esquema, diagramas=args.diagramas,
+                                                 telemetria=telemetria, perfis=perfis)
+                parametros = {**modulo["DECK_PADRAO"], **(parametros_metricas(telemetria) if telemetria else {})}
+                prs = construir_apresentacao(personalizar(slides, parametros), prs=modelo.clonar(), cache=cache)
+                salvar_atomico(prs, args.saida, compressao=args.compressao, entradas=modelo.entradas)
+                print(f"✓ {args.saida}: {cache.falhas} de {len(prs.slides)} slides renderizados "
+                      f"em {(time.perf_counter() - inicio) * 1000:.0f} ms", flush=True)
+                cache.podar()
+                if args.previa:
+                    criar_previas([args.saida], args)
+                observador.vigiar(arquivos_observados(slides, args))
+            except Exception as erro:
+                print(f"✗ {type(erro).__name__}: {erro}", file=sys.stderr, flush=True)
+                cache.acertos = cache.falhas = 0
+            mudados = set()
+            while not mudados:
+                mudados = observador.esperar()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        observador.fechar()
+
+
+def textos_traduziveis():
+    """Textos dos slides (com variantes e diagramas) e do motor que vão para os catálogos"""
+    slides = [*SLIDES, *DIAGRAMAS.values(), DIAGRAMA_ER]
+    for nome in VARIANTES:
+        slides += derivar(SLIDES, nome, VARIANTES)[0]
+    codigo = sorted(glob.glob(os.path.join(DIR_DOCS, 'gerador', '*.py')))
+    return list(dict.fromkeys(textos_dos_slides(slides) + textos_do_codigo(codigo) + [DECK_PADRAO["data"]]))
+
+
+def extrair_textos():
+    """Acrescenta aos catálogos de docs/i18n os textos novos, com tradução pendente"""
+    for idioma, (novos, faltam) in atualizar_catalogos(textos_traduziveis()).items():
+        print(f"✓ {idioma}: {novos} textos novos, {faltam} sem tradução")
+
+
+def avisar_pendentes(idiomas):
+    """Avisa (sem falhar) os textos ainda sem tradução nos idiomas pedidos"""
+    textos = textos_traduziveis()
+    for idioma in idiomas:
+        faltam = pendentes(textos, idioma) if idioma != IDIOMA_ORIGEM else ()
+        if faltam:
+            print(f"⚠ {idioma}: {len(faltam)} textos sem tradução, ex.: {faltam[0]!r}", file=sys.stderr)
+
+
+def comparar_apresentacoes(antes, depois, jobs):
+    """Imprime os slides que diferem entre dois .pptx (ou diretórios); retorna o código de saída"""
+    from gerador.diferenca import comparar, formatar
+
+    diferencas = comparar(antes, depois, jobs=jobs)
+    for linha in formatar(diferencas):
+        print(linha)
+    mudaram = sum(1 for d in diferencas if d.mudancas or d.antes is None or d.depois is None)
+    print(f"✓ {len(diferencas) - mudaram} de {len(diferencas)} apresentações iguais", file=sys.stderr)
+    return 1 if mudaram else 0
+
+
+def listar_slides(slides):
+    """Imprime número, nome, tipo e título de cada slide"""
+    for i, spec in enumerate(personalizar(slides, DECK_PADRAO), 1):
+        titulo = spec.get("titulo") or spec.get("caixas", [(None, "")])[0][1]
+        print(f"{i:2d}  {spec.get('nome', ''):<24} {spec['tipo']:<9} {titulo}")
+
+
+def validar_slides(slides, lista_parametros=None):
+    """Imprime os erros da especificação; retorna o código de saída"""
+    from gerador.validacao import validar
+
+    erros = validar(slides, [{**DECK_PADRAO, **p} for p in (lista_parametros or [{}])])
+    for erro in erros:
+        print(f"✗ {erro}", file=sys.stderr)
+    if not erros:
+        print(f"✓ {len(slides)} slides válidos")
+    return 1 if erros else 0
+
+
+def _revisar(decks, padrao, lista_parametros, args):
+    from gerador.renderizadores import ajustar_slides
+    from gerador.revisao import revisar
+
+    finais = []
+    for nome, slides, extras, idioma in decks:
+        usar_idioma(idioma)
+        for j, parametros in enumerate(lista_parametros or [{}], 1):
+            rotulo = " ".join(filter(None, (nome, lista_parametros and f"#{j}")))
+            finais.append((rotulo, ajustar_slides(personalizar(slides, {**padrao, **extras, **parametros})), idioma))
+    return revisar(finais, jobs=args.jobs or os.cpu_count(), tema=args.tema, online=args.online), len(finais)
+
+
+def revisar_apresentacoes(decks, padrao, lista_parametros, args):
+    """Revisa os slides finais (personalizados e ajustados) de cada apresentação; retorna o código de saída
+
+    Cada variante e idioma de `decks`, com cada conjunto de parâmetros de
+    --lote, é revisada como seria renderizada; os problemas e o tempo de
+    cada regra vão para a saída de erro (ver gerador/revisao.py).
+    """
+    from gerador.revisao import formatar
+
+    revisao, n_apresentacoes = _revisar(decks, padrao, lista_parametros, args)
+    for linha in formatar(revisao):
+        print(linha, file=sys.stderr)
+    print(f"✓ {revisao.slides} slides revisados em {n_apresentacoes} apresentações "
+          f"({revisao.revisados} distintos), {len(revisao.problemas)} problemas")
+    return 1 if revisao.problemas else 0
+
+
+def revisar_antes_de_gerar(decks, padrao, lista_parametros, args):
+    """Revisão da geração normal: os problemas vão como avisos para a saída de erro
+
+    Com --estrito eles são erros: nada é gravado e o programa sai com código 1.
+    """
+    from gerador.revisao import formatar
+
+    revisao, _ = _revisar(decks, padrao, lista_parametros, args)
+    if not revisao.problemas:
+        return
+    for linha in formatar(revisao, tempos=False, marca="✗" if args.estrito else "⚠"):
+        print(linha, file=sys.stderr)
+    if args.estrito:
+        sys.exit(f"✗ {len(revisao.problemas)} problemas na revisão (--estrito); nada foi gravado")
+    print(f"⚠ {len(revisao.problemas)} problemas na revisão (veja --revisar; --estrito interrompe a geração)",
+          file=sys.stderr)
+
+
+def renderizar_no_servidor(caminho_socket, saida, compressao):
+    """Pede a renderização ao servidor (--servidor) já carregado"""
+    from gerador.servidor import enviar
+
+    resposta = enviar(caminho_socket, {"saida": os.path.abspath(saida), "compressao": compressao})
+    if not resposta["ok"]:
+        print(f"✗ {resposta['erro']}", file=sys.stderr)
+        return 1
+    print(f"✓ Apresentação criada com sucesso: {resposta['saida']} ({resposta['ms']:.0f} ms no servidor)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera a apresentação do TCC VivaFit Seniors")
+    parser.add_argument("--saida", default=SAIDA_PADRAO, help="arquivo .pptx de saída")
+    parser.add_argument("--lote", metavar="ARQUIVO",
+                        help="JSON ou CSV com um conjunto de parâmetros (autor, data, link_apk) por apresentação")
+    parser.add_argument("--diretorio", default="apresentacoes", help="diretório de saída do modo lote")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="processos em paralelo no modo lote, nas prévias e em --comparar (0 = um por núcleo)")
+    parser.add_argument("--compressao", choices=NIVEIS_COMPRESSAO, default="padrao",
+                        help="armazenar para prévias rápidas, maxima para arquivamento")
+    parser.add_argument("--reprodutivel", action="store_true",
+                        help="mesmas entradas, mesmos bytes: datas do zip e do documento em SOURCE_DATE_EPOCH "
+                             "(padrão: 1980-01-01)")
+    parser.add_argument("--cache", nargs="?", const=CACHE_PADRAO, metavar="DIR",
+                        help=f"reaproveita slides inalterados (padrão: {CACHE_PADRAO})")
+    parser.add_argument("--esquema", action="store_true",
+                        help="inclui os slides do modelo de dados (schema.sql, DB.csv e diagrama ER) antes do encerramento")
+    parser.add_argument("--diagramas", action="store_true",
+                        help="inclui os diagramas do draw.io depois dos slides de arquitetura e de cache")
+    parser.add_argument("--metricas", nargs="+", metavar="LOG",
+                        help="logs JSONL do app: taxa de cache e latência medidas nos slides e slide de métricas")
+    parser.add_argument("--perfis", nargs="?", const=PERFIS_SQL, metavar="DUMP",
+                        help="slides de cadastros e nível de atividade a partir do dump SQL da tabela profiles")
+    parser.add_argument("--banco-perfis", default=":memory:", metavar="ARQ",
+                        help="banco SQLite onde o dump de --perfis é carregado (padrão: em memória)")
+    parser.add_argument("--previa", metavar="DIR",
+                        help="grava em DIR a prévia PNG de cada slide e uma folha de contato por apresentação")
+    parser.add_argument("--variante", nargs="+", choices=list(VARIANTES), metavar="NOME",
+                        help=f"gera as variantes ({', '.join(VARIANTES)}) em --saida_<variante>.pptx")
+    parser.add_argument("--idioma", nargs="+", choices=IDIOMAS, metavar="IDIOMA",
+                        help=f"gera a apresentação em cada idioma ({', '.join(IDIOMAS)}) em --saida_<idioma>.pptx")
+    parser.add_argument("--online", action="store_true",
+                        help="em --revisar, confere também se os links respondem (HEAD)")
+    parser.add_argument("--estrito", action="store_true",
+                        help="problemas da revisão feita antes de gerar (ver --revisar) viram erros: "
+                             "nada é gravado e o código de saída é 1")
+    parser.add_argument("--tema", choices=NOMES_TEMAS, default="padrao",
+                        help="cores e fontes; alto_contraste tem contraste AAA e fontes 15%% maiores")
+    acao = parser.add_mutually_exclusive_group()
+    acao.add_argument("--listar-slides", action="store_true", help="lista os slides e sai, sem renderizar")
+    acao.add_argument("--validar", action="store_true",
+                      help="valida os slides (e os parâmetros de --lote) e sai, sem renderizar")
+    acao.add_argument("--revisar", action="store_true",
+                      help="revisa os slides finais (fonte mínima, contraste, transbordamento, links, palavras "
+                           "grudadas) e sai, sem renderizar; código 1 se houver problemas")
+    acao.add_argument("--extrair-textos", action="store_true",
+                      help="acrescenta os textos novos aos catálogos de tradução (docs/i18n) e sai")
+    acao.add_argument("--comparar", "--diff", nargs=2, metavar=("ANTES", "DEPOIS"),
+                      help="compara dois .pptx (ou diretórios de .pptx) slide a slide e sai; código 1 se diferem")
+    acao.add_argument("--servidor", nargs="?", const=SOCKET_PADRAO, metavar="SOCKET",
+                      help="mantém o motor carregado e atende renderizações no socket Unix")
+    acao.add_argument("--observar", "--watch", action="store_true",
+                      help="refaz --saida a cada mudança no script ou nos arquivos de conteúdo")
+    acao.add_argument("--via", nargs="?", const=SOCKET_PADRAO, metavar="SOCKET",
+                      help="renderiza --saida pelo servidor iniciado com --servidor")
+    args = parser.parse_args()
+    if args.extrair_textos:
+        extrair_textos()
+        return
+    if args.comparar:
+        sys.exit(comparar_apresentacoes(*args.comparar, jobs=args.jobs or os.cpu_count()))
+    if args.reprodutivel:
+        os.environ.setdefault("SOURCE_DATE_EPOCH", str(EPOCA_REPRODUTIVEL))
+    if args.cache:
+        from gerador import i18n
+
+        i18n.usar_cache_em_disco(args.cache)
+
+    telemetria = _ler_metricas(args.metricas) if args.metricas else None
+    medidos = parametros_metricas(telemetria) if telemetria else {}
+    padrao = {**DECK_PADRAO, **medidos}
+    try:
+        perfis = analisar_perfis(args.perfis, args.banco_perfis) if args.perfis else ()
+    except ValueError as erro:
+        parser.error(str(erro))
+    slides = montar_slides(esquema=args.esquema, diagramas=args.diagramas, telemetria=telemetria, perfis=perfis)
+    if (args.variante or args.idioma) and not args.revisar and (args.lote or args.servidor or args.via or args.observar):
+        parser.error("--variante e --idioma não se combinam com --lote, --servidor, --via ou --observar")
+    decks = decks_das_variantes(args, telemetria) if args.variante or args.idioma else None
+    if args.tema != "padrao" and not (args.listar_slides or args.validar):
+        from gerador import usar_tema
+
+        usar_tema(args.tema)
+    if args.observar:
+        observar(args, telemetria, perfis)
+    elif args.listar_slides:
+        for nome, slides_variante, *_ in decks or [(None, slides)]:
+            if nome:
+                print(f"== {nome} ==")
+            listar_slides(slides_variante)
+    elif args.validar:
+        lista_parametros = carregar_parametros(args.lote) if args.lote else None
+        avisar_pendentes(args.idioma or ())
+        sys.exit(max(validar_slides(slides_variante, lista_parametros)
+                     for _, slides_variante, *_ in decks or [(None, slides)]))
+    elif args.revisar:
+        lista_parametros = carregar_parametros(args.lote) if args.lote else None
+        sys.exit(revisar_apresentacoes(decks or [("", slides, {}, IDIOMA_ORIGEM)], padrao, lista_parametros, args))
+    elif args.servidor:
+        from gerador.servidor import servir
+
+        servir(args.servidor, slides, padrao=padrao, compressao=args.compressao, diretorio_cache=args.cache)
+    elif args.via:
+        sys.exit(renderizar_no_servidor(args.via, args.saida, args.compressao))
+    elif args.lote:
+        from gerador import gerar_lote
+
+        lista_parametros = carregar_parametros(args.lote)
+        revisar_antes_de_gerar([("", slides, {}, IDIOMA_ORIGEM)], padrao, lista_parametros, args)
+        jobs = args.jobs or os.cpu_count()
+        caminhos = gerar_lote(slides, lista_parametros, args.diretorio,
+                              padrao=padrao, jobs=jobs, compressao=args.compressao, diretorio_cache=args.cache,
+                              tema=args.tema)
+        print(f"✓ {len(caminhos)} apresentações criadas em {args.diretorio}")
+        if args.previa:
+            criar_previas(caminhos, args)
+    elif decks:
+        revisar_antes_de_gerar(decks, padrao, None, args)
+        caminhos = criar_variantes(args, decks, medidos)
+        if args.previa:
+            criar_previas(caminhos, args)
+    else:
+        revisar_antes_de_gerar([("", slides, {}, IDIOMA_ORIGEM)], padrao, None, args)
+        criar_apresentacao(args.saida, parametros=medidos, compressao=args.compressao, diretorio_cache=args.cache,
+                           slides=slides)
+        if args.previa:
+            criar_previas([args.saida], args)
+
+
 if __name__ == "__main__":
-    criar_apresentacao()
+    main()
@@ -0,0 +1,766 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark e perfil da geração da apresentação do TCC
+
+Suítes:
+    fases     tempo de cada fase (Presentation(), ajuste, cada slide, gravação)
+              e memória (pico e blocos alocados pelo tracemalloc, pico de RSS)
+    escala    decks sintéticos com 100, 1.000 e 10.000 slides e marcadores,
+              cada caso num processo novo para isolar o pico de RSS
+    comparar  estilos compilados, cache, modo --observar, variantes, imagens, compressão, esquema do banco,
+              telemetria, gráficos, perfis (SQLite), diagrama ER, diagramas do draw.io, catálogos de tradução,
+              comparação de decks, revisão, modelo intermediário, emissor XML, inicialização do CLI/servidor,
+              modo lote e prévias PNG
+
+Uso:
+    python docs/benchmark_apresentacao.py [fases|escala|comparar] [opções] [--json ARQ]
+
+Sem suíte, roda `fases` e `comparar`. Com --json os resultados de `fases`
+e `escala` são gravados para comparação entre versões.
+"""
+
+import argparse
+import filecmp
+import io
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+import resource
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from apresentacao_tcc import DECK_PADRAO, FOTOS_EXERCICIOS, QRCODE, SLIDES, VARIANTES
+from gerador import previa
+from gerador import construir_apresentacao, gerar_lote, gerar_variantes, nova_apresentacao, personalizar, renderizar_slide
+from gerador.cache import CacheMemoria, CacheSlides
+from gerador.diagrama_er import diagrama_er
+from gerador.diferenca import comparar as comparar_decks
+from gerador.drawio import ConversorDrawio, desenhar
+from gerador.esquema import Esquema, Relacionamento, ler_schema_sql, slides_tabelas
+from gerador.graficos import preparar
+from gerador.i18n import Catalogo, compilar_catalogo, textos_dos_slides
+from gerador.imagens import PipelineImagens
+from gerador.lote import ModeloBase
+from gerador.metricas import altura_paragrafo, largura_palavra
+from gerador.pacote import NIVEIS_COMPRESSAO, salvar
+from gerador.perfis import carregar_dump, ler_inserts, slides_perfis
+from gerador.renderizadores import ajustar_slides, baixar_slide, montar_slide
+from gerador.revisao import revisar, revisar_slide
+from gerador.servidor import enviar
+from gerador.telemetria import ler_telemetria
+from gerador.variantes import derivar
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "apresentacao_tcc.py")
+
+
+def cronometrar(funcao, repeticoes):
+    """Retorna o melhor tempo (em segundos) entre as repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def deck_sintetico(n_slides, n_marcadores):
+    """Deck artificial só com título e marcadores, para medir a escala"""
+    return [
+        {
+            "tipo": "conteudo",
+            "titulo": f"SLIDE {i + 1}",
+            "blocos": [
+                ("secao", "SEÇÃO"),
+                ("lista", [f"Item {j + 1} do slide {i + 1}" for j in range(n_marcadores)]),
+            ],
+        }
+        for i in range(n_slides)
+    ]
+
+
+def pico_rss_kib():
+    """Pico de memória residente do processo (KiB no Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+# ==================== FASES ====================
+
+def medir_fases(slides, repeticoes):
+    """Tempo de Presentation(), do ajuste, de cada slide e da gravação, mais o uso de memória"""
+    construcao, ajuste, gravacao = [], [], []
+    originais, slides = slides, ajustar_slides(slides)
+    por_slide = [[] for _ in slides]
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        prs = nova_apresentacao()
+        construcao.append(time.perf_counter() - inicio)
+        inicio = time.perf_counter()
+        ajustar_slides(originais)
+        ajuste.append(time.perf_counter() - inicio)
+        for i, spec in enumerate(slides):
+            inicio = time.perf_counter()
+            renderizar_slide(prs, spec)
+            por_slide[i].append(time.perf_counter() - inicio)
+        inicio = time.perf_counter()
+        salvar(prs, io.BytesIO())
+        gravacao.append(time.perf_counter() - inicio)
+
+    # Execução separada com tracemalloc, que distorce os tempos
+    tracemalloc.start()
+    prs = construir_apresentacao(slides, ajustar=False)
+    blocos = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    salvar(prs, io.BytesIO())
+    pico_tracemalloc = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    fases = [("Presentation()", construcao), ("ajuste", ajuste)]
+    fases += [(f"Slide {i + 1:2d} {spec.get('nome', '')}", por_slide[i]) for i, spec in enumerate(slides)]
+    fases += [("salvar", gravacao)]
+    resultado = {
+        "fases": {nome: {"min_ms": min(t) * 1000, "mediana_ms": statistics.median(t) * 1000} for nome, t in fases},
+        "pico_tracemalloc_kib": pico_tracemalloc // 1024,
+        "blocos_vivos": blocos,
+        "pico_rss_kib": pico_rss_kib(),
+    }
+
+    print(f"{'Fase':<28} {'mín (ms)':>10} {'mediana (ms)':>14}")
+    for nome, tempos in resultado["fases"].items():
+        print(f"{nome:<28} {tempos['min_ms']:10.2f} {tempos['mediana_ms']:14.2f}")
+    total = sum(t["mediana_ms"] for t in resultado["fases"].values())
+    print(f"{'Total':<28} {'':>10} {total:14.2f}")
+    print(f"Memória: pico tracemalloc {resultado['pico_tracemalloc_kib']} KiB, "
+          f"{blocos} blocos alocados ao fim da construção, pico RSS {resultado['pico_rss_kib'] // 1024} MiB")
+    return resultado
+
+
+# ==================== ESCALA ====================
+
+def _caso_escala(n_slides, n_marcadores):
+    """Executado num processo novo: constrói e grava o deck sintético"""
+    slides = deck_sintetico(n_slides, n_marcadores)
+    inicio = time.perf_counter()
+    prs = construir_apresentacao(slides, ajustar=False)
+    construcao = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    destino = io.BytesIO()
+    salvar(prs, destino)
+    gravacao = time.perf_counter() - inicio
+    return {
+        "slides": n_slides,
+        "marcadores": n_marcadores,
+        "construcao_ms": construcao * 1000,
+        "salvar_ms": gravacao * 1000,
+        "tamanho_kib": len(destino.getvalue()) // 1024,
+        "pico_rss_kib": pico_rss_kib(),
+    }
+
+
+def medir_escala(tamanhos, marcadores_por_slide=5):
+    """Casos N slides x 5 marcadores e 1 slide x N marcadores"""
+    casos = [(n, marcadores_por_slide) for n in tamanhos] + [(1, n) for n in tamanhos]
+    contexto = multiprocessing.get_context("spawn")
+    print(f"{'Caso':<28} {'construção (ms)':>16} {'salvar (ms)':>12} {'por parágrafo (µs)':>19} "
+          f"{'pacote (KiB)':>13} {'pico RSS (MiB)':>15}")
+    resultados = []
+    for n_slides, n_marcadores in casos:
+        with ProcessPoolExecutor(1, mp_context=contexto) as pool:
+            caso = pool.submit(_caso_escala, n_slides, n_marcadores).result()
+        paragrafos = n_slides * (n_marcadores + 1)
+        print(f"{f'{n_slides} slides x {n_marcadores}':<28} {caso['construcao_ms']:16.1f} {caso['salvar_ms']:12.1f} "
+              f"{caso['construcao_ms'] * 1000 / paragrafos:19.1f} {caso['tamanho_kib']:13d} "
+              f"{caso['pico_rss_kib'] / 1024:15.1f}")
+        resultados.append(caso)
+    return resultados
+
+
+# ==================== COMPARAÇÕES ====================
+
+def comparar(nome, slides, repeticoes):
+    setters = cronometrar(lambda: construir_apresentacao(slides, compilado=False), repeticoes)
+    compilado = cronometrar(lambda: construir_apresentacao(slides), repeticoes)
+    print(f"{nome:<28} setters {setters * 1000:8.1f} ms   "
+          f"compilado {compilado * 1000:8.1f} ms   ganho {setters / compilado:4.2f}x")
+
+
+def comparar_cache(slides, repeticoes):
+    """Reconstrução completa contra reconstrução com um único slide alterado"""
+    completa = cronometrar(lambda: construir_apresentacao(slides), repeticoes)
+    with tempfile.TemporaryDirectory() as diretorio:
+        cache = CacheSlides(diretorio)
+        construir_apresentacao(slides, cache=cache)
+        versoes = itertools.count()
+
+        def alterar_um():
+            # Título novo a cada repetição, para o slide alterado nunca estar no cache
+            alterados = list(slides)
+            alterados[10] = {**slides[10], "titulo": f"{slides[10]['titulo']} {next(versoes)}"}
+            construir_apresentacao(alterados, cache=cache)
+
+        incremental = cronometrar(alterar_um, repeticoes)
+    print(f"{'Cache (1 slide alterado)':<28} completa {completa * 1000:7.1f} ms   "
+          f"incremental {incremental * 1000:6.1f} ms   ganho {completa / incremental:4.2f}x")
+
+
+def comparar_observar(slides, repeticoes):
+    """Volta de uma edição no modo --observar (template e slides em memória) contra a geração a frio"""
+    def gerar(prs):
+        salvar(prs, io.BytesIO())
+
+    fria = cronometrar(lambda: gerar(construir_apresentacao(slides)), repeticoes)
+    modelo, cache = ModeloBase(), CacheMemoria()
+    gerar(construir_apresentacao(slides, prs=modelo.clonar(), cache=cache))
+    versoes = itertools.count()
+
+    def editar_um():
+        alterados = list(slides)
+        alterados[1] = {**slides[1], "titulo": f"{slides[1]['titulo']} {next(versoes)}"}
+        gerar(construir_apresentacao(alterados, prs=modelo.clonar(), cache=cache))
+        cache.podar()
+
+    edicao = cronometrar(editar_um, repeticoes)
+    print(f"{'Observar (1 slide editado)':<28} a frio {fria * 1000:9.1f} ms   "
+          f"edição {edicao * 1000:9.1f} ms   ganho {fria / edicao:4.2f}x")
+
+
+def comparar_imagens():
+    """Tamanho das imagens originais contra as preparadas pelo pipeline"""
+    arquivos = FOTOS_EXERCICIOS + [QRCODE]
+    pipeline = PipelineImagens()
+    inicio = time.perf_counter()
+    preparadas = [pipeline.preparar(caminho, 1.2, 0.8) for caminho in arquivos]
+    frio = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for caminho in arquivos:
+        pipeline.preparar(caminho, 1.2, 0.8)
+    quente = time.perf_counter() - inicio
+
+    originais = sum(os.path.getsize(caminho) for caminho in arquivos)
+    final = sum(len(p.dados) for p in preparadas)
+    print(f"{f'Imagens ({len(arquivos)})':<28} originais {originais // 1024:5d} KiB   "
+          f"preparadas {final // 1024:4d} KiB   frio {frio * 1000:6.1f} ms   cache {quente * 1000:5.2f} ms")
+
+
+def schema_sintetico(caminho, n_tabelas, n_colunas):
+    """SQL com n_tabelas x n_colunas, cada tabela referenciando a anterior"""
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for t in range(n_tabelas):
+            arquivo.write(f"CREATE TABLE t{t} (\n    id UUID PRIMARY KEY,\n")
+            if t:
+                arquivo.write(f"    t{t - 1}_id UUID NOT NULL REFERENCES t{t - 1}(id) ON DELETE CASCADE,\n")
+            for c in range(n_colunas):
+                arquivo.write(f"    c{c} VARCHAR(40) DEFAULT 'x',\n")
+            arquivo.write("    UNIQUE (id, c0)\n);\n")
+            arquivo.write(f"COMMENT ON TABLE t{t} IS 'tabela {t}';\n")
+
+
+def comparar_esquema(tamanhos=((10, 100), (100, 100), (1000, 100))):
+    """Leitura do schema.sql e geração dos slides de tabela; o custo por coluna deve ser constante"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        for n_tabelas, n_colunas in tamanhos:
+            caminho = os.path.join(diretorio, f"schema_{n_tabelas}.sql")
+            schema_sintetico(caminho, n_tabelas, n_colunas)
+            inicio = time.perf_counter()
+            esquema = ler_schema_sql(caminho)
+            relacoes = sum(1 for relacao in esquema.relacoes() if relacao[4])
+            leitura = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            slides = slides_tabelas(esquema)
+            specs = time.perf_counter() - inicio
+            colunas = sum(len(tabela.colunas) for tabela in esquema.tabelas.values())
+            print(f"{f'Esquema ({colunas} colunas)':<28} leitura {leitura * 1000:8.1f} ms   "
+                  f"{leitura / colunas * 1e6:5.2f} us/coluna   {relacoes} FKs   "
+                  f"{len(slides)} slides em {specs * 1000:6.1f} ms")
+
+
+def telemetria_sintetica(caminho, n_amostras, semente=0):
+    """Log JSONL do app com n_amostras (87% de acertos) e uma linha sem métrica a cada dez"""
+    sorteio = random.Random(semente)
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for i in range(n_amostras):
+            acerto = sorteio.random() < 0.87
+            ms = sorteio.lognormvariate(3.5, 0.5) if acerto else sorteio.lognormvariate(5.0, 0.6)
+            dados = {"cache": "hit" if acerto else "miss", "ms": round(ms, 1)}
+            arquivo.write(json.dumps({"timestamp": "2025-11-01T10:00:00.000Z", "level": "debug",
+                                      "message": "exercicio", "data": dados}) + "\n")
+            if i % 10 == 0:
+                arquivo.write('{"timestamp": "2025-11-01T10:00:00.000Z", "level": "info", "message": "tela"}\n')
+
+
+def comparar_telemetria(tamanhos=(100_000, 1_000_000)):
+    """Leitura dos logs em uma passada; o estado (baldes do histograma) não cresce com as amostras"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        for n in tamanhos:
+            caminho = os.path.join(diretorio, f"app_{n}.jsonl")
+            telemetria_sintetica(caminho, n)
+            inicio = time.perf_counter()
+            telemetria = ler_telemetria([caminho])
+            tempo = time.perf_counter() - inicio
+            latencias = telemetria.latencias
+            print(f"{f'Telemetria ({n} amostras)':<28} leitura {tempo * 1000:8.1f} ms   "
+                  f"{tempo / n * 1e6:5.2f} us/amostra   {len(latencias.contagens)} baldes   "
+                  f"p99 {latencias.quantil(0.99):.0f} ms")
+
+
+def _bytes_graficos(pacote):
+    """Tamanho descomprimido do XML dos gráficos e das planilhas embutidas"""
+    with zipfile.ZipFile(pacote) as arquivo:
+        return sum(info.file_size for info in arquivo.infolist()
+                   if info.filename.startswith(("ppt/charts/", "ppt/embeddings/")))
+
+
+def comparar_graficos(tamanhos=(2_000, 10_000), pontos_reducao=1_000_000):
+    """Gráfico de linha com a série bruta contra a reduzida por mínimo/máximo"""
+    for n in tamanhos:
+        serie = [math.sin(i / 500) * 50 + i % 7 for i in range(n)]
+        linha = []
+        for pontos in (0, None):
+            grafico = {"tipo": "linhas", "categorias": list(range(n)), "series": [("ms", serie)]}
+            if pontos is not None:
+                grafico["pontos"] = pontos
+            destino = io.BytesIO()
+            inicio = time.perf_counter()
+            salvar(construir_apresentacao([{"tipo": "grafico", "titulo": "G", "grafico": grafico}]), destino)
+            tempo = time.perf_counter() - inicio
+            rotulo = "bruta" if pontos == 0 else "reduzida"
+            linha.append(f"{rotulo} {tempo * 1000:8.1f} ms/{_bytes_graficos(destino) // 1024} KiB")
+        print(f"{f'Gráfico de linha ({n} pontos)':<28} " + "   ".join(linha))
+    serie = [math.sin(i / 500) for i in range(pontos_reducao)]
+    inicio = time.perf_counter()
+    preparar({"tipo": "linhas", "categorias": range(pontos_reducao), "series": [("s", serie)]})
+    tempo = time.perf_counter() - inicio
+    print(f"{f'Redução mín/máx ({pontos_reducao} pontos)':<28} {tempo * 1000:8.1f} ms")
+
+
+def perfis_sintetico(caminho, n_linhas, semente=0):
+    """Dump no formato do Supabase: um único INSERT, numa linha, com n_linhas perfis em dois anos"""
+    sorteio = random.Random(semente)
+    niveis = ("'sedentary'", "'low'", "'medium'", "'high'", "null")
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write('INSERT INTO "public"."profiles" ("id", "user_id", "display_name", "age", "weight", '
+                      '"activity_level", "health_limitations", "created_at", "updated_at") VALUES ')
+        for i in range(n_linhas):
+            criado = f"{2024 + i * 2 // n_linhas}-{sorteio.randint(1, 12):02d}-{sorteio.randint(1, 28):02d} 10:00:00+00"
+            arquivo.write(f"{', ' if i else ''}('{i:032x}', '{i:032x}', 'Usuária d''Ávila {i}', "
+                          f"'{sorteio.randint(60, 90)}', '{sorteio.uniform(50, 95):.1f}', "
+                          f"{sorteio.choice(niveis)}, null, '{criado}', '{criado}')")
+        arquivo.write(";\n")
+
+
+def comparar_perfis(tamanhos=(100_000, 1_000_000)):
+    """Carga do dump no SQLite em blocos; a memória do parser não cresce com o dump"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        for n in tamanhos:
+            caminho = os.path.join(diretorio, f"profiles_{n}.sql")
+            perfis_sintetico(caminho, n)
+            megabytes = os.path.getsize(caminho) / 2 ** 20
+            conexao = sqlite3.connect(":memory:")
+            inicio = time.perf_counter()
+            carregar_dump(caminho, conexao)
+            carga = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            slides_perfis(conexao)
+            consultas = time.perf_counter() - inicio
+            conexao.close()
+            tracemalloc.start()
+            for _ in ler_inserts(caminho):
+                pass
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{f'Perfis ({n} linhas)':<28} carga {carga * 1000:8.1f} ms   "
+                  f"{carga / n * 1e6:5.2f} us/linha   {megabytes / carga:5.1f} MiB/s   "
+                  f"parser {pico / 2 ** 20:4.1f} MiB   slides em {consultas * 1000:6.1f} ms")
+
+
+def esquema_er_sintetico(n_tabelas, semente=0):
+    """Esquema com n_tabelas de 8 colunas: cada tabela referencia uma anterior e metade ganha outra FK"""
+    sorteio = random.Random(semente)
+    esquema = Esquema()
+    relacionamentos = []
+    for t in range(n_tabelas):
+        tabela = esquema.tabela(f"t{t}")
+        tabela.coluna("id", "UUID").primaria = True
+        for c in range(7):
+            tabela.coluna(f"c{c}", "TEXT")
+        for _ in range(min(t, 1 + (t % 2))):
+            relacionamentos.append(Relacionamento(f"t{sorteio.randrange(t)}", f"t{t}", "", "1", "N"))
+    return esquema, relacionamentos
+
+
+def comparar_er(tamanhos=(10, 100, 1000, 10000)):
+    """Layout do diagrama ER; o custo por tabela deve ficar quase constante com n"""
+    for n in tamanhos:
+        esquema, relacionamentos = esquema_er_sintetico(n)
+        inicio = time.perf_counter()
+        diagrama = diagrama_er(esquema, relacionamentos)
+        tempo = time.perf_counter() - inicio
+        print(f"{f'Diagrama ER ({n} tabelas)':<28} layout  {tempo * 1000:8.1f} ms   "
+              f"{tempo / n * 1e6:6.1f} us/tabela   {len(diagrama.conectores)} relacionamentos")
+
+
+def drawio_sintetico(caminho, n_formas):
+    """Diagrama com n_formas caixas numa grade, cada uma ligada à vizinha da direita"""
+    colunas = 50
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write('<mxfile><diagram name="p"><mxGraphModel><root>'
+                      '<mxCell id="0"/><mxCell id="1" parent="0"/>\n')
+        for i in range(n_formas):
+            x, y = i % colunas * 160, i // colunas * 100
+            arquivo.write(f'<mxCell id="f{i}" value="Caixa &lt;b&gt;{i}&lt;/b&gt;" vertex="1" parent="1" '
+                          f'style="rounded=1;whiteSpace=wrap;html=1;fillColor=#dae8fc;strokeColor=#6c8ebf;">'
+                          f'<mxGeometry x="{x}" y="{y}" width="120" height="60" as="geometry"/></mxCell>\n')
+            if i % colunas:
+                arquivo.write(f'<mxCell id="e{i}" edge="1" parent="1" source="f{i - 1}" target="f{i}" '
+                              f'style="edgeStyle=orthogonalEdgeStyle;endArrow=classic;">'
+                              f'<mxGeometry relative="1" as="geometry"/></mxCell>\n')
+        arquivo.write('</root></mxGraphModel></diagram></mxfile>\n')
+
+
+def comparar_drawio(tamanhos=(100, 1000, 5000)):
+    """Conversão de diagramas: leitura do XML, cache em memória, cache em disco e desenho no slide"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        for n in tamanhos:
+            caminho = os.path.join(diretorio, f"diagrama_{n}.drawio")
+            drawio_sintetico(caminho, n)
+            conversor = ConversorDrawio(os.path.join(diretorio, f"cache_{n}"))
+            os.makedirs(conversor.diretorio)
+            inicio = time.perf_counter()
+            diagrama = conversor.converter(caminho)
+            frio = time.perf_counter() - inicio
+            memoria = cronometrar(lambda: conversor.converter(caminho), 5)
+            disco = cronometrar(lambda: ConversorDrawio(conversor.diretorio).converter(caminho), 3)
+            prs = nova_apresentacao()
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            inicio = time.perf_counter()
+            desenhar(slide, diagrama, (0.5, 1.5, 9, 5.5))
+            desenho = time.perf_counter() - inicio
+            print(f"{f'Draw.io ({n} formas)':<28} leitura {frio * 1000:8.1f} ms   "
+                  f"memória {memoria * 1e6:6.1f} us   disco {disco * 1000:7.1f} ms   "
+                  f"desenho {desenho * 1000:8.1f} ms")
+
+
+def comparar_ajuste(slides):
+    """Ajuste dos slides com as medições em cache vazio e já preenchido"""
+    largura_palavra.cache_clear()
+    altura_paragrafo.cache_clear()
+    inicio = time.perf_counter()
+    ajustados = ajustar_slides(slides)
+    frio = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    ajustar_slides(slides)
+    quente = time.perf_counter() - inicio
+    info = altura_paragrafo.cache_info()
+    print(f"{f'Ajuste ({len(slides)} -> {len(ajustados)} slides)':<28} frio {frio * 1000:8.1f} ms   "
+          f"cache  {quente * 1000:8.2f} ms   {info.currsize} parágrafos medidos")
+
+
+def comparar_variantes(repeticoes):
+    """Cada variante gerada sozinha (como um script por variante) contra todas numa passada"""
+    decks = [(nome, *derivar(SLIDES, nome, VARIANTES)) for nome in VARIANTES]
+    with tempfile.TemporaryDirectory() as diretorio:
+        def separadas():
+            for nome, slides, parametros in decks:
+                prs = construir_apresentacao(personalizar(slides, {**DECK_PADRAO, **parametros}),
+                                             prs=nova_apresentacao())
+                salvar(prs, os.path.join(diretorio, f"{nome}.pptx"))
+
+        def juntas():
+            gerar_variantes([(os.path.join(diretorio, f"{nome}.pptx"), slides, parametros)
+                             for nome, slides, parametros in decks], padrao=DECK_PADRAO)
+
+        def so_defesa():
+            gerar_variantes([(os.path.join(diretorio, "defesa.pptx"), *decks[0][1:])], padrao=DECK_PADRAO)
+
+        tempos = [cronometrar(funcao, repeticoes) for funcao in (separadas, juntas, so_defesa)]
+    print(f"{f'Variantes ({len(decks)})':<28} separadas {tempos[0] * 1000:6.1f} ms   "
+          f"juntas {tempos[1] * 1000:6.1f} ms   só defesa {tempos[2] * 1000:6.1f} ms   "
+          f"ganho {tempos[0] / tempos[1]:4.2f}x")
+
+
+def comparar_i18n(n_textos=100_000, n_idiomas=20):
+    """Catálogos JSON lidos inteiros contra compilados e mapeados com mmap, em vários idiomas"""
+    textos = textos_dos_slides(SLIDES)
+    catalogo = {f"texto {i} " * 4: f"tradução {i} " * 4 for i in range(n_textos)}
+    catalogo.update({texto: texto.upper() for texto in textos})
+    with tempfile.TemporaryDirectory() as diretorio:
+        origens = []
+        for i in range(n_idiomas):
+            origens.append(os.path.join(diretorio, f"idioma{i}.json"))
+            with open(origens[-1], "w", encoding="utf-8") as arquivo:
+                json.dump(catalogo, arquivo, ensure_ascii=False)
+
+        def com_json():
+            for origem in origens:
+                with open(origem, encoding="utf-8") as arquivo:
+                    traducoes = json.load(arquivo)
+                [traducoes.get(texto, texto) for texto in textos]
+
+        def com_mmap():
+            for origem in origens:
+                compilado = Catalogo(origem[:-5] + ".cat")
+                [compilado.get(texto, texto) for texto in textos]
+                compilado.fechar()
+
+        inicio = time.perf_counter()
+        for origem in origens:
+            compilar_catalogo(origem, origem[:-5] + ".cat")
+        compilacao = (time.perf_counter() - inicio) / n_idiomas
+        tempos = [cronometrar(funcao, 3) for funcao in (com_json, com_mmap)]
+    print(f"{f'Tradução ({n_idiomas} x {n_textos} textos)':<28} json {tempos[0] * 1000:8.1f} ms   "
+          f"mmap {tempos[1] * 1000:6.2f} ms   ganho {tempos[0] / tempos[1]:6.0f}x   "
+          f"({len(textos)} consultas por idioma, compilação {compilacao * 1000:.0f} ms por catálogo)")
+
+
+def comparar_diferenca(n=1000):
+    """Arquivo de N decks com um alterado: CRCs do diretório central contra ler e comparar todas as partes"""
+    with tempfile.TemporaryDirectory() as diretorio:
+        original, alterado = os.path.join(diretorio, "original.pptx"), os.path.join(diretorio, "alterado.pptx")
+        salvar(construir_apresentacao(personalizar(SLIDES, DECK_PADRAO)), original)
+        salvar(construir_apresentacao(personalizar(SLIDES, {**DECK_PADRAO, "data": "Dezembro de 2025"})), alterado)
+        antes, depois = os.path.join(diretorio, "antes"), os.path.join(diretorio, "depois")
+        for pasta in (antes, depois):
+            os.makedirs(pasta)
+            for i in range(n):
+                os.link(alterado if pasta == depois and i == n // 2 else original, os.path.join(pasta, f"{i}.pptx"))
+
+        def tudo():
+            for i in range(n):
+                with zipfile.ZipFile(os.path.join(antes, f"{i}.pptx")) as a, \
+                        zipfile.ZipFile(os.path.join(depois, f"{i}.pptx")) as b:
+                    [a.read(nome) == b.read(nome) for nome in a.namelist()]
+
+        inicio = time.perf_counter()
+        diferencas = comparar_decks(antes, depois)
+        crc = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        tudo()
+        lidas = time.perf_counter() - inicio
+    mudaram = sum(1 for diferenca in diferencas if diferenca.mudancas)
+    print(f"{f'Comparação ({n} decks)':<28} partes  {lidas * 1000:8.1f} ms   "
+          f"CRC       {crc * 1000:8.1f} ms   ganho {lidas / crc:4.1f}x   ({mudaram} deck alterado)")
+
+
+def comparar_revisao(n):
+    """Revisão de N apresentações do lote: cada slide revisado contra só os slides distintos"""
+    decks = [(f"{i}", ajustar_slides(personalizar(SLIDES, {**DECK_PADRAO, "autor": f"Autor {i}"})))
+             for i in range(n)]
+    revisar([("aquecimento", decks[0][1])])
+
+    inicio = time.perf_counter()
+    for _, slides in decks:
+        for spec in slides:
+            revisar_slide(spec)
+    todos = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    revisao = revisar(decks)
+    distintos = time.perf_counter() - inicio
+    regras = "  ".join(f"{regra} {segundos * 1000:.1f}" for regra, segundos in revisao.tempos.items())
+    print(f"{f'Revisão ({revisao.slides} slides)':<28} todos   {todos * 1000:8.1f} ms   "
+          f"distintos {distintos * 1000:8.1f} ms   ganho {todos / distintos:4.1f}x   "
+          f"({revisao.revisados} distintos; ms por regra: {regras})")
+
+
+def comparar_modelo(n=2000):
+    """Montagem do modelo intermediário (memória do tracemalloc) e rebaixamento para o pptx"""
+    slides = deck_sintetico(n, 5)
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    modelos = [montar_slide(spec) for spec in slides]
+    montagem = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    prs = nova_apresentacao()
+    inicio = time.perf_counter()
+    for modelo in modelos:
+        baixar_slide(prs, modelo)
+    rebaixamento = time.perf_counter() - inicio
+    print(f"{f'Modelo ({n} slides)':<28} montagem {montagem * 1000:7.1f} ms   "
+          f"memória {memoria / 1024:7.1f} KiB   rebaixamento {rebaixamento * 1000:8.1f} ms")
+
+
+def comparar_emissor(n=1000):
+    """Slides de marcadores pelas formas do python-pptx contra o emissor direto de XML
+
+    Mede a construção e a construção seguida da gravação: as partes do
+    emissor só podem ser gravadas sem voltar a ser interpretadas.
+    """
+    slides = deck_sintetico(n, 5)
+    pelo_pptx = [{**spec, "emissor": "pptx"} for spec in slides]
+
+    def gerar(specs):
+        salvar(construir_apresentacao(specs, ajustar=False), io.BytesIO())
+
+    formas = cronometrar(lambda: construir_apresentacao(pelo_pptx, ajustar=False), 1)
+    direto = cronometrar(lambda: construir_apresentacao(slides, ajustar=False), 1)
+    formas_total = cronometrar(lambda: gerar(pelo_pptx), 1)
+    direto_total = cronometrar(lambda: gerar(slides), 1)
+    print(f"{f'Emissor XML ({n} slides)':<28} python-pptx {formas * 1000:8.1f} ms   "
+          f"direto {direto * 1000:8.1f} ms   ganho {formas / direto:4.1f}x   "
+          f"com gravação {formas_total * 1000:8.1f} / {direto_total * 1000:8.1f} ms "
+          f"({formas_total / direto_total:4.1f}x)")
+
+
+def comparar_compressao(slides, repeticoes):
+    """Tempo de gravação e tamanho do pacote em cada nível de compressão"""
+    prs = construir_apresentacao(slides)
+    linha = ["prs.save " + f"{cronometrar(lambda: prs.save(io.BytesIO()), repeticoes) * 1000:6.1f} ms"]
+    for nome in NIVEIS_COMPRESSAO:
+        tempo = cronometrar(lambda: salvar(prs, io.BytesIO(), compressao=nome), repeticoes)
+        destino = io.BytesIO()
+        salvar(prs, destino, compressao=nome)
+        linha.append(f"{nome} {tempo * 1000:6.1f} ms/{len(destino.getvalue()) // 1024} KiB")
+    print(f"{'Gravação':<28} " + "   ".join(linha))
+
+
+def comparar_lote(n):
+    """N execuções do script (um processo por apresentação) contra um único lote"""
+    parametros = [{"autor": f"Autor {i}"} for i in range(n)]
+    with tempfile.TemporaryDirectory() as diretorio:
+        inicio = time.perf_counter()
+        for i in range(n):
+            saida = os.path.join(diretorio, f"script_{i}.pptx")
+            subprocess.run([sys.executable, SCRIPT, "--saida", saida], check=True, stdout=subprocess.DEVNULL)
+        script = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        gerar_lote(SLIDES, parametros, os.path.join(diretorio, "lote"), padrao=DECK_PADRAO)
+        lote = time.perf_counter() - inicio
+
+    print(f"{f'Lote ({n} apresentações)':<28} script  {script * 1000:8.1f} ms   "
+          f"lote      {lote * 1000:8.1f} ms   ganho {script / lote:4.2f}x")
+
+
+def _executar_script(*argumentos):
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, SCRIPT, *argumentos], check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - inicio
+
+
+def comparar_inicializacao(n):
+    """Comandos que não renderizam e N renderizações diretas contra N pelo servidor"""
+    listar = min(_executar_script("--listar-slides") for _ in range(3))
+    validar = min(_executar_script("--validar") for _ in range(3))
+    print(f"{'CLI sem renderizar':<28} listar  {listar * 1000:8.1f} ms   validar   {validar * 1000:8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_socket = os.path.join(diretorio, "servidor.sock")
+        servidor = subprocess.Popen([sys.executable, SCRIPT, "--servidor", caminho_socket], stdout=subprocess.PIPE)
+        servidor.stdout.readline()  # "Servidor pronto"
+        try:
+            saida = os.path.join(diretorio, "apresentacao.pptx")
+            direto = sum(_executar_script("--saida", saida) for _ in range(n))
+            via = sum(_executar_script("--via", caminho_socket, "--saida", saida) for _ in range(n))
+        finally:
+            enviar(caminho_socket, {"comando": "parar"})
+            servidor.wait()
+
+    print(f"{f'Servidor ({n} renderizações)':<28} direto  {direto * 1000:8.1f} ms   "
+          f"servidor  {via * 1000:8.1f} ms   ganho {direto / via:4.2f}x")
+
+
+def comparar_jobs(n, jobs):
+    """Lote serial contra lote em `jobs` processos, conferindo a saída byte a byte"""
+    parametros = [{"autor": f"Autor {i}"} for i in range(n)]
+    data_hora = (2025, 11, 1, 0, 0, 0)
+    tempos = {}
+    with tempfile.TemporaryDirectory() as diretorio:
+        for j in (1, jobs):
+            inicio = time.perf_counter()
+            gerar_lote(SLIDES, parametros, os.path.join(diretorio, str(j)), padrao=DECK_PADRAO,
+                       jobs=j, data_hora=data_hora)
+            tempos[j] = time.perf_counter() - inicio
+        arquivos = sorted(os.listdir(os.path.join(diretorio, "1")))
+        _, diferentes, erros = filecmp.cmpfiles(
+            os.path.join(diretorio, "1"), os.path.join(diretorio, str(jobs)), arquivos, shallow=False)
+
+    identicos = "idênticos" if not (diferentes or erros) else f"{len(diferentes) + len(erros)} diferentes"
+    print(f"{f'Lote ({n}, {jobs} processos)':<28} serial  {tempos[1] * 1000:8.1f} ms   "
+          f"paralelo  {tempos[jobs] * 1000:8.1f} ms   ganho {tempos[1] / tempos[jobs]:4.2f}x   ({identicos})")
+
+
+def comparar_previas(n, jobs):
+    """Prévias de N decks do lote: a frio (em `jobs` processos) contra o cache em disco"""
+    parametros = [{"autor": f"Autor {i}"} for i in range(n)]
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminhos = gerar_lote(SLIDES, parametros, os.path.join(diretorio, "lote"), padrao=DECK_PADRAO)
+        cache = os.path.join(diretorio, "cache")
+        tempos = {}
+        for nome in ("frio", "disco"):
+            previa.limpar_memoria()
+            inicio = time.perf_counter()
+            previa.gerar_previas(caminhos, os.path.join(diretorio, nome), jobs=jobs, diretorio_cache=cache)
+            tempos[nome] = time.perf_counter() - inicio
+        n_slides = n * len(previa.abrir_pacote(caminhos[0]).slides)
+        unicos = len(os.listdir(cache))
+
+    print(f"{f'Prévias ({n_slides} slides)':<28} frio    {tempos['frio'] * 1000:8.1f} ms   "
+          f"cache     {tempos['disco'] * 1000:8.1f} ms   ganho {tempos['frio'] / tempos['disco']:4.2f}x   "
+          f"({unicos} renderizados, {jobs} processos)")
+
+
+def executar_comparacoes(args):
+    comparar("TCC (16 slides)", SLIDES, args.repeticoes)
+    comparar("Sintético (100 x 20)", deck_sintetico(100, 20), args.repeticoes)
+    comparar_cache(SLIDES, args.repeticoes)
+    comparar_observar(personalizar(SLIDES, DECK_PADRAO), args.repeticoes)
+    comparar_ajuste(personalizar(SLIDES, DECK_PADRAO))
+    comparar_imagens()
+    comparar_variantes(args.repeticoes)
+    comparar_compressao(SLIDES, args.repeticoes)
+    comparar_esquema()
+    comparar_telemetria()
+    comparar_graficos()
+    comparar_perfis()
+    comparar_er()
+    comparar_drawio()
+    comparar_i18n()
+    comparar_diferenca()
+    comparar_revisao(args.lote or 20)
+    comparar_modelo()
+    comparar_emissor()
+    if args.lote:
+        comparar_inicializacao(min(args.lote, 5))
+        comparar_lote(args.lote)
+        comparar_previas(args.lote, args.jobs)
+        if args.jobs > 1:
+            comparar_jobs(args.lote * 2, args.jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("suite", nargs="?", choices=["fases", "escala", "comparar"],
+                        help="suíte a executar (padrão: fases e comparar)")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="tamanhos dos casos sintéticos da suíte escala")
+    parser.add_argument("--lote", type=int, default=20, help="apresentações na comparação do modo lote (0 desativa)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="processos na comparação do lote paralelo")
+    parser.add_argument("--json", metavar="ARQ", help="grava os resultados de fases/escala em JSON")
+    args = parser.parse_args()
+
+    resultados = {}
+    if args.suite in (None, "fases"):
+        resultados["fases"] = medir_fases(personalizar(SLIDES, DECK_PADRAO), args.repeticoes)
+    if args.suite == "escala":
+        resultados["escala"] = medir_escala(args.tamanhos)
+    if args.suite in (None, "comparar"):
+        print()
+        executar_comparacoes(args)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as arquivo:
+            json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
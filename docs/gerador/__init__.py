@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de geração das apresentações do TCC VivaFit Seniors
+
+Os slides são descritos como dados (ver `renderizadores`) e renderizados
+por um conjunto pequeno de renderizadores com estilos pré-compilados.
+
+Os nomes abaixo são importados sob demanda: importar o pacote (ou os
+módulos leves `parametros`, `padroes`, `validacao`, `esquema`,
+`telemetria`, `variantes`, `i18n`) não carrega o python-pptx nem o lxml, o que
+mantém rápidos os comandos que não renderizam.
+"""
+
+import importlib
+
+_ORIGENS = {
+    "COR_CLARA": "estilos",
+    "COR_PRIMARIA": "estilos",
+    "COR_SECUNDARIA": "estilos",
+    "COR_TEXTO": "estilos",
+    "ESTILOS": "estilos",
+    "Estilo": "estilos",
+    "TEMAS": "estilos",
+    "Tema": "estilos",
+    "estilo": "estilos",
+    "usar_tema": "estilos",
+    "usar_idioma": "i18n",
+    "ModeloBase": "lote",
+    "gerar_lote": "lote",
+    "gerar_variantes": "lote",
+    "personalizar": "parametros",
+    "construir_apresentacao": "renderizadores",
+    "nova_apresentacao": "renderizadores",
+    "renderizar_slide": "renderizadores",
+    "revisar": "revisao",
+}
+
+__all__ = list(_ORIGENS)
+
+
+def __getattr__(nome):
+    if nome not in _ORIGENS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(f".{_ORIGENS[nome]}", __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
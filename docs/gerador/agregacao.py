@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Pré-agregação das séries dos gráficos até a resolução do slide
+
+Cada ponto de um gráfico vira uma linha da planilha embutida (xlsx) e um
+<c:pt> por série no XML do gráfico; séries longas deixam as duas partes
+grandes e lentas de gravar e de abrir no PowerPoint, sem mudar o que se vê
+num gráfico de poucos centímetros. Antes de virar CategoryChartData:
+
+- linhas são reduzidas por mínimo/máximo: o eixo é dividido em pontos/2
+  intervalos e de cada um ficam os índices do menor e do maior valor de
+  cada série, na ordem original, o que preserva picos e vales;
+- valores brutos de histogramas são contados em faixas de largura redonda
+  (1, 2 ou 5 × 10^k).
+
+Só biblioteca padrão.
+"""
+
+import math
+
+# Pontos por série que um gráfico do tamanho do slide consegue mostrar
+PONTOS_MAXIMOS = 500
+
+
+def passo_redondo(valor):
+    """Menor 1, 2 ou 5 × 10^k maior ou igual a `valor`"""
+    if valor <= 0:
+        return 1
+    potencia = 10 ** math.floor(math.log10(valor))
+    return next(m * potencia for m in (1, 2, 5, 10) if m * potencia >= valor)
+
+
+def rotulo_faixa(inicio, fim):
+    """Rótulo da faixa do histograma ("10–20"; "≥ 100" para a faixa aberta)"""
+    return f"≥ {inicio:g}" if fim is None else f"{inicio:g}–{fim:g}"
+
+
+def indices_min_max(series, pontos=PONTOS_MAXIMOS):
+    """Índices que a redução por mínimo/máximo mantém (todos se couberem em `pontos`)
+
+    Com várias séries, cada intervalo guarda os extremos de todas elas, então
+    o resultado tem até `pontos` índices por série.
+    """
+    n = max((len(valores) for valores in series), default=0)
+    if not pontos or n <= pontos:
+        return list(range(n))
+    intervalos = max(1, pontos // 2)
+    manter = []
+    for k in range(intervalos):
+        inicio, fim = k * n // intervalos, (k + 1) * n // intervalos
+        extremos = set()
+        for valores in series:
+            presentes = [i for i in range(inicio, min(fim, len(valores))) if valores[i] is not None]
+            if presentes:
+                extremos.add(min(presentes, key=valores.__getitem__))
+                extremos.add(max(presentes, key=valores.__getitem__))
+        manter.extend(sorted(extremos))
+    return manter
+
+
+def reduzir_series(categorias, series, pontos=PONTOS_MAXIMOS):
+    """Categorias e séries [(nome, valores)] reduzidas por mínimo/máximo"""
+    indices = indices_min_max([valores for _, valores in series], pontos)
+    if len(indices) == len(categorias):
+        return categorias, series
+    return ([categorias[i] for i in indices],
+            [(nome, [valores[i] if i < len(valores) else None for i in indices]) for nome, valores in series])
+
+
+def contar_faixas(valores, n_faixas=20):
+    """Histograma (inicio, fim, contagem) dos valores em até `n_faixas` faixas de largura redonda"""
+    presentes = [v for v in valores if v is not None]
+    if not presentes:
+        return []
+    menor, maior = min(presentes), max(presentes)
+    largura = passo_redondo((maior - menor) / n_faixas) if maior > menor else 1
+    base = math.floor(menor / largura) * largura
+    n = int((maior - base) // largura) + 1
+    contagens = [0] * n
+    for valor in presentes:
+        contagens[min(int((valor - base) // largura), n - 1)] += 1
+    return [(base + i * largura, base + (i + 1) * largura, contagem) for i, contagem in enumerate(contagens)]
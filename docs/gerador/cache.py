@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Cache de slides endereçado por conteúdo
+
+A chave de cada slide é o hash das suas entradas: a especificação (textos,
+opções de estilo, layout), o conteúdo dos arquivos que ela cita (diagramas),
+a tabela de estilos, o tema ativo, a geometria da caixa de conteúdo e das
+tabelas e o template. O valor é o XML serializado da parte do slide.
+Num acerto o XML é reinserido no pacote como parte pronta, sem passar
+pelos renderizadores nem pelos objetos do python-pptx.
+
+Só entram no cache slides cuja única relação é com o layout (texto,
+tabelas, diagramas); slides com imagens ou gráficos são sempre renderizados.
+
+`CacheMemoria` usa as mesmas chaves com o XML num dict, para o modo
+--observar: entre uma edição e outra só os slides cuja chave mudou passam
+pelos renderizadores.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+
+from pptx.api import _default_pptx_path
+
+from . import renderizadores
+from .estilos import ESTILOS, tema_atual
+from .i18n import versao_idioma
+from .padroes import CACHE_PADRAO
+
+# Incrementar quando a saída dos renderizadores mudar para a mesma entrada
+VERSAO_CACHE = 2
+
+# Slides guardados por `CacheMemoria` (--observar, lote sem --cache)
+LIMITE_MEMORIA = 2048
+
+
+def _hash_arquivo(caminho):
+    estado = os.stat(caminho)
+    return _hash_conteudo(caminho, estado.st_mtime_ns, estado.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _hash_conteudo(caminho, mtime_ns, tamanho):
+    """Hash do conteúdo, recalculado só quando o arquivo muda"""
+    with open(caminho, "rb") as arquivo:
+        return hashlib.sha256(arquivo.read()).hexdigest()
+
+
+class CacheSlides:
+    """Cache em disco do XML dos slides, um arquivo por chave"""
+
+    def __init__(self, diretorio=CACHE_PADRAO, template=None):
+        self.diretorio = diretorio
+        self.acertos = 0
+        self.falhas = 0
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+        self._assinatura = json.dumps([
+            VERSAO_CACHE,
+            _hash_arquivo(template or _default_pptx_path()),
+            sorted((nome, repr(est)) for nome, est in ESTILOS.items()),
+            renderizadores.CAIXA_CONTEUDO,
+            renderizadores.ALTURA_LINHA,
+            renderizadores.ALTURA_DESCRICAO,
+        ])
+
+    def chave(self, spec):
+        """Hash das entradas do slide"""
+        conteudo = json.dumps(spec, sort_keys=True, ensure_ascii=False, default=repr)
+        arquivos = [_hash_arquivo(caminho) for caminho in renderizadores.arquivos_do_slide(spec)]
+        dados = (f"{self._assinatura}\n{tema_atual()!r}\n{versao_idioma()!r}\n"
+                 f"{renderizadores.layout_do_slide(spec)}\n{conteudo}\n{arquivos}")
+        return hashlib.sha256(dados.encode("utf-8")).hexdigest()
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.xml")
+
+    def obter(self, chave):
+        """XML do slide em cache, ou None"""
+        try:
+            with open(self._caminho(chave), "rb") as arquivo:
+                blob = arquivo.read()
+        except FileNotFoundError:
+            self.falhas += 1
+            return None
+        self.acertos += 1
+        return blob
+
+    def guardar(self, chave, blob):
+        """Grava o XML de forma atômica (seguro com vários processos)"""
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        with os.fdopen(fd, "wb") as arquivo:
+            arquivo.write(blob)
+        os.replace(temporario, self._caminho(chave))
+
+    def renderizar(self, prs, spec, aplicar):
+        """Reaproveita o slide do cache ou o renderiza e guarda"""
+        chave = self.chave(spec)
+        layout = prs.slide_layouts[renderizadores.layout_do_slide(spec)]
+        blob = self.obter(chave)
+        if blob is not None:
+            return inserir_slide_pronto(prs, layout, blob)
+        parte = renderizadores.renderizar_slide(prs, spec, aplicar)
+        if pode_guardar(parte):
+            self.guardar(chave, parte.blob)
+        return parte
+
+
+class CacheMemoria(CacheSlides):
+    """Cache de slides em memória, que vive enquanto o processo vive
+
+    Guarda no máximo `limite` slides; acima disso sai o usado há mais tempo.
+    `podar` descarta de uma vez os que a última geração não usou.
+    """
+
+    def __init__(self, template=None, limite=LIMITE_MEMORIA):
+        super().__init__(None, template)
+        self.limite = limite
+        self._blobs = {}
+        self._usadas = set()
+
+    def obter(self, chave):
+        self._usadas.add(chave)
+        blob = self._blobs.pop(chave, None)
+        if blob is None:
+            self.falhas += 1
+        else:
+            self.acertos += 1
+            self._blobs[chave] = blob
+        return blob
+
+    def guardar(self, chave, blob):
+        self._blobs[chave] = blob
+        if len(self._blobs) > self.limite:
+            del self._blobs[next(iter(self._blobs))]
+
+    def podar(self):
+        """Descarta os slides não usados desde a última poda e zera os contadores"""
+        self._blobs = {chave: blob for chave, blob in self._blobs.items() if chave in self._usadas}
+        self._usadas = set()
+        self.acertos = self.falhas = 0
+
+
+def inserir_slide_pronto(prs, layout, blob):
+    """Acrescenta à apresentação um slide cujo XML já está serializado"""
+    return renderizadores.acrescentar_xml(prs, layout, blob)
+
+
+def pode_guardar(parte):
+    """Slides que dependem de outras partes (imagens, gráficos) não entram no cache"""
+    return len(parte.rels) == 1
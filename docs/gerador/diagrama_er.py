@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+"""
+Diagrama entidade-relacionamento com layout automático em camadas
+
+As tabelas (do JSON do Lucidchart ou do schema.sql) e os relacionamentos
+(relationships.csv ou as chaves estrangeiras) viram um `drawio.Diagrama`,
+desenhado no slide pelas mesmas funções dos diagramas do draw.io: cada
+tabela é um cabeçalho com o nome e um corpo com os campos, e cada
+relacionamento um conector reto do lado 1 para o lado N, rotulado com as
+cardinalidades.
+
+Layout em camadas (Sugiyama), em tempo quase linear no número de tabelas
+e relacionamentos:
+
+1. ciclos são quebrados invertendo as arestas de retorno de uma DFS
+   iterativa;
+2. cada tabela, em ordem topológica, vai para a primeira camada abaixo de
+   todas as suas origens que ainda tenha vaga (no máximo `largura_camada`
+   tabelas); a próxima camada com vaga sai de um union-find. Depois, em
+   ordem topológica inversa, cada tabela desce até logo acima do seu
+   destino mais próximo se houver vaga, encurtando as arestas;
+3. a ordem dentro de cada camada vem de varreduras pelo baricentro dos
+   vizinhos (para baixo e para cima);
+4. cada tabela tenta ficar sob o centro das suas origens (e depois sobre o
+   dos seus destinos) e uma varredura da esquerda para a direita desfaz as
+   sobreposições na camada.
+
+Como as tabelas só se sobrepõem dentro da mesma camada, a varredura
+ordenada basta e nenhuma comparação par a par é feita. Arestas que pulam
+camadas são desenhadas retas e podem cruzar tabelas intermediárias.
+"""
+
+import math
+import os
+from functools import lru_cache
+
+from .drawio import Conector, Diagrama, Forma
+from .esquema import ler_lucidchart_json, ler_relacionamentos_csv, ler_schema_sql
+from .estilos import tema_atual
+from .i18n import traduzir
+from .metricas import altura_linha, largura_palavra
+
+# Medidas em pontos (a escala final vem de `drawio.desenhar`)
+TAMANHO_TITULO = 11
+TAMANHO_CAMPO = 9
+ALTURA_TITULO = 20
+MARGEM_TABELA = 8
+ESPACO_HORIZONTAL = 30
+ESPACO_VERTICAL = 45
+
+LARGURA_CAMADA_MINIMA = 5
+MAX_CAMPOS = 6
+VARREDURAS = 4
+
+
+def largura_camada_padrao(n_tabelas):
+    """Tabelas por camada: cerca de √n, para o diagrama não ficar estreito nem alto demais"""
+    return max(LARGURA_CAMADA_MINIMA, math.ceil(math.sqrt(n_tabelas)))
+
+
+# ==================== CAMADAS ====================
+
+def _sem_ciclos(n, arestas):
+    """Arestas com as de retorno (de uma DFS iterativa) invertidas"""
+    sucessores = [[] for _ in range(n)]
+    for u, v in arestas:
+        sucessores[u].append(v)
+    estado = [0] * n  # 0 = não visto, 1 = na pilha, 2 = concluído
+    retorno = set()
+    for raiz in range(n):
+        if estado[raiz]:
+            continue
+        estado[raiz] = 1
+        pilha = [(raiz, iter(sucessores[raiz]))]
+        while pilha:
+            u, vizinhos = pilha[-1]
+            for v in vizinhos:
+                if estado[v] == 0:
+                    estado[v] = 1
+                    pilha.append((v, iter(sucessores[v])))
+                    break
+                if estado[v] == 1:
+                    retorno.add((u, v))
+            else:
+                estado[u] = 2
+                pilha.pop()
+    return [(v, u) if (u, v) in retorno else (u, v) for u, v in arestas]
+
+
+class _Camadas:
+    """Camadas com no máximo `largura` nós; a primeira com vaga a partir de
+    uma camada sai de um union-find com compressão de caminho"""
+
+    def __init__(self, largura):
+        self.largura = largura
+        self.contagem = {}
+        self._proxima = {}
+
+    def _livre(self, camada):
+        raiz = camada
+        while self._proxima.setdefault(raiz, raiz) != raiz:
+            raiz = self._proxima[raiz]
+        while camada != raiz:
+            self._proxima[camada], camada = raiz, self._proxima[camada]
+        return raiz
+
+    def inserir(self, no, minima):
+        """Põe o nó na primeira camada com vaga a partir de `minima`; retorna a camada"""
+        camada = self._livre(minima)
+        self.contagem[camada] = self.contagem.get(camada, 0) + 1
+        if self.contagem[camada] == self.largura:
+            self._proxima[camada] = camada + 1
+        return camada
+
+    def mover(self, camada, destino):
+        """Muda um nó de camada se o destino tiver vaga; retorna se mudou"""
+        if self.contagem.get(destino, 0) >= self.largura:
+            return False
+        self.contagem[camada] -= 1
+        self.contagem[destino] = self.contagem.get(destino, 0) + 1
+        return True
+
+
+def _media(valores, padrao):
+    return sum(valores) / len(valores) if valores else padrao
+
+
+def ordenar_camadas(n, arestas, largura):
+    """Camadas (listas de nós na ordem de desenho) do grafo com nós 0..n-1
+
+    Retorna também as arestas já sem ciclos, que apontam sempre para uma
+    camada de baixo.
+    """
+    arestas = [(u, v) for u, v in _sem_ciclos(n, arestas) if u != v]
+    origens = [[] for _ in range(n)]
+    destinos = [[] for _ in range(n)]
+    for u, v in arestas:
+        origens[v].append(u)
+        destinos[u].append(v)
+
+    # Ordem topológica (Kahn) com a camada mínima de cada nó
+    faltam = [len(o) for o in origens]
+    fila = [no for no in range(n) if not faltam[no]]
+    minima = [0] * n
+    camadas = _Camadas(largura)
+    camada_de = [0] * n
+    for no in fila:
+        camada_de[no] = camadas.inserir(no, minima[no])
+        for destino in destinos[no]:
+            minima[destino] = max(minima[destino], camada_de[no] + 1)
+            faltam[destino] -= 1
+            if not faltam[destino]:
+                fila.append(destino)
+    # Nós descem até logo acima do destino mais próximo, encurtando as arestas
+    for no in reversed(fila):
+        if destinos[no]:
+            alvo = min(camada_de[d] for d in destinos[no]) - 1
+            if alvo > camada_de[no] and camadas.mover(camada_de[no], alvo):
+                camada_de[no] = alvo
+    membros = {}
+    for no in fila:
+        membros.setdefault(camada_de[no], []).append(no)
+    ordem = [membros[c] for c in sorted(membros)]
+
+    # Varreduras pelo baricentro das posições relativas dos vizinhos
+    posicao = [0.0] * n
+    for camada in ordem:
+        for i, no in enumerate(camada):
+            posicao[no] = i / len(camada)
+    for varredura in range(VARREDURAS):
+        vizinhos, sequencia = (origens, ordem[1:]) if varredura % 2 == 0 else (destinos, ordem[-2::-1])
+        for camada in sequencia:
+            camada.sort(key=lambda no: _media([posicao[v] for v in vizinhos[no]], posicao[no]))
+            for i, no in enumerate(camada):
+                posicao[no] = i / len(camada)
+    return ordem, arestas
+
+
+def posicionar(ordem, arestas, larguras, alturas):
+    """Canto superior esquerdo (x, y) de cada nó, sem sobreposição"""
+    n = len(larguras)
+    origens = [[] for _ in range(n)]
+    destinos = [[] for _ in range(n)]
+    for u, v in arestas:
+        origens[v].append(u)
+        destinos[u].append(v)
+
+    x = [0.0] * n
+    for camada in ordem:
+        fim = 0.0
+        for no in camada:
+            x[no] = fim
+            fim += larguras[no] + ESPACO_HORIZONTAL
+
+    def centros(nos):
+        return [x[no] + larguras[no] / 2 for no in nos]
+
+    for vizinhos, sequencia in ((origens, ordem[1:]), (destinos, ordem[-2::-1]), (origens, ordem[1:])):
+        for camada in sequencia:
+            desejado = [_media(centros(vizinhos[no]), x[no] + larguras[no] / 2) - larguras[no] / 2
+                        for no in camada]
+            fim = -math.inf
+            for no, alvo in zip(camada, desejado):
+                x[no] = max(alvo, fim + ESPACO_HORIZONTAL)
+                fim = x[no] + larguras[no]
+            # Deslocar a camada inteira não cria sobreposição e aproxima do alvo
+            desvio = sum(alvo - x[no] for no, alvo in zip(camada, desejado)) / len(camada)
+            for no in camada:
+                x[no] += desvio
+
+    menor = min(x) if n else 0.0
+    y = [0.0] * n
+    topo = 0.0
+    for camada in ordem:
+        for no in camada:
+            x[no] -= menor
+            y[no] = topo
+        topo += max(alturas[no] for no in camada) + ESPACO_VERTICAL
+    return x, y
+
+
+# ==================== DIAGRAMA ====================
+
+def _campos(tabela, max_campos):
+    """Linhas do corpo da tabela: chaves primeiro, no máximo `max_campos`"""
+    colunas = sorted(tabela.colunas.values(), key=lambda c: not (c.primaria or c.referencia))
+    linhas = []
+    for coluna in colunas[:max_campos]:
+        marcas = ["PK"] * coluna.primaria + ["FK"] * bool(coluna.referencia)
+        marca = f" [{' '.join(marcas)}]" if marcas else ""
+        linhas.append(f"{coluna.nome}: {coluna.tipo}{marca}" if coluna.tipo else coluna.nome + marca)
+    if len(colunas) > max_campos:
+        linhas.append(traduzir("… +{n} campos").format(n=len(colunas) - max_campos))
+    return linhas
+
+
+def diagrama_er(esquema, relacionamentos, largura_camada=None, max_campos=MAX_CAMPOS, rotulos=False, tema=None):
+    """Diagrama ER com as tabelas do `esquema` e os `relacionamentos` entre elas
+
+    Relacionamentos com tabelas fora do esquema são ignorados; com
+    `rotulos`, o rótulo do relacionamento acompanha as cardinalidades. As
+    cores vêm de `tema` (padrão: o tema ativo de `estilos`).
+    """
+    tema = tema or tema_atual()
+    primaria, clara, texto, secundaria = (str(tema.primaria), str(tema.clara), str(tema.texto),
+                                          str(tema.secundaria))
+    tabelas = list(esquema.tabelas.values())
+    indice = {tabela.nome: i for i, tabela in enumerate(tabelas)}
+    validos = [r for r in relacionamentos if r.origem in indice and r.destino in indice]
+
+    corpos = [_campos(tabela, max_campos) for tabela in tabelas]
+    larguras = [
+        max([largura_palavra(tabela.nome, True) * TAMANHO_TITULO]
+            + [largura_palavra(linha) * TAMANHO_CAMPO for linha in linhas]) + 2 * MARGEM_TABELA
+        for tabela, linhas in zip(tabelas, corpos)
+    ]
+    altura_campo = TAMANHO_CAMPO * altura_linha() * 1.2
+    alturas = [ALTURA_TITULO + len(linhas) * altura_campo + MARGEM_TABELA for linhas in corpos]
+
+    arestas = [(indice[r.origem], indice[r.destino]) for r in validos]
+    ordem, aciclicas = ordenar_camadas(len(tabelas), arestas,
+                                       largura_camada or largura_camada_padrao(len(tabelas)))
+    camada_de = {no: c for c, camada in enumerate(ordem) for no in camada}
+    x, y = posicionar(ordem, aciclicas, larguras, alturas)
+
+    formas = []
+    for i, (tabela, linhas) in enumerate(zip(tabelas, corpos)):
+        formas.append(Forma(f"{tabela.nome}#titulo", "retangulo", x[i], y[i], larguras[i], ALTURA_TITULO,
+                            tabela.nome, primaria, primaria, 1, clara,
+                            TAMANHO_TITULO, True, False, "center", "middle", False))
+        formas.append(Forma(tabela.nome, "retangulo", x[i], y[i] + ALTURA_TITULO, larguras[i],
+                            alturas[i] - ALTURA_TITULO, "\n".join(linhas), tabela.cor or clara,
+                            primaria, 1, texto, TAMANHO_CAMPO, False, False, "left", "top",
+                            False))
+
+    conectores = []
+    for j, relacionamento in enumerate(validos):
+        u, v = indice[relacionamento.origem], indice[relacionamento.destino]
+        if u == v:
+            continue
+        rotulo = f"{relacionamento.cardinalidade_origem}:{relacionamento.cardinalidade_destino}"
+        if rotulos and relacionamento.rotulo:
+            rotulo = f"{relacionamento.rotulo} ({rotulo})"
+        if camada_de[u] < camada_de[v]:
+            # Da base do corpo da origem ao topo do cabeçalho do destino
+            pontas = (relacionamento.origem, 2, y[u] + alturas[u], f"{relacionamento.destino}#titulo", 0, y[v])
+        else:
+            pontas = (f"{relacionamento.origem}#titulo", 0, y[u], relacionamento.destino, 2, y[v] + alturas[v])
+        origem, lado_origem, y1, destino, lado_destino, y2 = pontas
+        conectores.append(Conector(f"r{j}", x[u] + larguras[u] / 2, y1, x[v] + larguras[v] / 2, y2,
+                                   origem, lado_origem, destino, lado_destino, False, False, False,
+                                   secundaria, 1, False, rotulo, secundaria, TAMANHO_CAMPO))
+
+    largura = max((x[i] + larguras[i] for i in range(len(tabelas))), default=1)
+    altura = max((y[i] + alturas[i] for i in range(len(tabelas))), default=1)
+    return Diagrama(formas, conectores, 0, 0, largura, altura)
+
+
+def _marca(caminho):
+    estado = os.stat(caminho)
+    return caminho, estado.st_mtime_ns, estado.st_size
+
+
+def carregar_diagrama_er(arquivo, relacoes=None, **opcoes):
+    """Diagrama ER de um JSON do Lucidchart ou schema.sql, com relationships.csv opcional
+
+    Fica em cache enquanto os arquivos não mudam.
+    """
+    return _diagrama_em_cache(_marca(arquivo), relacoes and _marca(relacoes), tuple(sorted(opcoes.items())))
+
+
+@lru_cache(maxsize=32)
+def _diagrama_em_cache(arquivo, relacoes, opcoes):
+    caminho = arquivo[0]
+    esquema = ler_lucidchart_json(caminho) if caminho.lower().endswith(".json") else ler_schema_sql(caminho)
+    lista = ler_relacionamentos_csv(relacoes[0]) if relacoes else list(esquema.relacionamentos())
+    return diagrama_er(esquema, lista, **dict(opcoes))
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Comparação de apresentações geradas, slide a slide (--comparar/--diff)
+
+Em três níveis, cada um só para o que o anterior não resolveu:
+
+1. pacote: o CRC-32 e o tamanho de cada entrada, lidos do diretório
+   central do zip (`leitura.PacoteLido.assinatura`), decidem se dois
+   .pptx têm o mesmo conteúdo sem descomprimir nenhuma parte. Num
+   arquivo com milhares de decks, os que não mudaram param aqui;
+2. slides: cada slide vira uma assinatura (a do seu XML e as das partes
+   que ele cita, sem os nomes) e as duas sequências são alinhadas com
+   `difflib`, o que separa slides novos, removidos e alterados mesmo com
+   slides inseridos no meio;
+3. formas: só os slides alterados têm o XML interpretado; as formas são
+   alinhadas pelo tipo, nome e texto, e cada par que difere é descrito
+   (posição, texto parágrafo a parágrafo, formatação, imagem ou gráfico).
+"""
+
+import copy
+import difflib
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+from .leitura import NS, PacoteLido
+
+# Um slide que mudou: números (1, 2...) em cada deck, None no lado em que não existe
+Mudanca = namedtuple("Mudanca", "tipo antes depois titulo detalhes")
+# Um par de decks: caminhos (None no lado em que não existe) e mudanças (vazia se iguais)
+Diferenca = namedtuple("Diferenca", "antes depois mudancas")
+
+_FORMAS = {f"{{{NS['p']}}}{tag}" for tag in ("sp", "pic", "graphicFrame", "grpSp", "cxnSp")}
+_TIPOS_FORMA = {"sp": "caixa", "pic": "imagem", "graphicFrame": "quadro", "grpSp": "grupo", "cxnSp": "conector"}
+_TITULOS = ("title", "ctrTitle")
+_NUMERO_NO_NOME = re.compile(r"\s*\d+$")
+
+
+# ==================== SLIDES ====================
+
+def _assinatura_slide(pacote, slide):
+    """XML do slide e conteúdo das partes citadas (sem os nomes), pelos CRCs do diretório central"""
+    return (pacote.assinatura(slide), tuple(sorted(pacote.assinatura(parte) for parte in pacote.citadas(slide))))
+
+
+def _texto(elemento):
+    return "".join(elemento.itertext())
+
+
+def _paragrafos(forma):
+    return [_texto(p) for p in forma.iter(f"{{{NS['a']}}}p")]
+
+
+def _nome(forma):
+    cnv = forma.find(".//p:cNvPr", NS)
+    return cnv.get("name", "") if cnv is not None else ""
+
+
+def _placeholder(forma):
+    ph = forma.find(".//p:nvPr/p:ph", NS)
+    return None if ph is None else (ph.get("type", "body"), ph.get("idx", "0"))
+
+
+def _formas(slide):
+    arvore = slide.find("p:cSld/p:spTree", NS)
+    return [filho for filho in arvore if filho.tag in _FORMAS]
+
+
+def titulo_slide(slide):
+    """Texto do título (ou da primeira forma com texto) de um slide já interpretado"""
+    formas = _formas(slide)
+    for forma in formas:
+        if (_placeholder(forma) or ("",))[0] in _TITULOS:
+            return _texto(forma).strip()
+    textos = (" ".join(_paragrafos(forma)).strip() for forma in formas)
+    return next((texto for texto in textos if texto), "")
+
+
+def _chave_forma(forma):
+    """Identidade da forma para o alinhamento: tipo, placeholder ou nome sem o número, e texto"""
+    tipo = etree.QName(forma).localname
+    return tipo, _placeholder(forma) or _NUMERO_NO_NOME.sub("", _nome(forma)), tuple(_paragrafos(forma))
+
+
+def _xfrm(forma):
+    for caminho in ("p:spPr/a:xfrm", "p:grpSpPr/a:xfrm", "p:xfrm"):
+        xfrm = forma.find(caminho, NS)
+        if xfrm is not None:
+            return xfrm
+    return None
+
+
+def _geometria(forma):
+    xfrm = _xfrm(forma)
+    return etree.tostring(xfrm, method="c14n") if xfrm is not None else None
+
+
+def _formatacao(forma):
+    """A forma sem posição, texto, ids, nomes e referências a outras partes: o que sobra é formatação"""
+    copia = copy.deepcopy(forma)
+    xfrm = _xfrm(copia)
+    if xfrm is not None:
+        xfrm.getparent().remove(xfrm)
+    for t in copia.iter(f"{{{NS['a']}}}t"):
+        t.text = ""
+    for cnv in copia.iter(f"{{{NS['p']}}}cNvPr"):
+        cnv.attrib.pop("id", None)
+        cnv.attrib.pop("name", None)
+    for elemento in copia.iter():
+        for atributo in [a for a in elemento.attrib if a.startswith(f"{{{NS['r']}}}")]:
+            del elemento.attrib[atributo]
+    return etree.tostring(copia, method="c14n")
+
+
+def _referencias(pacote, parte, forma):
+    """Assinaturas das partes citadas pela forma (imagem, gráfico e planilha)"""
+    rels = pacote.rels(parte)
+    assinaturas = []
+    for elemento in forma.iter():
+        for atributo, valor in elemento.attrib.items():
+            if atributo.startswith(f"{{{NS['r']}}}") and valor in rels:
+                alvo = rels[valor]
+                assinaturas.append((pacote.assinatura(alvo),
+                                    tuple(sorted(pacote.assinatura(p) for p in pacote.citadas(alvo)))))
+    return assinaturas
+
+
+def _descrever_forma(forma):
+    nome = _nome(forma)
+    tipo = _TIPOS_FORMA[etree.QName(forma).localname]
+    return f'{tipo} "{nome}"' if nome else tipo
+
+
+def _diferencas_forma(pacote_a, parte_a, forma_a, pacote_b, parte_b, forma_b):
+    detalhes = []
+    if _geometria(forma_a) != _geometria(forma_b):
+        detalhes.append("posição/tamanho")
+    paragrafos_a, paragrafos_b = _paragrafos(forma_a), _paragrafos(forma_b)
+    texto = [f"{linha[0]} {linha[2:]!r}" for linha in difflib.ndiff(paragrafos_a, paragrafos_b)
+             if linha[0] in "-+"]
+    if _formatacao(forma_a) != _formatacao(forma_b):
+        detalhes.append("formatação")
+    if _referencias(pacote_a, parte_a, forma_a) != _referencias(pacote_b, parte_b, forma_b):
+        detalhes.append("imagem ou gráfico")
+    if texto:
+        detalhes.append("texto")
+    linhas = [f"{_descrever_forma(forma_b)}: {', '.join(detalhes)}"] if detalhes else []
+    return linhas + [f"    {linha}" for linha in texto]
+
+
+def _parear(a, b):
+    """Alinha duas sequências: pares (i, j) na ordem, com None no lado que falta
+
+    Os trechos trocados são pareados pela posição; o que sobra fica sem par.
+    """
+    pares = []
+    for operacao, a1, a2, b1, b2 in difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes():
+        n = min(a2 - a1, b2 - b1) if operacao in ("equal", "replace") else 0
+        pares += [(a1 + i, b1 + i) for i in range(n)]
+        pares += [(i, None) for i in range(a1 + n, a2)]
+        pares += [(None, j) for j in range(b1 + n, b2)]
+    return pares
+
+
+def comparar_slides(pacote_a, indice_a, pacote_b, indice_b):
+    """Descrição, forma a forma, das diferenças entre dois slides (lista de linhas)"""
+    parte_a, parte_b = pacote_a.slides[indice_a], pacote_b.slides[indice_b]
+    formas_a, formas_b = _formas(pacote_a.xml(parte_a)), _formas(pacote_b.xml(parte_b))
+    linhas = []
+    for i, j in _parear([_chave_forma(f) for f in formas_a], [_chave_forma(f) for f in formas_b]):
+        if j is None:
+            linhas.append(f"{_descrever_forma(formas_a[i])}: removida")
+        elif i is None:
+            linhas.append(f"{_descrever_forma(formas_b[j])}: nova")
+        else:
+            linhas += _diferencas_forma(pacote_a, parte_a, formas_a[i], pacote_b, parte_b, formas_b[j])
+    if not linhas:
+        fundo_a = etree.tostring(pacote_a.xml(parte_a).find("p:cSld", NS), method="c14n")
+        fundo_b = etree.tostring(pacote_b.xml(parte_b).find("p:cSld", NS), method="c14n")
+        linhas.append("fundo ou propriedades do slide" if fundo_a != fundo_b else "layout, mestre ou tema")
+    return linhas
+
+
+# ==================== PACOTES ====================
+
+def comparar_pacotes(antes, depois):
+    """Lista de Mudanca entre dois .pptx (caminhos ou PacoteLido); vazia se o conteúdo é o mesmo
+
+    Slides com a mesma assinatura são iguais e não são interpretados; nos
+    trechos que diferem, os slides são pareados pelo título.
+    """
+    a = antes if isinstance(antes, PacoteLido) else PacoteLido(antes)
+    b = depois if isinstance(depois, PacoteLido) else PacoteLido(depois)
+    try:
+        if a.assinaturas() == b.assinaturas():
+            return []
+        mudancas = []
+        opcodes = difflib.SequenceMatcher(None, [_assinatura_slide(a, slide) for slide in a.slides],
+                                          [_assinatura_slide(b, slide) for slide in b.slides],
+                                          autojunk=False).get_opcodes()
+        for operacao, a1, a2, b1, b2 in opcodes:
+            if operacao == "equal":
+                continue
+            titulos_a = [titulo_slide(a.xml(slide)) for slide in a.slides[a1:a2]]
+            titulos_b = [titulo_slide(b.xml(slide)) for slide in b.slides[b1:b2]]
+            for i, j in _parear(titulos_a, titulos_b):
+                if j is None:
+                    mudancas.append(Mudanca("removido", a1 + i + 1, None, titulos_a[i], []))
+                elif i is None:
+                    mudancas.append(Mudanca("novo", None, b1 + j + 1, titulos_b[j], []))
+                else:
+                    mudancas.append(Mudanca("alterado", a1 + i + 1, b1 + j + 1, titulos_b[j],
+                                            comparar_slides(a, a1 + i, b, b1 + j)))
+        if not mudancas:
+            mudancas.append(Mudanca("pacote", None, None, "", ["partes fora dos slides (propriedades, tema...)"]))
+        return mudancas
+    finally:
+        if a is not antes:
+            a.fechar()
+        if b is not depois:
+            b.fechar()
+
+
+def _pptx_em(diretorio):
+    return {os.path.relpath(os.path.join(raiz, nome), diretorio)
+            for raiz, _, nomes in os.walk(diretorio) for nome in nomes if nome.endswith(".pptx")}
+
+
+def _comparar_par(par):
+    antes, depois = par
+    return Diferenca(antes, depois, comparar_pacotes(antes, depois))
+
+
+def comparar(antes, depois, jobs=1):
+    """Lista de Diferenca entre dois .pptx ou entre os .pptx de dois diretórios (pelo caminho relativo)
+
+    Com `jobs > 1` os pares de decks são divididos entre processos.
+    """
+    if not os.path.isdir(antes):
+        return [_comparar_par((antes, depois))]
+    nomes_a, nomes_b = _pptx_em(antes), _pptx_em(depois)
+    pares = [(os.path.join(antes, nome), os.path.join(depois, nome)) for nome in sorted(nomes_a & nomes_b)]
+    if jobs > 1 and len(pares) > 1:
+        with ProcessPoolExecutor(min(jobs, len(pares))) as pool:
+            diferencas = list(pool.map(_comparar_par, pares, chunksize=max(1, len(pares) // (jobs * 4))))
+    else:
+        diferencas = [_comparar_par(par) for par in pares]
+    diferencas += [Diferenca(os.path.join(antes, nome), None, []) for nome in sorted(nomes_a - nomes_b)]
+    diferencas += [Diferenca(None, os.path.join(depois, nome), []) for nome in sorted(nomes_b - nomes_a)]
+    return diferencas
+
+
+def formatar(diferencas):
+    """Linhas de texto do relatório; só os decks que diferem aparecem"""
+    linhas = []
+    for diferenca in diferencas:
+        if diferenca.antes is None or diferenca.depois is None:
+            linhas.append(f"só em {'depois' if diferenca.antes is None else 'antes'}: "
+                          f"{diferenca.depois or diferenca.antes}")
+            continue
+        if not diferenca.mudancas:
+            continue
+        linhas.append(f"== {diferenca.antes} → {diferenca.depois}")
+        for mudanca in diferenca.mudancas:
+            if mudanca.tipo == "pacote":
+                linhas += mudanca.detalhes
+                continue
+            numero = {"alterado": f"{mudanca.antes} → {mudanca.depois}" if mudanca.antes != mudanca.depois
+                      else mudanca.antes, "removido": mudanca.antes, "novo": mudanca.depois}[mudanca.tipo]
+            linhas.append(f"slide {numero} {mudanca.tipo}: {mudanca.titulo}")
+            linhas += [f"  {detalhe}" for detalhe in mudanca.detalhes]
+    return linhas
@@ -0,0 +1,493 @@
+# -*- coding: utf-8 -*-
+"""
+Importação de diagramas do draw.io como formas nativas do PowerPoint
+
+O arquivo .drawio (mxGraphModel) é lido com `lxml.etree.iterparse`, uma
+célula por vez: vértices viram autoformas (retângulo, retângulo
+arredondado, losango, elipse ou caixa de texto) e arestas viram conectores,
+com setas, rótulos e cores. Diagramas comprimidos (o formato padrão do
+app) são descomprimidos antes da leitura.
+
+A conversão do XML para a lista de formas e conectores fica em cache pelo
+hash do conteúdo do arquivo, em memória e opcionalmente em disco (JSON);
+na reconstrução só resta desenhar as formas no slide.
+
+De cada `light-dark(clara, escura)` vale a cor clara. Como parte dos
+diagramas do projeto foi desenhada no modo escuro do app (linhas e textos
+brancos), textos e linhas com contraste insuficiente sobre o que está atrás
+deles (a forma preenchida mais acima ou o slide branco) passam a branco ou
+COR_TEXTO; o fundo de cada ponto vem de um índice espacial em grade.
+"""
+
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+import tempfile
+import zlib
+from collections import namedtuple
+from urllib.parse import unquote
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_LINE
+from pptx.enum.shapes import MSO_CONNECTOR, MSO_SHAPE
+from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.util import Emu, Inches, Pt
+
+from .estilos import COR_TEXTO
+
+# Incrementar quando a conversão mudar para o mesmo arquivo
+VERSAO_DRAWIO = 1
+
+# Diagramas convertidos guardados em memória (servidor, --observar); acima disso sai o usado há mais tempo
+LIMITE_MEMORIA = 256
+
+Forma = namedtuple(
+    "Forma",
+    "id tipo x y largura altura texto preenchimento borda espessura cor_fonte tamanho_fonte "
+    "negrito italico alinhamento alinhamento_vertical tracejado",
+)
+Conector = namedtuple(
+    "Conector",
+    "id x1 y1 x2 y2 origem lado_origem destino lado_destino cotovelo seta_inicio seta_fim "
+    "cor espessura tracejado texto cor_texto tamanho_fonte",
+)
+Diagrama = namedtuple("Diagrama", "formas conectores x y largura altura")
+
+# Pontos médios dos lados, na ordem dos pontos de conexão do PowerPoint
+LADOS = ((0.5, 0.0), (0.0, 0.5), (0.5, 1.0), (1.0, 0.5))
+
+TIPOS_FORMA = {
+    "retangulo": MSO_SHAPE.RECTANGLE,
+    "arredondado": MSO_SHAPE.ROUNDED_RECTANGLE,
+    "losango": MSO_SHAPE.DIAMOND,
+    "elipse": MSO_SHAPE.OVAL,
+}
+ALINHAMENTOS = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+ANCORAS = {"top": MSO_ANCHOR.TOP, "middle": MSO_ANCHOR.MIDDLE, "bottom": MSO_ANCHOR.BOTTOM}
+
+_COR = re.compile(r"#([0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b|rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)")
+_COR_HTML = re.compile(r"color:\s*((?:light-dark\()?(?:#[0-9a-fA-F]{3,6}|rgba?\([^)]*\)))")
+_TAMANHO_HTML = re.compile(r"font-size:\s*([\d.]+)px")
+
+# Contraste mínimo (WCAG) entre texto ou linha e o que está atrás
+CONTRASTE_MINIMO = 2.0
+# Lado das células do índice espacial, em pixels do draw.io
+TAMANHO_GRADE = 100
+
+
+# ==================== LEITURA ====================
+
+def _estilo(texto):
+    """Estilo "chave=valor;..." do draw.io; palavras soltas (rhombus, text...) viram chave=True"""
+    estilo = {}
+    for item in (texto or "").split(";"):
+        chave, igual, valor = item.partition("=")
+        if chave:
+            estilo[chave] = valor if igual else True
+    return estilo
+
+
+def _cor(valor, padrao=None):
+    """Cor "RRGGBB" (a clara de light-dark), None para "none" ou `padrao` se ausente"""
+    if valor is None or valor is True or valor == "default":
+        return padrao
+    if valor == "none":
+        return None
+    encontrada = _COR.search(valor)
+    if encontrada is None:
+        return padrao
+    if encontrada.group(1):
+        hexa = encontrada.group(1)
+        return (hexa if len(hexa) == 6 else "".join(c * 2 for c in hexa)).upper()
+    return "".join(f"{int(encontrada.group(i)):02X}" for i in (2, 3, 4))
+
+
+def _luminancia(cor):
+    canais = [int(cor[i:i + 2], 16) / 255 for i in (0, 2, 4)]
+    r, g, b = [c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4 for c in canais]
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def _contraste(cor, fundo):
+    claro, escuro = sorted((_luminancia(cor), _luminancia(fundo)), reverse=True)
+    return (claro + 0.05) / (escuro + 0.05)
+
+
+def _legivel(cor, fundo):
+    """A própria cor, ou branco/COR_TEXTO se ela quase some sobre o fundo"""
+    if cor is None or _contraste(cor, fundo) >= CONTRASTE_MINIMO:
+        return cor
+    return max(("FFFFFF", str(COR_TEXTO)), key=lambda alternativa: _contraste(alternativa, fundo))
+
+
+class _Grade:
+    """Índice espacial das formas preenchidas, para achar o fundo de um ponto sem varrer todas"""
+
+    def __init__(self, tamanho=TAMANHO_GRADE):
+        self._tamanho = tamanho
+        self._celulas = {}
+
+    def _faixa(self, inicio, fim):
+        return range(int(inicio // self._tamanho), int(fim // self._tamanho) + 1)
+
+    def inserir(self, forma):
+        for gx in self._faixa(forma.x, forma.x + forma.largura):
+            for gy in self._faixa(forma.y, forma.y + forma.altura):
+                self._celulas.setdefault((gx, gy), []).append(forma)
+
+    def fundo(self, x, y):
+        """Preenchimento da forma mais acima que contém o ponto, ou o branco do slide"""
+        candidatas = self._celulas.get((int(x // self._tamanho), int(y // self._tamanho)), ())
+        for forma in reversed(candidatas):
+            if forma.x <= x <= forma.x + forma.largura and forma.y <= y <= forma.y + forma.altura:
+                return forma.preenchimento
+        return "FFFFFF"
+
+
+def _texto(valor):
+    """Texto puro de um rótulo HTML do draw.io"""
+    texto = re.sub(r"<br\s*/?>|</div>|</p>", "\n", valor or "", flags=re.I)
+    texto = html.unescape(re.sub(r"<[^>]+>", "", texto)).replace("\xa0", " ")
+    return "\n".join(linha.strip() for linha in texto.strip().splitlines())
+
+
+def _numero(elemento, nome, padrao=0.0):
+    valor = elemento.get(nome) if elemento is not None else None
+    return float(valor) if valor is not None else padrao
+
+
+def _celulas(origem):
+    """(mxCell, id, rótulo) de cada célula, descomprimindo diagramas se preciso"""
+    comprimidos = []
+    for _, elemento in etree.iterparse(origem, events=("end",), tag=("mxCell", "diagram"), huge_tree=True):
+        if elemento.tag == "diagram":
+            if len(elemento) == 0 and (elemento.text or "").strip():
+                comprimidos.append(elemento.text.strip())
+            elemento.clear()
+            continue
+        pai = elemento.getparent()
+        if pai is not None and pai.tag in ("object", "UserObject"):
+            yield elemento, pai.get("id"), pai.get("label")
+        else:
+            yield elemento, elemento.get("id"), elemento.get("value")
+        # Libera as células já lidas (diagramas grandes)
+        elemento.clear()
+        while elemento.getprevious() is not None:
+            del elemento.getparent()[0]
+    for dados in comprimidos:
+        try:
+            xml = unquote(zlib.decompress(base64.b64decode(dados), -15).decode("utf-8"))
+        except (ValueError, zlib.error) as erro:
+            raise ValueError(f"diagrama comprimido inválido: {erro}") from erro
+        yield from _celulas(io.BytesIO(xml.encode("utf-8")))
+
+
+def _forma(id_celula, rotulo, estilo, x, y, largura, altura):
+    texto = _texto(rotulo)
+    if "text" in estilo or "edgeLabel" in estilo:
+        tipo, preenchimento, borda = "texto", _cor(estilo.get("fillColor")), _cor(estilo.get("strokeColor"))
+    else:
+        if "rhombus" in estilo or estilo.get("shape") == "rhombus":
+            tipo = "losango"
+        elif "ellipse" in estilo or estilo.get("shape") == "ellipse":
+            tipo = "elipse"
+        else:
+            tipo = "arredondado" if estilo.get("rounded") == "1" else "retangulo"
+        preenchimento = _cor(estilo.get("fillColor"), "FFFFFF")
+        borda = _cor(estilo.get("strokeColor"), "000000")
+
+    cor_html = _COR_HTML.search(rotulo or "")
+    cor_fonte = _cor(cor_html.group(1) if cor_html else estilo.get("fontColor"), "000000")
+    tamanho_html = _TAMANHO_HTML.search(rotulo or "")
+    estilo_fonte = int(estilo.get("fontStyle") or 0)
+    return Forma(
+        id_celula, tipo, x, y, largura, altura, texto, preenchimento, borda,
+        float(estilo.get("strokeWidth") or 1),
+        cor_fonte,
+        float(tamanho_html.group(1) if tamanho_html else estilo.get("fontSize") or 12),
+        bool(estilo_fonte & 1), bool(estilo_fonte & 2),
+        estilo.get("align") or "center",
+        estilo.get("verticalAlign") or ("top" if tipo == "texto" and "edgeLabel" not in estilo else "middle"),
+        estilo.get("dashed") == "1",
+    )
+
+
+def _ponto_no_lado(forma, fx, fy):
+    return forma.x + forma.largura * fx, forma.y + forma.altura * fy
+
+
+def _lado_voltado_para(forma, alvo_x, alvo_y):
+    """Ponto médio do lado de `forma` voltado para o ponto alvo"""
+    cx, cy = forma.x + forma.largura / 2, forma.y + forma.altura / 2
+    dx, dy = alvo_x - cx, alvo_y - cy
+    if abs(dx) * forma.altura > abs(dy) * forma.largura:
+        return (1.0, 0.5) if dx > 0 else (0.0, 0.5)
+    return (0.5, 1.0) if dy > 0 else (0.5, 0.0)
+
+
+def _no_perimetro(forma, fx, fy):
+    """Projeta o ponto da caixa no contorno do losango ou da elipse, como o draw.io"""
+    dx, dy = fx - 0.5, fy - 0.5
+    if forma.tipo == "losango":
+        distancia = abs(dx) + abs(dy)
+    elif forma.tipo == "elipse":
+        distancia = (dx * dx + dy * dy) ** 0.5
+    else:
+        return fx, fy
+    fator = 0.5 / distancia if distancia else 0.0
+    return 0.5 + dx * fator, 0.5 + dy * fator
+
+
+def _extremidade(forma, estilo, prefixo, ponto, outro):
+    """Ponto (x, y) e índice do lado da extremidade de uma aresta"""
+    if forma is None:
+        return ponto, None
+    if f"{prefixo}X" in estilo and f"{prefixo}Y" in estilo:
+        fracao = (float(estilo[f"{prefixo}X"]), float(estilo[f"{prefixo}Y"]))
+        if estilo.get(f"{prefixo}Perimeter") != "0":
+            fracao = _no_perimetro(forma, *fracao)
+    else:
+        fracao = _lado_voltado_para(forma, *outro)
+    lado = LADOS.index(fracao) if fracao in LADOS else None
+    return _ponto_no_lado(forma, *fracao), lado
+
+
+def _centro(forma, ponto):
+    if forma is None:
+        return ponto
+    return forma.x + forma.largura / 2, forma.y + forma.altura / 2
+
+
+def ler_drawio(origem):
+    """Lê o diagrama (caminho ou arquivo) e retorna o `Diagrama` em pixels do draw.io"""
+    formas = {}
+    origens = {}  # posição absoluta de cada vértice, para os filhos com geometria relativa
+    arestas = []
+    rotulos = {}
+    grade = _Grade()
+    for celula, id_celula, rotulo in _celulas(origem):
+        estilo = _estilo(celula.get("style"))
+        geometria = celula.find("mxGeometry")
+        pai = celula.get("parent")
+        if celula.get("edge") == "1":
+            pontos = {p.get("as"): (_numero(p, "x"), _numero(p, "y")) for p in geometria.iter("mxPoint")} \
+                if geometria is not None else {}
+            arestas.append((id_celula, estilo, celula.get("source"), celula.get("target"), pontos, _texto(rotulo)))
+        elif celula.get("vertex") == "1" and geometria is not None:
+            if pai in origens:
+                dx, dy = origens[pai]
+            else:
+                dx = dy = 0.0
+            if "edgeLabel" in estilo:
+                # Rótulo filho de uma aresta: o texto vai para o conector
+                rotulos.setdefault(pai, []).append((_texto(rotulo), estilo))
+                continue
+            x, y = _numero(geometria, "x") + dx, _numero(geometria, "y") + dy
+            origens[id_celula] = (x, y)
+            forma = _forma(id_celula, rotulo, estilo, x, y, _numero(geometria, "width"), _numero(geometria, "height"))
+            fundo = forma.preenchimento or grade.fundo(x + forma.largura / 2, y + forma.altura / 2)
+            formas[id_celula] = forma = forma._replace(cor_fonte=_legivel(forma.cor_fonte, fundo))
+            if forma.preenchimento:
+                grade.inserir(forma)
+
+    conectores = []
+    for id_aresta, estilo, origem_id, destino_id, pontos, texto in arestas:
+        origem, destino = formas.get(origem_id), formas.get(destino_id)
+        inicio = pontos.get("sourcePoint", (0.0, 0.0))
+        fim = pontos.get("targetPoint", (0.0, 0.0))
+        (x1, y1), lado_origem = _extremidade(origem, estilo, "exit", inicio, _centro(destino, fim))
+        (x2, y2), lado_destino = _extremidade(destino, estilo, "entry", fim, _centro(origem, inicio))
+        fundo = grade.fundo((x1 + x2) / 2, (y1 + y2) / 2)
+        cor = _legivel(_cor(estilo.get("strokeColor"), "000000"), fundo)
+        filhos = rotulos.get(id_aresta, [])
+        texto = "\n".join([t for t in [texto] + [t for t, _ in filhos] if t])
+        estilo_rotulo = filhos[0][1] if filhos else estilo
+        cor_texto = _cor(estilo_rotulo.get("fontColor"), "000000")
+        conectores.append(Conector(
+            id_aresta, x1, y1, x2, y2,
+            origem_id if lado_origem is not None else None, lado_origem,
+            destino_id if lado_destino is not None else None, lado_destino,
+            estilo.get("edgeStyle") in ("orthogonalEdgeStyle", "elbowEdgeStyle"),
+            estilo.get("startArrow", "none") != "none",
+            estilo.get("endArrow", "classic") != "none",
+            cor, float(estilo.get("strokeWidth") or 1), estilo.get("dashed") == "1",
+            texto, _legivel(cor_texto, _cor(estilo_rotulo.get("labelBackgroundColor")) or fundo),
+            float(estilo_rotulo.get("fontSize") or 11),
+        ))
+
+    xs = [f.x for f in formas.values()] + [c.x1 for c in conectores] + [c.x2 for c in conectores]
+    ys = [f.y for f in formas.values()] + [c.y1 for c in conectores] + [c.y2 for c in conectores]
+    xs2 = [f.x + f.largura for f in formas.values()] + xs
+    ys2 = [f.y + f.altura for f in formas.values()] + ys
+    x0, y0 = min(xs, default=0.0), min(ys, default=0.0)
+    return Diagrama(list(formas.values()), conectores, x0, y0,
+                    max(xs2, default=1.0) - x0 or 1.0, max(ys2, default=1.0) - y0 or 1.0)
+
+
+# ==================== CACHE ====================
+
+class ConversorDrawio:
+    """Converte arquivos .drawio com cache pelo hash do conteúdo, em memória e opcionalmente em disco"""
+
+    def __init__(self, diretorio=None):
+        self.diretorio = diretorio
+        self._hashes = {}
+        self._diagramas = {}
+
+    def hash(self, caminho):
+        """Hash do conteúdo, recalculado só quando o arquivo muda"""
+        estado = os.stat(caminho)
+        marca = (estado.st_mtime_ns, estado.st_size)
+        anterior = self._hashes.get(caminho)
+        if anterior is None or anterior[0] != marca:
+            with open(caminho, "rb") as arquivo:
+                self._hashes[caminho] = (marca, hashlib.sha256(arquivo.read()).hexdigest())
+        return self._hashes[caminho][1]
+
+    def converter(self, caminho):
+        """Diagrama do arquivo, lido do cache quando o conteúdo não mudou"""
+        chave = f"{self.hash(caminho)}-{VERSAO_DRAWIO}"
+        memoria = self._diagramas
+        if chave in memoria:
+            memoria[chave] = memoria.pop(chave)
+        else:
+            memoria[chave] = self._ler_disco(chave) or self._converter(caminho, chave)
+            if len(memoria) > LIMITE_MEMORIA:
+                del memoria[next(iter(memoria))]
+        return memoria[chave]
+
+    def _converter(self, caminho, chave):
+        diagrama = ler_drawio(caminho)
+        self._gravar_disco(chave, diagrama)
+        return diagrama
+
+    def _caminho_disco(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.json")
+
+    def _ler_disco(self, chave):
+        """Diagrama guardado em disco, ou None (a entrada ilegível é convertida e regravada)"""
+        if not self.diretorio:
+            return None
+        try:
+            with open(self._caminho_disco(chave), encoding="utf-8") as arquivo:
+                dados = json.load(arquivo)
+            return Diagrama([Forma(*f) for f in dados["formas"]], [Conector(*c) for c in dados["conectores"]],
+                            *dados["caixa"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # Ausente, truncada (gravação interrompida) ou de outro formato: conta como falta
+            return None
+
+    def _gravar_disco(self, chave, diagrama):
+        if not self.diretorio:
+            return
+        os.makedirs(self.diretorio, exist_ok=True)
+        dados = {"formas": diagrama.formas, "conectores": diagrama.conectores, "caixa": diagrama[2:]}
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False)
+        os.replace(temporario, self._caminho_disco(chave))
+
+
+# Conversor compartilhado pelos renderizadores do processo
+CONVERSOR = ConversorDrawio()
+
+
+def usar_cache_em_disco(diretorio):
+    """Guarda os diagramas convertidos em `diretorio`/drawio"""
+    CONVERSOR.diretorio = os.path.join(diretorio, "drawio")
+
+
+# ==================== DESENHO ====================
+
+def _linha(linha, cor, espessura, tracejado):
+    if cor is None:
+        linha.fill.background()
+        return
+    linha.color.rgb = RGBColor.from_string(cor)
+    linha.width = Pt(espessura)
+    if tracejado:
+        linha.dash_style = MSO_LINE.DASH
+
+
+def _escrever(frame, texto, cor, tamanho, negrito=False, italico=False, alinhamento="center"):
+    frame.word_wrap = True
+    frame.margin_left = frame.margin_right = frame.margin_top = frame.margin_bottom = Inches(0.02)
+    for i, linha in enumerate(texto.split("\n")):
+        p = frame.paragraphs[0] if i == 0 else frame.add_paragraph()
+        p.alignment = ALINHAMENTOS.get(alinhamento, PP_ALIGN.CENTER)
+        run = p.add_run()
+        run.text = linha
+        fonte = run.font
+        fonte.size = Pt(tamanho)
+        fonte.bold = negrito
+        fonte.italic = italico
+        fonte.color.rgb = RGBColor.from_string(cor)
+
+
+def desenhar(slide, diagrama, caixa):
+    """Desenha o diagrama no slide, centralizado e proporcional dentro da caixa (polegadas)"""
+    x, y, largura, altura = caixa
+    escala = min(largura / diagrama.largura, altura / diagrama.altura)  # polegadas por pixel
+    x += (largura - diagrama.largura * escala) / 2
+    y += (altura - diagrama.altura * escala) / 2
+
+    def emu(px, origem, base):
+        return Emu(int(Inches(base + (px - origem) * escala)))
+
+    def pontos(px):
+        return max(px * escala * 72, 0.25)
+
+    def tamanho_fonte(px):
+        return max(round(pontos(px) * 2) / 2, 1)
+
+    # Sem o modo turbo cada forma nova varre todos os ids do slide (quadrático)
+    turbo = slide.shapes.turbo_add_enabled
+    slide.shapes.turbo_add_enabled = True
+    formas = {}
+    for forma in diagrama.formas:
+        posicao = (emu(forma.x, diagrama.x, x), emu(forma.y, diagrama.y, y),
+                   Emu(int(Inches(forma.largura * escala))), Emu(int(Inches(forma.altura * escala))))
+        if forma.tipo == "texto":
+            shape = slide.shapes.add_textbox(*posicao)
+        else:
+            shape = slide.shapes.add_shape(TIPOS_FORMA[forma.tipo], *posicao)
+            shape.shadow.inherit = False
+        if forma.preenchimento:
+            shape.fill.solid()
+            shape.fill.fore_color.rgb = RGBColor.from_string(forma.preenchimento)
+        else:
+            shape.fill.background()
+        _linha(shape.line, forma.borda, pontos(forma.espessura), forma.tracejado)
+        if forma.texto:
+            _escrever(shape.text_frame, forma.texto, forma.cor_fonte, tamanho_fonte(forma.tamanho_fonte),
+                      forma.negrito, forma.italico, forma.alinhamento)
+        shape.text_frame.vertical_anchor = ANCORAS.get(forma.alinhamento_vertical, MSO_ANCHOR.MIDDLE)
+        formas[forma.id] = shape
+
+    for conector in diagrama.conectores:
+        tipo = MSO_CONNECTOR.ELBOW if conector.cotovelo else MSO_CONNECTOR.STRAIGHT
+        x1, y1 = emu(conector.x1, diagrama.x, x), emu(conector.y1, diagrama.y, y)
+        x2, y2 = emu(conector.x2, diagrama.x, x), emu(conector.y2, diagrama.y, y)
+        shape = slide.shapes.add_connector(tipo, x1, y1, x2, y2)
+        if conector.origem in formas:
+            shape.begin_connect(formas[conector.origem], conector.lado_origem)
+        if conector.destino in formas:
+            shape.end_connect(formas[conector.destino], conector.lado_destino)
+        _linha(shape.line, conector.cor, pontos(conector.espessura), conector.tracejado)
+        ln = shape.line._get_or_add_ln()
+        if conector.seta_inicio:
+            ln.append(OxmlElement("a:headEnd", {"type": "triangle"}))
+        if conector.seta_fim:
+            ln.append(OxmlElement("a:tailEnd", {"type": "triangle"}))
+        if conector.texto:
+            tamanho = tamanho_fonte(conector.tamanho_fonte)
+            larg, alt = Inches(1.6), Pt(tamanho * 1.4 * (conector.texto.count("\n") + 1))
+            rotulo = slide.shapes.add_textbox((x1 + x2 - larg) // 2, (y1 + y2 - alt) // 2, larg, alt)
+            _escrever(rotulo.text_frame, conector.texto, conector.cor_texto, tamanho)
+    slide.shapes.turbo_add_enabled = turbo
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Emissor direto do XML dos slides de texto
+
+Para slides só com título e caixas de texto (sem tabela, gráfico, diagrama
+ou imagem), o <p:sld> é escrito como bytes a partir do modelo
+intermediário, sem criar as formas do python-pptx. Os pedaços fixos são
+serializados pelo lxml uma vez e reaproveitados:
+
+    molde do layout   o slide vazio com os placeholders clonados pelo
+                      python-pptx, cortado antes e depois dos parágrafos
+                      do título e no fim da árvore de formas
+    <a:pPr>           o estilo compilado de cada parágrafo (`compilar_estilo`)
+
+A saída é idêntica, byte a byte, à do caminho pelo python-pptx.
+`ParteSerializada` guarda esses bytes como parte do pacote e só
+interpreta o XML se alguém pedir o slide; relações e content types
+continuam com o python-pptx (ver `renderizadores.acrescentar_xml`).
+"""
+
+import re
+import weakref
+from collections import namedtuple
+from functools import cached_property, lru_cache
+
+from lxml import etree
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import Part
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.oxml.slide import CT_Slide
+from pptx.parts.slide import SlidePart
+from pptx.shapes.shapetree import SlideShapes
+from pptx.util import Inches
+
+from .estilos import compilar_estilo
+from .modelo import escapar, trechos
+
+# Pedaços do slide vazio de um layout; `paragrafos_titulo` é None se o layout não tem título
+Molde = namedtuple("Molde", "inicio paragrafos_titulo meio fim proximo_id")
+
+_MARCA = b"<!--%s-->"
+_XMLNS = re.compile(rb' xmlns:\w+="[^"]*"')
+
+_moldes = weakref.WeakKeyDictionary()
+
+
+class ParteSerializada(SlidePart):
+    """Parte de slide guardada já serializada; o XML só é interpretado se for usado"""
+
+    def __init__(self, partname, package, xml):
+        Part.__init__(self, partname, CT.PML_SLIDE, package)
+        self._xml = xml
+
+    @cached_property
+    def _element(self):
+        return parse_xml(self._xml)
+
+    @property
+    def blob(self):
+        if "_element" in self.__dict__:
+            return serialize_part_xml(self._element)
+        return self._xml
+
+
+def molde(layout):
+    """Molde do slide vazio do layout, com os placeholders que o python-pptx clonaria"""
+    parte = layout.part
+    if parte not in _moldes:
+        sld = CT_Slide.new()
+        formas = SlideShapes(sld.cSld.spTree, None)
+        formas.clone_layout_placeholders(layout)
+        titulo = formas.title
+        if titulo is not None:
+            corpo = titulo._element.txBody
+            paragrafos = corpo.findall(qn("a:p"))
+            paragrafos[0].addprevious(etree.Comment("titulo"))
+            paragrafos[-1].addnext(etree.Comment("fim_titulo"))
+        sld.cSld.spTree.append(etree.Comment("caixas"))
+        antes, fim = serialize_part_xml(sld).split(_MARCA % b"caixas")
+        if titulo is None:
+            _moldes[parte] = Molde(antes, None, b"", fim, formas._next_shape_id)
+        else:
+            inicio, resto = antes.split(_MARCA % b"titulo")
+            vazios, meio = resto.split(_MARCA % b"fim_titulo")
+            _moldes[parte] = Molde(inicio, vazios, meio, fim, formas._next_shape_id)
+    return _moldes[parte]
+
+
+@lru_cache(maxsize=1024)
+def _ppr(est):
+    """<a:pPr> compilado do estilo, sem as declarações de namespace (já estão no <p:sld>)"""
+    return _XMLNS.sub(b"", etree.tostring(compilar_estilo(est)))
+
+
+def _texto(trecho):
+    # Mesmo escape do libxml2 para o conteúdo de <a:t>
+    texto = escapar(trecho).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return texto.encode("utf-8")
+
+
+def _quadro(partes, quadro):
+    for paragrafo in quadro.paragrafos:
+        conteudo = []
+        if paragrafo.estilo is not None:
+            conteudo.append(_ppr(paragrafo.estilo))
+        for i, trecho in enumerate(trechos(paragrafo.texto)):
+            if i:
+                conteudo.append(b"<a:br/>")
+            if trecho:
+                conteudo += (b"<a:r><a:t>", _texto(trecho), b"</a:t></a:r>")
+        if conteudo:
+            partes += (b"<a:p>", *conteudo, b"</a:p>")
+        else:
+            partes.append(b"<a:p/>")
+
+
+def _caixa(partes, caixa, id_):
+    x, y, largura, altura = (Inches(v) for v in caixa.posicao)
+    partes.append(
+        b'<p:sp><p:nvSpPr><p:cNvPr id="%d" name="TextBox %d"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+        b'<p:spPr><a:xfrm><a:off x="%d" y="%d"/><a:ext cx="%d" cy="%d"/></a:xfrm>'
+        b'<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        b'<p:txBody><a:bodyPr wrap="%s"><a:spAutoFit/></a:bodyPr><a:lstStyle/>'
+        % (id_, id_ - 1, x, y, largura, altura, b"square" if caixa.quadro.quebra else b"none"))
+    _quadro(partes, caixa.quadro)
+    partes.append(b"</p:txBody></p:sp>")
+
+
+def emitir_slide(modelo, layout):
+    """XML serializado do slide de texto `modelo` (título e caixas) sobre o layout"""
+    m = molde(layout)
+    partes = [m.inicio]
+    if m.paragrafos_titulo is not None:
+        if modelo.titulo is None:
+            partes.append(m.paragrafos_titulo)
+        else:
+            _quadro(partes, modelo.titulo)
+    partes.append(m.meio)
+    for id_, caixa in enumerate(modelo.caixas, m.proximo_id):
+        _caixa(partes, caixa, id_)
+    partes.append(m.fim)
+    return b"".join(partes)
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+Slides do modelo de dados gerados a partir do esquema do banco
+
+Fontes:
+
+- `lucidchart-import/schema.sql`: CREATE TABLE com colunas, tipos, chaves
+  e REFERENCES, mais os COMMENT ON TABLE usados como descrição;
+- `DB.csv`: exportação de colunas e restrições do Supabase (formato do
+  Lucidchart). Linhas sem tabela (restrições de esquemas sem permissão de
+  leitura) só são contadas. Nas linhas FOREIGN KEY a tabela/coluna é a
+  referenciada, então elas contam referências recebidas, não chaves;
+- `lucidchart-import/vivafit_seniors.json`: tabelas, campos e cores para o
+  diagrama entidade-relacionamento;
+- `lucidchart-import/relationships.csv`: relacionamentos com rótulo e
+  cardinalidades (sem ele, as chaves estrangeiras fazem esse papel).
+
+O SQL e os CSVs são lidos linha a linha numa única passada. As tabelas
+ficam num dict pelo nome (e as colunas num dict por tabela), então cada
+coluna, restrição e referência é resolvida em O(1), sem buscas lineares.
+"""
+
+import csv
+import json
+import re
+from collections import Counter, namedtuple
+
+from .i18n import marcar, traduzir
+
+# Palavras que encerram o tipo numa definição de coluna
+_FIM_DO_TIPO = re.compile(
+    r"\s+(?:PRIMARY|NOT|NULL|UNIQUE|REFERENCES|DEFAULT|CHECK|CONSTRAINT|GENERATED|COLLATE)\b", re.I
+)
+_CREATE_TABLE = re.compile(r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w.\"]+)", re.I)
+_COMMENT_ON = re.compile(r"^\s*COMMENT\s+ON\s+TABLE\s+([\w.\"]+)\s+IS\s+'((?:[^']|'')*)'", re.I)
+_REFERENCES = re.compile(r"REFERENCES\s+([\w.\"]+)\s*\(\s*([\w\"]+)\s*\)", re.I)
+_LISTA = re.compile(r"\(([^)]*)\)")
+
+CABECALHO = [marcar("Coluna"), marcar("Tipo"), marcar("Chaves")]
+LARGURAS = (2.6, 3.0, 3.4)
+
+# Relacionamento do diagrama ER: `origem` é o lado 1, `destino` o lado N
+Relacionamento = namedtuple("Relacionamento", "origem destino rotulo cardinalidade_origem cardinalidade_destino")
+
+
+def nome_tabela(nome, esquema=None):
+    """Nome canônico: sem aspas e sem o prefixo do esquema public"""
+    nome = nome.replace('"', "")
+    if esquema and esquema != "public":
+        nome = f"{esquema}.{nome}"
+    return nome[len("public."):] if nome.startswith("public.") else nome
+
+
+def _nomes(texto):
+    return [nome.strip().strip('"') for nome in texto.split(",")]
+
+
+class Coluna:
+    """Coluna de uma tabela com suas restrições"""
+
+    def __init__(self, nome, tipo=""):
+        self.nome = nome
+        self.tipo = tipo
+        self.primaria = False
+        self.unica = None  # "UNIQUE" ou "UNIQUE (a, b)" para restrição composta
+        self.obrigatoria = False
+        self.referencia = None  # (tabela, coluna)
+
+    def chaves(self):
+        """Texto da coluna "Chaves" da tabela do slide"""
+        partes = []
+        if self.primaria:
+            partes.append("PK")
+        if self.referencia:
+            partes.append("FK → {}.{}".format(*self.referencia))
+        if self.unica:
+            partes.append(self.unica)
+        if self.obrigatoria and not self.primaria:
+            partes.append("NOT NULL")
+        return ", ".join(partes)
+
+
+class Tabela:
+    """Tabela com colunas indexadas pelo nome, na ordem de declaração"""
+
+    def __init__(self, nome):
+        self.nome = nome
+        self.descricao = ""
+        self.colunas = {}
+        self.referenciada = 0
+        self.cor = None  # fundo no diagrama ER ("RRGGBB")
+
+    def coluna(self, nome, tipo=""):
+        """Coluna pelo nome, criada se ainda não existir"""
+        coluna = self.colunas.get(nome)
+        if coluna is None:
+            coluna = self.colunas[nome] = Coluna(nome, tipo)
+        elif tipo and not coluna.tipo:
+            coluna.tipo = tipo
+        return coluna
+
+
+class Esquema:
+    """Tabelas indexadas pelo nome canônico"""
+
+    def __init__(self):
+        self.tabelas = {}
+        self.sem_tabela = Counter()
+
+    def tabela(self, nome):
+        """Tabela pelo nome, criada se ainda não existir"""
+        tabela = self.tabelas.get(nome)
+        if tabela is None:
+            tabela = self.tabelas[nome] = Tabela(nome)
+        return tabela
+
+    def relacoes(self):
+        """Chaves estrangeiras (origem, coluna, destino, coluna_destino, resolvida)"""
+        for tabela in self.tabelas.values():
+            for coluna in tabela.colunas.values():
+                if coluna.referencia:
+                    destino, coluna_destino = coluna.referencia
+                    alvo = self.tabelas.get(destino)
+                    resolvida = alvo is not None and coluna_destino in alvo.colunas
+                    yield tabela.nome, coluna.nome, destino, coluna_destino, resolvida
+
+    def relacionamentos(self):
+        """Relacionamentos derivados das chaves estrangeiras (1:1 quando a coluna é única)"""
+        for origem, coluna, destino, _, _ in self.relacoes():
+            unica = self.tabelas[origem].colunas[coluna].unica
+            yield Relacionamento(destino, origem, coluna, "1", "1" if unica else "N")
+
+
+# ==================== SCHEMA.SQL ====================
+
+def _sem_comentario(linha, aspas=None):
+    """Linha sem o comentário --, que não vale dentro de '...' e "..."
+
+    `aspas` é a aspa de um literal aberto numa linha anterior; retorna a
+    linha e a aspa ainda aberta no fim dela.
+    """
+    for i, caractere in enumerate(linha):
+        if aspas:
+            if caractere == aspas:
+                aspas = None
+        elif caractere in "'\"":
+            aspas = caractere
+        elif linha.startswith("--", i):
+            return linha[:i], aspas
+    return linha, aspas
+
+
+def _fora_de_aspas(texto, aspas=None):
+    """(posição, caractere) de `texto` fora dos literais '...' e identificadores "..." """
+    for i, caractere in enumerate(texto):
+        if aspas:
+            if caractere == aspas:
+                aspas = None
+        elif caractere in "'\"":
+            aspas = caractere
+        else:
+            yield i, caractere
+
+
+def _definicoes(corpo):
+    """Divide o corpo do CREATE TABLE nas vírgulas de nível zero"""
+    profundidade, inicio = 0, 0
+    for i, caractere in _fora_de_aspas(corpo):
+        if caractere == "(":
+            profundidade += 1
+        elif caractere == ")":
+            profundidade -= 1
+        elif caractere == "," and profundidade == 0:
+            yield corpo[inicio:i].strip()
+            inicio = i + 1
+    if corpo[inicio:].strip():
+        yield corpo[inicio:].strip()
+
+
+def _referencia(texto):
+    encontrada = _REFERENCES.search(texto)
+    if encontrada:
+        return nome_tabela(encontrada.group(1)), encontrada.group(2).strip('"')
+    return None
+
+
+def _restricao_de_tabela(tabela, definicao):
+    """PRIMARY KEY / UNIQUE / FOREIGN KEY declarados no nível da tabela"""
+    maiusculas = definicao.upper()
+    if maiusculas.startswith("CONSTRAINT"):
+        definicao = definicao.split(None, 2)[2]
+        maiusculas = definicao.upper()
+    lista = _LISTA.search(definicao)
+    if lista is None:
+        return
+    nomes = _nomes(lista.group(1))
+    if maiusculas.startswith("PRIMARY KEY"):
+        for nome in nomes:
+            coluna = tabela.coluna(nome)
+            coluna.primaria = coluna.obrigatoria = True
+    elif maiusculas.startswith("UNIQUE"):
+        rotulo = "UNIQUE" if len(nomes) == 1 else f"UNIQUE ({', '.join(nomes)})"
+        for nome in nomes:
+            tabela.coluna(nome).unica = rotulo
+    elif maiusculas.startswith("FOREIGN KEY"):
+        referencia = _referencia(definicao)
+        if referencia and len(nomes) == 1:
+            tabela.coluna(nomes[0]).referencia = referencia
+
+
+def _coluna_sql(tabela, definicao):
+    if definicao.startswith('"'):
+        fim = definicao.index('"', 1) + 1
+        nome, resto = definicao[:fim], definicao[fim:].strip()
+    else:
+        nome, _, resto = definicao.partition(" ")
+    fim = _FIM_DO_TIPO.search(" " + resto)
+    tipo = (resto[:fim.start()] if fim else resto).strip()
+    coluna = tabela.coluna(nome.strip('"'), tipo)
+    maiusculas = resto.upper()
+    if "PRIMARY KEY" in maiusculas:
+        coluna.primaria = coluna.obrigatoria = True
+    if re.search(r"\bUNIQUE\b", maiusculas):
+        coluna.unica = "UNIQUE"
+    if "NOT NULL" in maiusculas:
+        coluna.obrigatoria = True
+    coluna.referencia = _referencia(resto) or coluna.referencia
+
+
+def _definicao(tabela, definicao):
+    primeira = definicao.split(None, 1)[0].upper()
+    if primeira in ("CONSTRAINT", "PRIMARY", "UNIQUE", "FOREIGN", "CHECK", "EXCLUDE"):
+        _restricao_de_tabela(tabela, definicao)
+    else:
+        _coluna_sql(tabela, definicao)
+
+
+def ler_schema_sql(caminho, esquema=None):
+    """Lê CREATE TABLE e COMMENT ON TABLE do arquivo SQL para o `esquema`
+
+    O parêntese que abre a tabela pode vir em outra linha; parênteses e --
+    dentro de literais ('...') e identificadores ("...") são ignorados.
+    """
+    esquema = esquema or Esquema()
+    nome = tabela = None
+    corpo = []
+    profundidade = 0
+    aspas = None
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            aspas_no_inicio = aspas
+            linha, aspas = _sem_comentario(linha, aspas)
+            if nome is None and tabela is None:
+                criacao = _CREATE_TABLE.match(linha) if aspas_no_inicio is None else None
+                if criacao:
+                    nome = nome_tabela(criacao.group(1))
+                    linha = linha[criacao.end():]
+                else:
+                    comentario = _COMMENT_ON.match(linha) if aspas_no_inicio is None else None
+                    if comentario:
+                        descricao = comentario.group(2).replace("''", "'")
+                        esquema.tabela(nome_tabela(comentario.group(1))).descricao = descricao
+                    continue
+            inicio = 0
+            for i, caractere in _fora_de_aspas(linha, aspas_no_inicio):
+                if tabela is None:
+                    # Entre o nome e o parêntese que abre a tabela só pode haver espaço
+                    if caractere == "(":
+                        tabela, profundidade, inicio = esquema.tabela(nome), 1, i + 1
+                    elif not caractere.isspace():
+                        nome = None  # CREATE TABLE ... AS / PARTITION OF: sem colunas
+                        break
+                    continue
+                profundidade += caractere == "("
+                profundidade -= caractere == ")"
+                if profundidade == 0:
+                    corpo.append(linha[inicio:i])
+                    for definicao in _definicoes("".join(corpo)):
+                        _definicao(tabela, definicao)
+                    nome = tabela = None
+                    corpo = []
+                    break
+            else:
+                if tabela is not None:
+                    corpo.append(linha[inicio:])
+    if tabela is not None:
+        raise ValueError(f"{caminho}: CREATE TABLE {tabela.nome} sem o parêntese que fecha a tabela")
+    return esquema
+
+
+# ==================== DB.CSV ====================
+
+def _tipo_csv(linha):
+    tipo = linha["data_type"]
+    tamanho = linha["character_maximum_length"]
+    return f"{tipo}({tamanho})" if tamanho not in ("", "null") else tipo
+
+
+def ler_db_csv(caminho, esquema=None, esquemas=("public",)):
+    """Complementa o `esquema` com a exportação de colunas do banco
+
+    Tabelas que ainda não existem no esquema só são criadas se forem de
+    um dos `esquemas` do banco (por padrão só o public).
+    """
+    esquema = esquema or Esquema()
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        for linha in csv.DictReader(arquivo):
+            restricao = linha["constraint_type"]
+            if "null" in (linha["table_name"], linha["column_name"]):
+                esquema.sem_tabela[restricao] += 1
+                continue
+            nome = nome_tabela(linha["table_name"], linha["table_schema"])
+            tabela = esquema.tabelas.get(nome)
+            if tabela is None:
+                if linha["table_schema"] not in esquemas:
+                    continue
+                tabela = esquema.tabela(nome)
+            coluna = tabela.coluna(linha["column_name"], _tipo_csv(linha))
+            if restricao == "PRIMARY KEY":
+                coluna.primaria = coluna.obrigatoria = True
+            elif restricao == "UNIQUE":
+                coluna.unica = coluna.unica or "UNIQUE"
+            elif restricao == "FOREIGN KEY":
+                tabela.referenciada += 1
+    return esquema
+
+
+# ==================== LUCIDCHART ====================
+
+def ler_lucidchart_json(caminho, esquema=None):
+    """Lê tabelas, campos, notas e cores da exportação JSON do Lucidchart"""
+    esquema = esquema or Esquema()
+    with open(caminho, encoding="utf-8") as arquivo:
+        dados = json.load(arquivo)
+    for item in dados["tables"]:
+        tabela = esquema.tabela(nome_tabela(item["name"]))
+        tabela.descricao = tabela.descricao or item.get("note", "")
+        if item.get("color"):
+            tabela.cor = item["color"].lstrip("#").upper()
+        for campo in item.get("fields", ()):
+            coluna = tabela.coluna(campo["name"], campo.get("type", ""))
+            coluna.primaria = coluna.primaria or bool(campo.get("pk"))
+            coluna.obrigatoria = coluna.obrigatoria or coluna.primaria or bool(campo.get("required"))
+            if campo.get("unique"):
+                coluna.unica = coluna.unica or "UNIQUE"
+            if campo.get("fk"):
+                destino, _, coluna_destino = campo["fk"].rpartition(".")
+                coluna.referencia = (nome_tabela(destino), coluna_destino)
+    return esquema
+
+
+def ler_relacionamentos_csv(caminho):
+    """Relacionamentos do relationships.csv (nomes de tabela em caixa alta no arquivo)"""
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        return [
+            Relacionamento(nome_tabela(linha["Source"].lower()), nome_tabela(linha["Destination"].lower()),
+                           linha["Label"], linha["Source Cardinality"], linha["Destination Cardinality"])
+            for linha in csv.DictReader(arquivo)
+        ]
+
+
+def carregar_esquema(schema_sql=None, db_csv=None):
+    """Esquema a partir do SQL e/ou da exportação CSV"""
+    esquema = Esquema()
+    if schema_sql:
+        ler_schema_sql(schema_sql, esquema)
+    if db_csv:
+        ler_db_csv(db_csv, esquema)
+    return esquema
+
+
+# ==================== SLIDES ====================
+
+def slide_visao_geral(esquema, titulo=marcar("MODELO DE DADOS")):
+    """Slide com as tabelas, suas descrições e o total de relacionamentos"""
+    pares = []
+    for tabela in esquema.tabelas.values():
+        chaves = sum(1 for coluna in tabela.colunas.values() if coluna.referencia)
+        desc = traduzir("{colunas} colunas, {chaves} chaves estrangeiras").format(colunas=len(tabela.colunas),
+                                                                                   chaves=chaves)
+        if tabela.descricao:
+            desc = f"{tabela.descricao} ({desc})"
+        pares.append((tabela.nome, desc))
+    return {
+        "nome": "esquema",
+        "tipo": "conteudo",
+        "titulo": traduzir(titulo),
+        "blocos": [
+            ("pares", pares, {"titulo": {"tamanho": 16, "espaco_depois": 2},
+                              "desc": {"espaco_depois": 6}}),
+        ],
+    }
+
+
+def slides_tabelas(esquema, linhas_por_slide=10):
+    """Um slide de tabela por tabela do esquema, paginado a cada `linhas_por_slide` colunas"""
+    slides = []
+    for tabela in esquema.tabelas.values():
+        linhas = [[c.nome, c.tipo, c.chaves()] for c in tabela.colunas.values()]
+        paginas = max(1, -(-len(linhas) // linhas_por_slide))
+        for pagina in range(paginas):
+            sufixo = f" ({pagina + 1}/{paginas})" if paginas > 1 else ""
+            slides.append({
+                "nome": f"esquema_{tabela.nome}" + (f"_{pagina + 1}" if pagina else ""),
+                "tipo": "tabela",
+                "titulo": traduzir("TABELA {tabela}").format(tabela=tabela.nome) + sufixo,
+                "tamanho_titulo": 28,
+                "descricao": tabela.descricao,
+                "cabecalho": [traduzir(texto) for texto in CABECALHO],
+                "larguras": LARGURAS,
+                "linhas": linhas[pagina * linhas_por_slide:(pagina + 1) * linhas_por_slide],
+            })
+    return slides
+
+
+def slides_esquema(esquema, linhas_por_slide=10):
+    """Visão geral seguida dos slides de cada tabela"""
+    return [slide_visao_geral(esquema)] + slides_tabelas(esquema, linhas_por_slide)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Estilos de parágrafo e temas da apresentação
+
+Cada estilo é compilado uma única vez em um fragmento <a:pPr> e depois
+copiado para cada parágrafo, em vez de repetir os setters do python-pptx.
+
+Os estilos citam cores por papel ("primaria", "texto"...); `estilo` resolve
+o papel e o tamanho pelo tema ativo (ver `usar_tema`), então trocar de
+tema não muda a especificação dos slides nem a tabela ESTILOS.
+"""
+
+import copy
+from collections import namedtuple
+from functools import lru_cache
+
+from pptx.dml.color import RGBColor
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.text.text import _Paragraph
+from pptx.util import Pt
+
+# Cores do tema padrão
+COR_PRIMARIA = RGBColor(14, 165, 163)  # #0ea5a3 (teal)
+COR_TEXTO = RGBColor(51, 51, 51)
+COR_SECUNDARIA = RGBColor(102, 102, 102)
+COR_CLARA = RGBColor(255, 255, 255)
+
+
+class Tema(namedtuple("Tema", "primaria texto secundaria clara fator_fonte", defaults=(1,))):
+    """Cor de cada papel e fator aplicado aos tamanhos de fonte"""
+
+    __slots__ = ()
+
+    def tamanho(self, pontos):
+        """Tamanho em pontos no tema, arredondado para meio ponto"""
+        return round(pontos * self.fator_fonte * 2) / 2
+
+
+TEMAS = {
+    "padrao": Tema(COR_PRIMARIA, COR_TEXTO, COR_SECUNDARIA, COR_CLARA),
+    # Contraste de pelo menos 7:1 sobre o branco (WCAG AAA) e fontes maiores, para leitura por idosos
+    "alto_contraste": Tema(RGBColor(0, 95, 94), RGBColor(0, 0, 0), RGBColor(51, 51, 51), COR_CLARA, 1.15),
+}
+PAPEIS = Tema._fields[:-1]
+
+_tema = {"atual": TEMAS["padrao"]}
+
+
+def usar_tema(tema):
+    """Ativa o tema (nome em TEMAS ou Tema) para os próximos slides"""
+    _tema["atual"] = TEMAS[tema] if isinstance(tema, str) else tema
+
+
+def tema_atual():
+    return _tema["atual"]
+
+ALINHAMENTOS = {
+    "esquerda": PP_ALIGN.LEFT,
+    "centro": PP_ALIGN.CENTER,
+    "direita": PP_ALIGN.RIGHT,
+    "justificado": PP_ALIGN.JUSTIFY,
+}
+
+Estilo = namedtuple(
+    "Estilo",
+    "tamanho negrito italico cor nivel espaco_depois alinhamento",
+    defaults=(None, None, None, None, 0, None, None),
+)
+
+ESTILOS = {
+    "titulo": Estilo(tamanho=40, cor="primaria"),
+    "secao": Estilo(tamanho=22, negrito=True, cor="primaria", espaco_depois=10),
+    "texto": Estilo(tamanho=18, cor="texto", espaco_depois=20),
+    "marcador": Estilo(tamanho=16, cor="texto", nivel=1, espaco_depois=6),
+    "item_titulo": Estilo(tamanho=18, negrito=True, cor="primaria", espaco_depois=4),
+    "item_desc": Estilo(tamanho=14, cor="texto", nivel=1, espaco_depois=10),
+    "autores": Estilo(tamanho=14, italico=True, cor="secundaria", nivel=1, espaco_depois=2),
+    "nota": Estilo(tamanho=14, italico=True, cor="secundaria", alinhamento="centro"),
+    "citacao": Estilo(tamanho=16, italico=True, cor="texto", nivel=1, espaco_depois=12),
+    "legenda": Estilo(tamanho=12, cor="secundaria", alinhamento="centro"),
+    "espaco": Estilo(espaco_depois=8),
+    # Slides de abertura e encerramento
+    "destaque": Estilo(tamanho=48, negrito=True, cor="primaria", alinhamento="centro"),
+    "subtitulo": Estilo(tamanho=24, cor="texto", alinhamento="centro"),
+    "rodape": Estilo(tamanho=18, cor="secundaria", alinhamento="centro"),
+    # Tabelas
+    "cabecalho_tabela": Estilo(tamanho=14, negrito=True, cor="clara"),
+    "celula": Estilo(tamanho=12, cor="texto"),
+}
+
+
+def estilo(nome, **ajustes):
+    """Retorna o estilo nomeado com os ajustes informados, resolvido pelo tema ativo"""
+    base = ESTILOS[nome]
+    return resolver(base._replace(**ajustes) if ajustes else base, _tema["atual"])
+
+
+@lru_cache(maxsize=1024)
+def escalar(est, fator):
+    """Estilo com tamanho e espaçamento multiplicados por `fator` (em meios pontos)"""
+    def meio_ponto(valor):
+        return None if valor is None else round(valor * fator * 2) / 2
+    return est._replace(tamanho=meio_ponto(est.tamanho), espaco_depois=meio_ponto(est.espaco_depois))
+
+
+@lru_cache(maxsize=1024)
+def resolver(est, tema):
+    """Estilo com o papel de cor trocado pela cor do tema e o tamanho pelo fator do tema"""
+    if est.cor in PAPEIS:
+        est = est._replace(cor=getattr(tema, est.cor))
+    return escalar(est, tema.fator_fonte) if tema.fator_fonte != 1 else est
+
+
+_PPR = qn("a:pPr")
+
+
+def aplicar_estilo_setters(p, est):
+    """Aplica o estilo ao <a:p> propriedade a propriedade (caminho original do python-pptx)"""
+    p = _Paragraph(p, None)
+    if est.tamanho is not None:
+        p.font.size = Pt(est.tamanho)
+    if est.negrito is not None:
+        p.font.bold = est.negrito
+    if est.italico is not None:
+        p.font.italic = est.italico
+    if est.cor is not None:
+        p.font.color.rgb = est.cor
+    if est.nivel:
+        p.level = est.nivel
+    if est.espaco_depois is not None:
+        p.space_after = Pt(est.espaco_depois)
+    if est.alinhamento is not None:
+        p.alignment = ALINHAMENTOS[est.alinhamento]
+
+
+@lru_cache(maxsize=1024)
+def compilar_estilo(est):
+    """Compila o estilo em um elemento <a:pPr> reutilizável"""
+    p = OxmlElement("a:p")
+    aplicar_estilo_setters(p, est)
+    return p.get_or_add_pPr()
+
+
+def aplicar_estilo(p, est):
+    """Aplica o estilo ao <a:p> copiando o <a:pPr> pré-compilado"""
+    anterior = p.find(_PPR)
+    if anterior is not None:
+        p.remove(anterior)
+    p.insert(0, copy.deepcopy(compilar_estilo(est)))
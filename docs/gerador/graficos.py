@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Gráficos nativos do PowerPoint (partes de gráfico com a planilha embutida)
+
+    {"tipo": "colunas", "categorias": ["Seg", "Ter"], "series": [("Treinos", [12, 9])]}
+    {"tipo": "barras", ...}                         (mesmo formato, barras horizontais)
+    {"tipo": "linhas", "categorias": [...], "series": [...], "pontos": 500}
+    {"tipo": "histograma", "valores": [...], "n_faixas": 20}
+    {"tipo": "histograma", "faixas": [(0, 10, 120), (10, 20, 45), (20, None, 3)]}
+
+Opções comuns: "eixo_x" e "eixo_y" (títulos dos eixos), "espacamento" (vão
+entre colunas em % da largura), "formato" (formato numérico do Excel, como
+"0.0"), "formato_categorias" (formato das categorias; com datas, como
+"dd/mm/yy", o eixo vira eixo de datas) e "rotulos" (valores sobre as
+colunas ou barras).
+
+Linhas mais longas que "pontos" (padrão PONTOS_MAXIMOS; 0 desliga) e
+histogramas de valores brutos passam pela pré-agregação de `agregacao`
+antes de chegar à planilha embutida. A planilha é gravada com data de
+criação fixa (DATA_PLANILHA), então o mesmo gráfico gera os mesmos bytes.
+"""
+
+import datetime
+
+from pptx.chart.data import CategoryChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_MARKER_STYLE
+from pptx.util import Inches, Pt, lazyproperty
+
+from .agregacao import PONTOS_MAXIMOS, contar_faixas, reduzir_series, rotulo_faixa
+from .estilos import tema_atual
+from .i18n import traduzir
+
+TIPOS_GRAFICO = {
+    "colunas": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "barras": XL_CHART_TYPE.BAR_CLUSTERED,
+    "linhas": XL_CHART_TYPE.LINE,
+    "histograma": XL_CHART_TYPE.COLUMN_CLUSTERED,
+}
+
+# Data de criação da planilha embutida (o XlsxWriter usaria o horário atual)
+DATA_PLANILHA = datetime.datetime(1980, 1, 1, tzinfo=datetime.timezone.utc)
+
+# Papéis do tema usados nas séries, em ordem
+PAPEIS_SERIES = ("primaria", "secundaria")
+TAMANHO_FONTE = 12
+ESPESSURA_LINHA = 2.25
+# Vão entre as colunas do histograma, em % da largura da coluna
+ESPACAMENTO_HISTOGRAMA = 10
+
+
+class _Planilha(CategoryWorkbookWriter):
+    """Planilha do gráfico com a data de criação em DATA_PLANILHA"""
+
+    def _populate_worksheet(self, workbook, worksheet):
+        workbook.set_properties({"created": DATA_PLANILHA})
+        super()._populate_worksheet(workbook, worksheet)
+
+
+class _DadosGrafico(CategoryChartData):
+    @lazyproperty
+    def _workbook_writer(self):
+        return _Planilha(self)
+
+
+def preparar(grafico):
+    """Categorias e séries do gráfico já agregadas para a planilha embutida"""
+    tipo = grafico.get("tipo", "colunas")
+    if tipo == "histograma":
+        faixas = grafico.get("faixas")
+        if faixas is None or isinstance(faixas, int):
+            faixas = contar_faixas(grafico["valores"], faixas or grafico.get("n_faixas", 20))
+        nome = grafico.get("eixo_y") or traduzir("Contagem")
+        return [rotulo_faixa(inicio, fim) for inicio, fim, _ in faixas], [(nome, [c for _, _, c in faixas])]
+    if tipo == "linhas":
+        return reduzir_series(grafico["categorias"], grafico["series"], grafico.get("pontos", PONTOS_MAXIMOS))
+    return grafico["categorias"], grafico["series"]
+
+
+def _titulo_eixo(eixo, texto, tema):
+    eixo.has_title = True
+    eixo.axis_title.text_frame.text = texto
+    fonte = eixo.axis_title.text_frame.paragraphs[0].runs[0].font
+    fonte.size = Pt(tema.tamanho(TAMANHO_FONTE))
+    fonte.bold = False
+    fonte.color.rgb = tema.texto
+
+
+def _estilizar_series(plot, tipo, tema):
+    for i, serie in enumerate(plot.series):
+        cor = getattr(tema, PAPEIS_SERIES[i % len(PAPEIS_SERIES)])
+        if tipo == "linhas":
+            serie.format.line.color.rgb = cor
+            serie.format.line.width = Pt(ESPESSURA_LINHA)
+            serie.marker.style = XL_MARKER_STYLE.NONE
+            serie.smooth = False
+        else:
+            serie.format.fill.solid()
+            serie.format.fill.fore_color.rgb = cor
+
+
+def adicionar_grafico(slide, grafico, caixa):
+    """Adiciona o gráfico descrito por `grafico` na caixa (polegadas); retorna o gráfico
+
+    Sem categorias (um log sem amostras, por exemplo) nada é adicionado e
+    o retorno é None: o python-pptx não gera gráficos vazios.
+    """
+    tipo = grafico.get("tipo", "colunas")
+    tema = tema_atual()
+    categorias, series = preparar(grafico)
+    if not len(categorias):
+        return None
+    dados = _DadosGrafico(number_format=grafico.get("formato", "General"))
+    dados.categories = categorias
+    if grafico.get("formato_categorias"):
+        dados.categories.number_format = grafico["formato_categorias"]
+    for nome, valores in series:
+        dados.add_series(nome, valores)
+    chart = slide.shapes.add_chart(TIPOS_GRAFICO[tipo], *(Inches(v) for v in caixa), dados).chart
+
+    chart.font.size = Pt(tema.tamanho(TAMANHO_FONTE))
+    chart.font.color.rgb = tema.texto
+    chart.has_legend = len(series) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    plot = chart.plots[0]
+    if tipo != "linhas":
+        espacamento = ESPACAMENTO_HISTOGRAMA if tipo == "histograma" else None
+        if grafico.get("espacamento", espacamento) is not None:
+            plot.gap_width = grafico.get("espacamento", espacamento)
+    if grafico.get("rotulos"):
+        plot.has_data_labels = True
+        plot.data_labels.number_format = grafico.get("formato", "General")
+        plot.data_labels.number_format_is_linked = False
+    _estilizar_series(plot, tipo, tema)
+    if tipo == "barras":
+        # Primeira categoria no topo, como numa lista
+        chart.category_axis.reverse_order = True
+    if grafico.get("eixo_x"):
+        _titulo_eixo(chart.category_axis, grafico["eixo_x"], tema)
+    if grafico.get("eixo_y"):
+        _titulo_eixo(chart.value_axis, grafico["eixo_y"], tema)
+    chart.value_axis.has_major_gridlines = True
+    chart.value_axis.major_gridlines.format.line.color.rgb = tema.secundaria
+    return chart
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+Tradução das apresentações: catálogos por idioma e memória de tradução
+
+Os textos dos slides são escritos em português (IDIOMA_ORIGEM) e servem
+de chave, como o msgid do gettext. Cada idioma tem um catálogo JSON em
+DIR_CATALOGOS (`en.json`, `es.json`) com {texto original: tradução};
+tradução vazia significa pendente, e o texto original é usado.
+
+- `traduzir_slides` troca os textos visíveis da especificação (títulos,
+  blocos, caixas, células, rótulos de gráfico), não nomes, estilos nem
+  caminhos; os campos {autor}... são preservados e preenchidos depois.
+- Os textos montados no próprio motor (prefixos, rótulos dos slides
+  gerados de logs e do banco) passam por `traduzir` no idioma ativo
+  (`usar_idioma`), que também entra na chave do cache de slides;
+  constantes traduzidas só no uso são marcadas com `marcar`.
+- `atualizar_catalogos` acrescenta os textos novos (dos slides e os
+  passados a `traduzir` no código) e nunca apaga traduções: um texto
+  que sai e volta reaproveita a tradução já feita.
+
+Memória de tradução: o catálogo JSON é compilado uma vez num arquivo
+binário com as traduções ordenadas pelo hash do texto original (ver
+`compilar_catalogo`). Abrir um idioma é mapear esse arquivo com mmap;
+cada consulta é uma busca binária no mapeamento, sem interpretar o JSON
+nem carregar o catálogo inteiro. Só biblioteca padrão.
+"""
+
+import ast
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+
+from .padroes import CACHE_PADRAO, IDIOMAS
+
+IDIOMA_ORIGEM = IDIOMAS[0]
+DIR_CATALOGOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "i18n")
+
+# Separadores de milhar e decimal por idioma
+SEPARADORES = {"pt-BR": (".", ","), "en": (",", "."), "es": (".", ",")}
+
+# Arquivo compilado: cabeçalho (assinatura, versão, entradas, mtime e tamanho do JSON),
+# tabela (hash, deslocamento, tamanho) ordenada pelo hash e as traduções em UTF-8
+_ASSINATURA = b"VFTM"
+_VERSAO = 1
+_CABECALHO = struct.Struct("<4sIIqq")
+_ENTRADA = struct.Struct("<QII")
+_HASH = struct.Struct("<Q")
+
+_CHAMADA = re.compile(r'\b(?:traduzir|marcar)\(\s*("(?:[^"\\\n]|\\.)*")')
+
+
+def chave(texto):
+    """Hash de 64 bits do texto original, chave da memória de tradução"""
+    return int.from_bytes(hashlib.blake2b(texto.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+# ==================== CATÁLOGOS ====================
+
+def compilar_catalogo(origem, destino):
+    """Compila o catálogo JSON `origem` no arquivo binário `destino` (gravação atômica)"""
+    estado = os.stat(origem)
+    with open(origem, encoding="utf-8") as arquivo:
+        traducoes = {chave(texto): traducao.encode("utf-8")
+                     for texto, traducao in json.load(arquivo).items() if traducao}
+    tabela, dados, posicao = bytearray(), bytearray(), 0
+    for hash_texto in sorted(traducoes):
+        traducao = traducoes[hash_texto]
+        tabela += _ENTRADA.pack(hash_texto, posicao, len(traducao))
+        dados += traducao
+        posicao += len(traducao)
+
+    os.makedirs(os.path.dirname(os.path.abspath(destino)), exist_ok=True)
+    fd, temporario = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(destino)), suffix=".tmp")
+    with os.fdopen(fd, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(_ASSINATURA, _VERSAO, len(traducoes), estado.st_mtime_ns, estado.st_size))
+        arquivo.write(tabela)
+        arquivo.write(dados)
+    os.replace(temporario, destino)
+
+
+class Catalogo:
+    """Catálogo compilado mapeado em memória; consultas por busca binária no hash"""
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        assinatura, versao, self._n, self.mtime_ns, self.tamanho = _CABECALHO.unpack_from(self._mapa)
+        if assinatura != _ASSINATURA or versao != _VERSAO:
+            self._mapa.close()
+            raise ValueError(f"catálogo compilado inválido: {caminho}")
+        self._dados = _CABECALHO.size + self._n * _ENTRADA.size
+
+    def __len__(self):
+        return self._n
+
+    def get(self, texto, padrao=None):
+        """Tradução de `texto`, ou `padrao` se o catálogo não tiver"""
+        alvo, inicio, fim = chave(texto), 0, self._n
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            if _HASH.unpack_from(self._mapa, _CABECALHO.size + meio * _ENTRADA.size)[0] < alvo:
+                inicio = meio + 1
+            else:
+                fim = meio
+        if inicio < self._n:
+            hash_texto, posicao, tamanho = _ENTRADA.unpack_from(self._mapa, _CABECALHO.size + inicio * _ENTRADA.size)
+            if hash_texto == alvo:
+                return self._mapa[self._dados + posicao:self._dados + posicao + tamanho].decode("utf-8")
+        return padrao
+
+    def fechar(self):
+        self._mapa.close()
+
+
+def caminho_catalogo(idioma, diretorio=DIR_CATALOGOS):
+    return os.path.join(diretorio, f"{idioma}.json")
+
+
+_cache = {"diretorio": CACHE_PADRAO}
+_abertos = {}
+
+
+def usar_cache_em_disco(diretorio):
+    """Guarda os catálogos compilados em `diretorio`/i18n"""
+    _cache["diretorio"] = diretorio
+
+
+def abrir_catalogo(idioma, diretorio=DIR_CATALOGOS, cache=None):
+    """Catálogo compilado do idioma, recompilado só quando o JSON muda (None sem catálogo)
+
+    O compilado fica em `cache`/i18n (padrão: o de `usar_cache_em_disco`,
+    ou CACHE_PADRAO). Um catálogo substituído por uma versão nova do JSON
+    é fechado; se era o do idioma ativo, `traduzir` passa a usar o novo.
+    """
+    origem = caminho_catalogo(idioma, diretorio)
+    try:
+        estado = os.stat(origem)
+    except FileNotFoundError:
+        return None
+    cache = cache or _cache["diretorio"]
+    aberto = _abertos.get((origem, cache))
+    if aberto is not None:
+        if (aberto.mtime_ns, aberto.tamanho) == (estado.st_mtime_ns, estado.st_size):
+            return aberto
+    _abertos[origem, cache] = catalogo = _catalogo(origem, estado.st_mtime_ns, estado.st_size, cache)
+    if aberto is not None:
+        if _idioma["catalogo"] is aberto:
+            _idioma["catalogo"] = catalogo
+        aberto.fechar()
+    return catalogo
+
+
+def _catalogo(origem, mtime_ns, tamanho, cache):
+    nome = hashlib.sha1(origem.encode("utf-8")).hexdigest()[:12]
+    compilado = os.path.join(cache, "i18n", f"{os.path.splitext(os.path.basename(origem))[0]}-{nome}.cat")
+    try:
+        catalogo = Catalogo(compilado)
+        if (catalogo.mtime_ns, catalogo.tamanho) == (mtime_ns, tamanho):
+            return catalogo
+        catalogo.fechar()
+    except (FileNotFoundError, ValueError, struct.error):
+        pass
+    compilar_catalogo(origem, compilado)
+    return Catalogo(compilado)
+
+
+# ==================== IDIOMA ATIVO ====================
+
+_idioma = {"nome": IDIOMA_ORIGEM, "catalogo": None}
+
+
+def usar_idioma(nome, diretorio=DIR_CATALOGOS):
+    """Ativa o idioma `nome` (um de IDIOMAS) para `traduzir` e para o cache de slides"""
+    if nome not in IDIOMAS:
+        raise ValueError(f"idioma desconhecido: {nome!r}")
+    _idioma["nome"] = nome
+    _idioma["catalogo"] = abrir_catalogo(nome, diretorio) if nome != IDIOMA_ORIGEM else None
+
+
+def idioma_atual():
+    return _idioma["nome"]
+
+
+def versao_idioma():
+    """Idioma ativo e versão do seu catálogo, para chaves de cache"""
+    catalogo = _idioma["catalogo"]
+    return (_idioma["nome"],) + ((catalogo.mtime_ns, catalogo.tamanho) if catalogo is not None else ())
+
+
+def traduzir(texto):
+    """Texto no idioma ativo (o original se não houver tradução)"""
+    catalogo = _idioma["catalogo"]
+    return catalogo.get(texto, texto) if catalogo is not None and texto else texto
+
+
+def marcar(texto):
+    """Marca um texto para `atualizar_catalogos` sem traduzi-lo (constantes traduzidas depois)"""
+    return texto
+
+
+def inteiro(n):
+    """Inteiro com o separador de milhar do idioma ativo"""
+    return f"{n:,}".replace(",", SEPARADORES[idioma_atual()][0])
+
+
+def decimal(valor, casas=1):
+    """Número com `casas` decimais e os separadores do idioma ativo"""
+    milhar, virgula = SEPARADORES[idioma_atual()]
+    return f"{valor:,.{casas}f}".translate(str.maketrans({",": milhar, ".": virgula}))
+
+
+# ==================== TEXTOS DOS SLIDES ====================
+
+def _mapear_blocos(blocos, funcao):
+    novos = []
+    for bloco in blocos:
+        tipo, conteudo, resto = bloco[0], bloco[1], tuple(bloco[2:])
+        if tipo in ("secao", "texto", "nota"):
+            conteudo = funcao(conteudo)
+        elif tipo == "lista":
+            conteudo = [funcao(item) for item in conteudo]
+        elif tipo == "pares":
+            conteudo = [(funcao(titulo), funcao(desc)) for titulo, desc in conteudo]
+        elif tipo == "topicos":
+            conteudo = [(funcao(topico), autores, funcao(desc)) for topico, autores, desc in conteudo]
+        elif tipo == "grupos":
+            conteudo = [(funcao(titulo), [funcao(item) for item in itens]) for titulo, itens in conteudo]
+        novos.append((tipo, conteudo) + resto)
+    return novos
+
+
+def _mapear_textos(spec, funcao):
+    """Cópia da especificação com `funcao` aplicada a cada texto visível"""
+    novo = dict(spec)
+    for campo in ("titulo", "descricao"):
+        if isinstance(novo.get(campo), str):
+            novo[campo] = funcao(novo[campo])
+    if "blocos" in novo:
+        novo["blocos"] = _mapear_blocos(novo["blocos"], funcao)
+    if "caixas" in novo:
+        novo["caixas"] = [(caixa[0], funcao(caixa[1])) + tuple(caixa[2:]) for caixa in novo["caixas"]]
+    if "cabecalho" in novo:
+        novo["cabecalho"] = [funcao(texto) for texto in novo["cabecalho"]]
+    if "linhas" in novo:
+        novo["linhas"] = [[funcao(celula) if isinstance(celula, str) else celula for celula in linha]
+                          for linha in novo["linhas"]]
+    if "grafico" in novo:
+        grafico = dict(novo["grafico"])
+        for campo in ("eixo_x", "eixo_y"):
+            if isinstance(grafico.get(campo), str):
+                grafico[campo] = funcao(grafico[campo])
+        if "categorias" in grafico:
+            grafico["categorias"] = [funcao(c) if isinstance(c, str) else c for c in grafico["categorias"]]
+        if "series" in grafico:
+            grafico["series"] = [(funcao(nome), valores) for nome, valores in grafico["series"]]
+        novo["grafico"] = grafico
+    return novo
+
+
+def traduzir_slides(slides, idioma=None):
+    """Slides com os textos traduzidos para `idioma` (padrão: o ativo)"""
+    idioma = idioma or idioma_atual()
+    catalogo = abrir_catalogo(idioma) if idioma != IDIOMA_ORIGEM else None
+    if catalogo is None:
+        return list(slides)
+    memoria = {}
+
+    def traduzir_texto(texto):
+        if texto not in memoria:
+            memoria[texto] = catalogo.get(texto, texto) if texto else texto
+        return memoria[texto]
+
+    return [_mapear_textos(spec, traduzir_texto) for spec in slides]
+
+
+def textos_dos_slides(slides):
+    """Textos visíveis dos slides, sem repetição, na ordem em que aparecem"""
+    textos = {}
+
+    def coletar(texto):
+        if texto and texto.strip():
+            textos.setdefault(texto)
+        return texto
+
+    for spec in slides:
+        _mapear_textos(spec, coletar)
+    return list(textos)
+
+
+def textos_do_codigo(caminhos):
+    """Textos literais passados a `traduzir` e `marcar` nos arquivos de código"""
+    textos = {}
+    for caminho in caminhos:
+        with open(caminho, encoding="utf-8") as arquivo:
+            for literal in _CHAMADA.findall(arquivo.read()):
+                textos.setdefault(ast.literal_eval(literal))
+    return list(textos)
+
+
+def atualizar_catalogos(textos, idiomas=IDIOMAS[1:], diretorio=DIR_CATALOGOS):
+    """Acrescenta aos catálogos os textos ainda ausentes, com tradução pendente
+
+    As traduções existentes nunca são apagadas nem reescritas. Retorna
+    {idioma: (novos, pendentes)}.
+    """
+    resumo = {}
+    os.makedirs(diretorio, exist_ok=True)
+    for idioma in idiomas:
+        caminho = caminho_catalogo(idioma, diretorio)
+        try:
+            with open(caminho, encoding="utf-8") as arquivo:
+                catalogo = json.load(arquivo)
+        except FileNotFoundError:
+            catalogo = {}
+        novos = [texto for texto in textos if texto not in catalogo]
+        catalogo.update(dict.fromkeys(novos, ""))
+        if novos:
+            fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as arquivo:
+                json.dump(catalogo, arquivo, ensure_ascii=False, indent=2)
+                arquivo.write("\n")
+            os.replace(temporario, caminho)
+        resumo[idioma] = (len(novos), sum(1 for texto in textos if not catalogo[texto]))
+    return resumo
+
+
+def pendentes(textos, idioma):
+    """Textos sem tradução no catálogo do idioma"""
+    catalogo = abrir_catalogo(idioma)
+    return [texto for texto in textos if catalogo is None or catalogo.get(texto) is None]
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Pipeline de imagens dos slides
+
+Cada imagem é reduzida ao tamanho em que aparece no slide (na resolução
+DPI) e recomprimida uma única vez; o resultado fica em cache pelo hash do
+conteúdo original. Como a saída é determinística, imagens iguais geram os
+mesmos bytes e o python-pptx as grava uma única vez no pacote.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from collections import namedtuple
+
+# Resolução das imagens no slide (suficiente para projeção)
+DPI = 150
+QUALIDADE_JPEG = 82
+
+# Incrementar quando o processamento mudar para a mesma entrada
+VERSAO_IMAGENS = 1
+
+# Imagens preparadas guardadas em memória (servidor, --observar); acima disso sai a usada há mais tempo
+LIMITE_MEMORIA = 256
+
+ImagemPreparada = namedtuple("ImagemPreparada", "dados largura altura")
+
+
+class PipelineImagens:
+    """Redimensiona e recomprime imagens, com cache em memória e opcionalmente em disco"""
+
+    def __init__(self, diretorio=None, dpi=DPI):
+        self.diretorio = diretorio
+        self.dpi = dpi
+        self._hashes = {}
+        self._preparadas = {}
+
+    def _hash(self, caminho):
+        """Hash do conteúdo, recalculado só quando o arquivo muda"""
+        estado = os.stat(caminho)
+        marca = (estado.st_mtime_ns, estado.st_size)
+        anterior = self._hashes.get(caminho)
+        if anterior is None or anterior[0] != marca:
+            with open(caminho, "rb") as arquivo:
+                self._hashes[caminho] = (marca, hashlib.sha256(arquivo.read()).hexdigest())
+        return self._hashes[caminho][1]
+
+    def preparar(self, caminho, largura, altura):
+        """Imagem pronta para caber em largura x altura polegadas"""
+        limite = (round(largura * self.dpi), round(altura * self.dpi))
+        chave = f"{self._hash(caminho)}-{limite[0]}x{limite[1]}-{VERSAO_IMAGENS}"
+        memoria = self._preparadas
+        if chave in memoria:
+            memoria[chave] = memoria.pop(chave)
+        else:
+            memoria[chave] = self._ler_disco(chave) or self._processar(caminho, limite, chave)
+            if len(memoria) > LIMITE_MEMORIA:
+                del memoria[next(iter(memoria))]
+        return memoria[chave]
+
+    def _processar(self, caminho, limite, chave):
+        # Pillow só é carregado quando há imagem a processar
+        from PIL import Image
+
+        with Image.open(caminho) as imagem:
+            png = imagem.format == "PNG"
+            imagem.thumbnail(limite, Image.LANCZOS)
+            saida = io.BytesIO()
+            if png:
+                imagem.save(saida, "PNG", optimize=True)
+            else:
+                if imagem.mode != "RGB":
+                    imagem = imagem.convert("RGB")
+                imagem.save(saida, "JPEG", quality=QUALIDADE_JPEG, optimize=True)
+            preparada = ImagemPreparada(saida.getvalue(), *imagem.size)
+        self._gravar_disco(chave, preparada)
+        return preparada
+
+    def _caminho_disco(self, chave):
+        return os.path.join(self.diretorio, chave)
+
+    def _ler_disco(self, chave):
+        if not self.diretorio:
+            return None
+        try:
+            with open(self._caminho_disco(chave), "rb") as arquivo:
+                dados = arquivo.read()
+        except FileNotFoundError:
+            return None
+        from PIL import Image
+
+        with Image.open(io.BytesIO(dados)) as imagem:
+            return ImagemPreparada(dados, *imagem.size)
+
+    def _gravar_disco(self, chave, preparada):
+        if not self.diretorio:
+            return
+        os.makedirs(self.diretorio, exist_ok=True)
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        with os.fdopen(fd, "wb") as arquivo:
+            arquivo.write(preparada.dados)
+        os.replace(temporario, self._caminho_disco(chave))
+
+
+# Pipeline compartilhado pelos renderizadores do processo
+PIPELINE = PipelineImagens()
+
+
+def usar_cache_em_disco(diretorio):
+    """Guarda as imagens preparadas em `diretorio`/imagens"""
+    PIPELINE.diretorio = os.path.join(diretorio, "imagens")
+
+
+def encaixar(preparada, caixa):
+    """Posição (x, y, largura, altura) da imagem centralizada na caixa, sem distorcer"""
+    x, y, largura, altura = caixa
+    escala = min(largura / preparada.largura, altura / preparada.altura)
+    larg, alt = preparada.largura * escala, preparada.altura * escala
+    return x + (largura - larg) / 2, y + (altura - alt) / 2, larg, alt
+
+
+def galeria(arquivos, area, colunas, espaco=0.1):
+    """Distribui as imagens em grade dentro da área (x, y, largura, altura)
+
+    Retorna a lista (caminho, caixa) usada na chave "imagens" dos slides.
+    """
+    x, y, largura, altura = area
+    linhas = max(1, -(-len(arquivos) // colunas))
+    larg = (largura - espaco * (colunas - 1)) / colunas
+    alt = (altura - espaco * (linhas - 1)) / linhas
+    return [
+        (caminho, (x + (i % colunas) * (larg + espaco), y + (i // colunas) * (alt + espaco), larg, alt))
+        for i, caminho in enumerate(arquivos)
+    ]
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Leitura dos .pptx gerados, sem o python-pptx
+
+Abrir um pacote lê só o diretório central do zip; cada parte (inclusive
+a lista de slides) é descomprimida e interpretada (lxml) quando pedida,
+uma vez. O CRC-32 e o tamanho de cada parte, gravados no diretório
+central, comparam partes de dois pacotes sem descomprimir nada
+(`assinatura`). Usado pelas prévias (`previa`) e pela comparação de
+apresentações (`diferenca`).
+"""
+
+import hashlib
+import posixpath
+import zipfile
+from functools import cached_property
+
+from lxml import etree
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
+}
+_R_ID = f"{{{NS['r']}}}id"
+
+
+class PacoteLido:
+    """Partes de um .pptx lidas do zip sob demanda, com XML e relações em cache"""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._zip = zipfile.ZipFile(caminho)
+        self._xml = {}
+        self._rels = {}
+        self._hashes = {}
+
+    @property
+    def apresentacao(self):
+        return self.xml("ppt/presentation.xml")
+
+    @cached_property
+    def slides(self):
+        """Nomes das partes dos slides, na ordem da apresentação"""
+        rels = self.rels("ppt/presentation.xml")
+        lista = self.apresentacao.find("p:sldIdLst", NS)
+        return [rels[sid.get(_R_ID)] for sid in (lista if lista is not None else ())]
+
+    def ler(self, parte):
+        return self._zip.read(parte)
+
+    def xml(self, parte):
+        if parte not in self._xml:
+            self._xml[parte] = etree.fromstring(self.ler(parte))
+        return self._xml[parte]
+
+    def hash(self, parte):
+        if parte not in self._hashes:
+            self._hashes[parte] = hashlib.sha256(self.ler(parte)).hexdigest()
+        return self._hashes[parte]
+
+    def assinatura(self, parte):
+        """(CRC-32, tamanho) da parte no diretório central, ou None se ela não existe"""
+        info = self._zip.NameToInfo.get(parte)
+        return (info.CRC, info.file_size) if info is not None else None
+
+    def assinaturas(self):
+        """{parte: (CRC-32, tamanho)} de todas as entradas do zip"""
+        return {info.filename: (info.CRC, info.file_size) for info in self._zip.infolist()}
+
+    def rels(self, parte):
+        """{rId: nome da parte} das relações internas da parte"""
+        if parte not in self._rels:
+            diretorio, nome = posixpath.split(parte)
+            caminho = posixpath.join(diretorio, "_rels", f"{nome}.rels")
+            relacoes = {}
+            if caminho in self._zip.NameToInfo:
+                for rel in etree.fromstring(self.ler(caminho)):
+                    if rel.get("TargetMode") != "External":
+                        relacoes[rel.get("Id")] = posixpath.normpath(posixpath.join(diretorio, rel.get("Target")))
+            self._rels[parte] = relacoes
+        return self._rels[parte]
+
+    def relacionada(self, parte, pasta):
+        """Primeira parte relacionada dentro de `pasta` (o layout de um slide, o mestre de um layout)"""
+        return next((alvo for alvo in self.rels(parte).values() if f"/{pasta}/" in alvo), None)
+
+    def citadas(self, parte):
+        """Partes citadas por `parte`, transitivamente (layout, mestre, imagens, gráficos...), sem ela"""
+        vistas, pendentes = set(), [parte]
+        while pendentes:
+            atual = pendentes.pop()
+            if atual not in vistas:
+                vistas.add(atual)
+                pendentes.extend(self.rels(atual).values())
+        return vistas - {parte}
+
+    def fechar(self):
+        self._zip.close()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Geração em lote de apresentações personalizadas
+
+O template base é lido e interpretado uma única vez; cada apresentação do
+lote parte de uma cópia em memória desse pacote. Com `jobs > 1` as
+apresentações são distribuídas entre processos, cada um com o seu próprio
+template carregado; a saída é idêntica byte a byte à da execução serial.
+"""
+
+import copy
+import os
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+from . import drawio, i18n, imagens
+from .cache import CacheMemoria, CacheSlides
+from .estilos import usar_tema
+from .i18n import usar_idioma
+from .pacote import data_hora_atual, salvar
+from .parametros import carregar_parametros, personalizar
+from .renderizadores import construir_apresentacao, nova_apresentacao
+
+
+class ModeloBase:
+    """Pacote de template interpretado uma vez e clonado para cada apresentação
+
+    A renderização só acrescenta slides: mestre, layouts, tema e as demais
+    partes do template são compartilhados por referência entre os clones, e
+    `entradas` guarda o seu XML já serializado (ver `pacote.salvar`).
+    Só a parte da apresentação e as propriedades do documento são copiadas.
+    """
+
+    def __init__(self, template=None):
+        self._prs = nova_apresentacao(template)
+        copiadas = (self._prs.part, self._prs.core_properties.part)
+        fixas = [parte for parte in self._prs.part.package.iter_parts() if parte not in copiadas]
+        self._compartilhadas = {id(parte): parte for parte in fixas}
+        self.entradas = {parte: [] for parte in fixas}
+
+    def clonar(self):
+        """Retorna uma apresentação com o conteúdo do template, independente nas partes alteráveis"""
+        return copy.deepcopy(self._prs, dict(self._compartilhadas))
+
+
+def _slug(texto):
+    texto = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "_", texto.lower()).strip("_") or "apresentacao"
+
+
+def nome_arquivo(indice, parametros):
+    """Nome do arquivo de saída: `arquivo` dos parâmetros ou derivado do autor"""
+    if parametros.get("arquivo"):
+        return parametros["arquivo"]
+    return f"{indice:03d}_{_slug(parametros.get('autor', ''))}.pptx"
+
+
+def caminho_saida(diretorio, indice, parametros):
+    """Caminho do arquivo de saída em `diretorio`
+
+    `arquivo` vem do JSON/CSV do lote: caminhos absolutos, com `..` ou por
+    links simbólicos que levam para fora de `diretorio` são recusados.
+    """
+    caminho = os.path.join(diretorio, nome_arquivo(indice, parametros))
+    base = os.path.realpath(diretorio)
+    resolvido = os.path.realpath(caminho)
+    if resolvido == base or os.path.commonpath([base, resolvido]) != base:
+        raise ValueError(f"arquivo fora do diretório de saída {diretorio!r}: {parametros.get('arquivo')!r} "
+                         f"(conjunto {indice})")
+    return caminho
+
+
+def _gerar(modelo, cache, slides, parametros, caminho, data_hora, compressao):
+    prs = construir_apresentacao(personalizar(slides, parametros), prs=modelo.clonar(), cache=cache)
+    salvar(prs, caminho, data_hora, compressao, modelo.entradas)
+    return caminho
+
+
+# Estado de cada processo do pool: template e slides chegam uma vez por processo
+_processo = {}
+
+
+def _abrir_cache(diretorio_cache, template):
+    if not diretorio_cache:
+        return None
+    imagens.usar_cache_em_disco(diretorio_cache)
+    drawio.usar_cache_em_disco(diretorio_cache)
+    i18n.usar_cache_em_disco(diretorio_cache)
+    return CacheSlides(diretorio_cache, template)
+
+
+def _iniciar_processo(template, slides, diretorio_cache, tema, idioma):
+    if tema is not None:
+        usar_tema(tema)
+    _processo["cache"] = _abrir_cache(diretorio_cache, template)
+    if idioma is not None:
+        usar_idioma(idioma)
+    _processo["modelo"] = ModeloBase(template)
+    _processo["slides"] = slides
+
+
+def _gerar_no_processo(tarefa):
+    return _gerar(_processo["modelo"], _processo["cache"], _processo["slides"], *tarefa)
+
+
+def gerar_lote(slides, lista_parametros, diretorio, padrao=None, template=None, jobs=1,
+               data_hora=None, compressao=None, diretorio_cache=None, tema=None, idioma=None):
+    """Gera uma apresentação por conjunto de parâmetros em `diretorio`
+
+    `padrao` completa os campos ausentes de cada conjunto. `data_hora` fixa
+    a data das entradas do zip (padrão: início do lote), de modo que a saída
+    não depende de `jobs`. Retorna a lista de caminhos gerados, na ordem de
+    `lista_parametros`. `compressao` é repassado a `pacote.salvar` e
+    `diretorio_cache` ativa o cache de slides (ver `cache`), compartilhado
+    entre os processos. `tema` (nome em `estilos.TEMAS`) e `idioma` (ver
+    `i18n`) são ativados aqui e em cada processo do pool. Um `arquivo` que
+    sai de `diretorio` levanta ValueError antes de qualquer gravação.
+    """
+    if tema is not None:
+        usar_tema(tema)
+    if diretorio_cache:
+        i18n.usar_cache_em_disco(diretorio_cache)
+    if idioma is not None:
+        usar_idioma(idioma)
+    os.makedirs(diretorio, exist_ok=True)
+    data_hora = data_hora or data_hora_atual()
+
+    tarefas = []
+    for indice, parametros in enumerate(lista_parametros, 1):
+        parametros = {**(padrao or {}), **parametros}
+        tarefas.append((parametros, caminho_saida(diretorio, indice, parametros), data_hora, compressao))
+
+    if jobs <= 1 or len(tarefas) <= 1:
+        modelo, cache = ModeloBase(template), _abrir_cache(diretorio_cache, template)
+        return [_gerar(modelo, cache, slides, *tarefa) for tarefa in tarefas]
+
+    jobs = min(jobs, len(tarefas))
+    with ProcessPoolExecutor(jobs, initializer=_iniciar_processo,
+                             initargs=(template, slides, diretorio_cache, tema, idioma)) as pool:
+        return list(pool.map(_gerar_no_processo, tarefas, chunksize=max(1, len(tarefas) // (jobs * 4))))
+
+
+def gerar_variantes(decks, padrao=None, template=None, data_hora=None, compressao=None, diretorio_cache=None,
+                    tema=None):
+    """Gera as variantes de uma apresentação (ver `variantes`) numa única passada
+
+    `decks` é uma lista de (caminho, slides, parâmetros), com um quarto
+    elemento opcional: o idioma (ver `i18n`) ativado antes de renderizar
+    aquela apresentação. Todas partem do mesmo template interpretado e
+    compartilham um cache de slides (em memória, ou em `diretorio_cache`):
+    um slide presente em várias variantes do mesmo idioma é renderizado na
+    primeira e reaproveitado nas outras. Retorna a lista de caminhos gerados.
+    """
+    if tema is not None:
+        usar_tema(tema)
+    data_hora = data_hora or data_hora_atual()
+    modelo = ModeloBase(template)
+    cache = _abrir_cache(diretorio_cache, template) or CacheMemoria(template)
+    caminhos = []
+    for caminho, slides, parametros, *idioma in decks:
+        if idioma:
+            usar_idioma(*idioma)
+        diretorio = os.path.dirname(caminho)
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+        caminhos.append(_gerar(modelo, cache, slides, {**(padrao or {}), **parametros}, caminho, data_hora,
+                               compressao))
+    return caminhos
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Medição de texto pelas métricas da fonte
+
+A largura de cada palavra é medida uma única vez por face (normal,
+negrito, itálico) num tamanho de referência e escalada para o tamanho do
+parágrafo; a altura de cada parágrafo (quebra de linhas + espaçamento)
+fica em cache LRU pelo texto, estilo e largura. Em lote, strings que não
+mudam entre apresentações nunca são medidas de novo.
+
+A medição usa sempre a DejaVu Sans distribuída em `fontes/` (com a
+licença), nunca as fontes do sistema: a quebra de linhas, a escala e a
+paginação não mudam de uma máquina para outra (e a saída de
+--reprodutivel também não). Ela é mais larga que a Calibri do tema, o
+que deixa a medição conservadora. As faces itálicas são medidas pelas
+retas (a oblíqua da DejaVu tem praticamente as mesmas larguras). Sem o
+arquivo a medição falha, em vez de cair em outra fonte.
+"""
+
+import os
+from functools import lru_cache
+
+from PIL import ImageFont
+
+from .modelo import trechos
+
+DIRETORIO_FONTES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fontes")
+# Arquivo por face: (negrito, italico) -> arquivo em DIRETORIO_FONTES
+FONTES = {
+    (False, False): "DejaVuSans.ttf",
+    (True, False): "DejaVuSans-Bold.ttf",
+    (False, True): "DejaVuSans.ttf",
+    (True, True): "DejaVuSans-Bold.ttf",
+}
+
+# Medidas em pontos; o tamanho de referência só afeta a precisão
+TAMANHO_REFERENCIA = 100
+TAMANHO_PADRAO = 18  # sz do defaultTextStyle do template
+RECUO_NIVEL = 36  # marL de cada nível (0,5")
+MARGEM_HORIZONTAL = 14.4  # lIns + rIns da caixa de texto (0,1" cada)
+MARGEM_VERTICAL = 7.2  # tIns + bIns (0,05" cada)
+
+
+@lru_cache(maxsize=None)
+def fonte(negrito=False, italico=False):
+    """Fonte no tamanho de referência para a face pedida"""
+    caminho = os.path.join(DIRETORIO_FONTES, FONTES[bool(negrito), bool(italico)])
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(f"fonte de medição ausente: {caminho}")
+    return ImageFont.truetype(caminho, TAMANHO_REFERENCIA)
+
+
+@lru_cache(maxsize=None)
+def altura_linha(negrito=False, italico=False):
+    """Altura de uma linha (ascendente + descendente) por ponto de fonte"""
+    ascendente, descendente = fonte(negrito, italico).getmetrics()
+    return (ascendente + descendente) / TAMANHO_REFERENCIA
+
+
+@lru_cache(maxsize=65536)
+def largura_palavra(palavra, negrito=False, italico=False):
+    """Largura da palavra por ponto de fonte"""
+    return fonte(negrito, italico).getlength(palavra) / TAMANHO_REFERENCIA
+
+
+def linhas(texto, tamanho, largura, negrito=False, italico=False):
+    """Número de linhas do texto com quebra por palavras em `largura` pontos
+
+    Cada quebra forçada ("\\n", que vira <a:br/>) começa uma linha nova.
+    """
+    return sum(_linhas_trecho(trecho, tamanho, largura, negrito, italico) for trecho in trechos(texto))
+
+
+def _linhas_trecho(texto, tamanho, largura, negrito, italico):
+    espaco = largura_palavra(" ", negrito, italico) * tamanho
+    total, atual = 1, 0.0
+    for palavra in texto.split():
+        medida = largura_palavra(palavra, negrito, italico) * tamanho
+        if atual and atual + espaco + medida > largura:
+            total += 1
+            atual = 0.0
+        if medida > largura:
+            inteiras, resto = divmod(medida, largura)
+            total += int(inteiras) - (resto == 0)
+            medida = resto
+        atual += (espaco if atual else 0.0) + medida
+    return total
+
+
+@lru_cache(maxsize=65536)
+def altura_paragrafo(texto, est, largura):
+    """Altura em pontos do parágrafo (linhas + espaço depois) numa caixa de `largura` pontos"""
+    tamanho = est.tamanho or TAMANHO_PADRAO
+    util = largura - MARGEM_HORIZONTAL - RECUO_NIVEL * (est.nivel or 0)
+    n = linhas(texto, tamanho, util, est.negrito, est.italico)
+    return n * tamanho * altura_linha(est.negrito, est.italico) + (est.espaco_depois or 0)
+
+
+def altura_texto(paragrafos, largura):
+    """Altura em pontos de uma lista de (texto, estilo), incluindo as margens da caixa"""
+    return MARGEM_VERTICAL + sum(altura_paragrafo(texto, est, largura) for texto, est in paragrafos)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Modelo intermediário entre a especificação dos slides e o XML do pptx
+
+A especificação declarativa (dicts, ver `renderizadores`) é montada em
+tuplas imutáveis, sem nenhum objeto do python-pptx:
+
+    Slide       layout, título, caixas de texto e tabela (e a especificação,
+                para o conteúdo nativo: gráficos, diagramas, imagens)
+    CaixaTexto  caixa de texto nova, com nome e posição em polegadas
+    Tabela      posição, larguras e as linhas de células
+    Quadro      text frame: parágrafos e quebra de linha
+    Paragrafo   texto e estilo já resolvido pelo tema (e escalado)
+
+Os trechos (runs) de um parágrafo são os pedaços do texto entre quebras
+de linha, como no python-pptx; o estilo é sempre do parágrafo.
+
+O ajuste mede e a revisão confere esses parágrafos; `baixar_quadro`
+escreve cada quadro de uma vez como elementos <a:p>, sem criar os
+proxies do python-pptx (_Paragraph, _Run, Font) por parágrafo.
+"""
+
+import re
+from collections import namedtuple
+
+from lxml import etree
+from pptx.oxml.ns import qn
+
+Paragrafo = namedtuple("Paragrafo", "texto estilo")
+# quebra: True liga a quebra de linha (word_wrap), None mantém a da forma
+Quadro = namedtuple("Quadro", "paragrafos quebra", defaults=(None,))
+CaixaTexto = namedtuple("CaixaTexto", "nome posicao quadro")
+# linhas: listas de Quadro, a primeira é o cabeçalho, com o fundo `fundo`
+Tabela = namedtuple("Tabela", "posicao larguras linhas fundo")
+Slide = namedtuple("Slide", "spec layout titulo caixas tabela", defaults=(None, (), None))
+
+_P, _R, _T, _BR = qn("a:p"), qn("a:r"), qn("a:t"), qn("a:br")
+_CONTROLE = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def paragrafos_do_texto(texto, est, so_primeiro=False):
+    """Um parágrafo por linha do texto, como o `text` de um text frame do python-pptx
+
+    Com `so_primeiro` só o primeiro recebe o estilo (é o que o título dos
+    slides sempre fez).
+    """
+    return [Paragrafo(linha, est if i == 0 or not so_primeiro else None)
+            for i, linha in enumerate(texto.split("\n"))]
+
+
+def trechos(texto):
+    """Textos dos runs do parágrafo, separados por quebras de linha (<a:br/>)"""
+    return re.split("\n|\v", texto)
+
+
+def escapar(texto):
+    return _CONTROLE.sub(lambda m: "_x%04X_" % ord(m.group()), texto)
+
+
+def baixar_quadro(txBody, quadro, aplicar):
+    """Troca os parágrafos do <p:txBody> pelos do quadro
+
+    `aplicar(p, estilo)` recebe o elemento <a:p> (ver `estilos.aplicar_estilo`).
+    """
+    for p in txBody.findall(_P):
+        txBody.remove(p)
+    for paragrafo in quadro.paragrafos:
+        p = etree.SubElement(txBody, _P)
+        for i, trecho in enumerate(trechos(paragrafo.texto)):
+            if i:
+                etree.SubElement(p, _BR)
+            if trecho:
+                etree.SubElement(etree.SubElement(p, _R), _T).text = escapar(trecho)
+        if paragrafo.estilo is not None:
+            aplicar(p, paragrafo.estilo)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Espera por mudanças nos arquivos de conteúdo da apresentação (--observar)
+
+No Linux usa o inotify pela libc (ctypes), vigiando os diretórios dos
+arquivos: editores que salvam num temporário e renomeiam trocam o inode do
+arquivo, então o evento que importa é o do diretório (IN_CLOSE_WRITE ou
+IN_MOVED_TO com o nome do arquivo). Sem inotify, compara mtime e tamanho
+a cada INTERVALO_VARREDURA.
+
+Uma gravação costuma gerar vários eventos seguidos (e vários arquivos
+mudam juntos num checkout); eles são agrupados até ficar AGRUPAMENTO
+segundos sem eventos novos. Só biblioteca padrão.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+INTERVALO_VARREDURA = 0.25
+AGRUPAMENTO = 0.05
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENTO = struct.Struct("iIII")
+
+
+def _libc():
+    nome = ctypes.util.find_library("c")
+    libc = ctypes.CDLL(nome, use_errno=True) if nome else None
+    if libc is None or not hasattr(libc, "inotify_init1"):
+        return None
+    libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    return libc
+
+
+class ObservadorInotify:
+    """Mudanças nos arquivos vigiados via inotify nos seus diretórios"""
+
+    def __init__(self, libc):
+        self._libc = libc
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+        self._diretorios = {}  # wd -> diretório
+        self._vigiados = set()
+
+    def vigiar(self, caminhos):
+        """Passa a vigiar exatamente `caminhos` (os diretórios já vigiados continuam)"""
+        self._vigiados = {os.path.abspath(caminho) for caminho in caminhos}
+        for diretorio in {os.path.dirname(caminho) for caminho in self._vigiados} - set(self._diretorios.values()):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(diretorio), _IN_CLOSE_WRITE | _IN_MOVED_TO)
+            if wd >= 0:
+                self._diretorios[wd] = diretorio
+
+    def _ler(self, timeout):
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        dados = os.read(self._fd, 64 * 1024)
+        mudados, pos = set(), 0
+        while pos < len(dados):
+            wd, _, _, tamanho = _EVENTO.unpack_from(dados, pos)
+            nome = dados[pos + _EVENTO.size:pos + _EVENTO.size + tamanho].rstrip(b"\0")
+            pos += _EVENTO.size + tamanho
+            caminho = os.path.join(self._diretorios.get(wd, ""), os.fsdecode(nome))
+            if caminho in self._vigiados:
+                mudados.add(caminho)
+        return mudados
+
+    def esperar(self, timeout=None):
+        """Arquivos vigiados que mudaram; vazio se `timeout` passar ou só mudarem outros arquivos"""
+        mudados = self._ler(timeout)
+        while mudados:
+            novos = self._ler(AGRUPAMENTO)
+            if not novos:
+                break
+            mudados |= novos
+        return mudados
+
+    def fechar(self):
+        os.close(self._fd)
+
+
+class ObservadorVarredura:
+    """Mudanças nos arquivos vigiados por comparação de mtime e tamanho"""
+
+    def __init__(self, intervalo=INTERVALO_VARREDURA):
+        self._intervalo = intervalo
+        self._marcas = {}
+
+    @staticmethod
+    def _marca(caminho):
+        try:
+            estado = os.stat(caminho)
+        except FileNotFoundError:
+            return None
+        return estado.st_mtime_ns, estado.st_size
+
+    def vigiar(self, caminhos):
+        caminhos = {os.path.abspath(caminho) for caminho in caminhos}
+        self._marcas = {caminho: self._marcas.get(caminho) or self._marca(caminho) for caminho in caminhos}
+
+    def _mudados(self):
+        mudados = set()
+        for caminho, marca in self._marcas.items():
+            atual = self._marca(caminho)
+            if atual != marca:
+                self._marcas[caminho] = atual
+                mudados.add(caminho)
+        return mudados
+
+    def esperar(self, timeout=None):
+        limite = None if timeout is None else time.monotonic() + timeout
+        while True:
+            mudados = self._mudados()
+            if mudados:
+                time.sleep(AGRUPAMENTO)
+                return mudados | self._mudados()
+            if limite is not None and time.monotonic() >= limite:
+                return set()
+            time.sleep(self._intervalo)
+
+    def fechar(self):
+        pass
+
+
+def criar_observador():
+    """ObservadorInotify se a libc tiver inotify; senão ObservadorVarredura"""
+    libc = _libc()
+    if libc is not None:
+        try:
+            return ObservadorInotify(libc)
+        except OSError:
+            pass
+    return ObservadorVarredura()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Gravação do pacote .pptx
+
+Equivalente ao `prs.save()` do python-pptx, com quatro diferenças:
+
+- a data/hora das entradas do zip é fixada pelo chamador, então a mesma
+  apresentação gerada em processos diferentes produz os mesmos bytes;
+  com SOURCE_DATE_EPOCH definido (modo reprodutível, ver `data_fonte`),
+  essa data e as de criação e modificação do documento vêm dele e
+  a saída não depende do horário da geração;
+- o XML de cada parte é serializado direto na entrada do zip, sem montar
+  o blob da parte (nem o pacote inteiro) em memória; o destino pode ser um
+  arquivo ou qualquer objeto com `write()`, inclusive sem `seek()`;
+- o nível de compressão é configurável, e mídias que já são comprimidas
+  (JPEG, PNG...) são gravadas sem recompressão;
+- com `entradas` (ver `lote.ModeloBase`), as partes do template
+  compartilhadas entre apresentações são serializadas uma vez só; nas
+  gravações seguintes os bytes prontos vão direto para o zip.
+
+Só a API pública do zipfile é usada (`writestr` e `open(info, "w")`).
+"""
+
+import datetime
+import io
+import os
+import tempfile
+import time
+import zipfile
+
+from lxml import etree
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import XmlPart
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from .padroes import NIVEIS_COMPRESSAO
+
+# Extensões de partes cujo conteúdo já é comprimido
+EXTENSOES_COMPRIMIDAS = {"jpeg", "jpg", "png", "gif", "mp3", "mp4", "m4a", "wdp", "xlsx"}
+
+
+# Menor data/hora que uma entrada de zip representa
+DATA_HORA_MINIMA = (1980, 1, 1, 0, 0, 0)
+
+
+def data_fonte():
+    """Data de SOURCE_DATE_EPOCH (reproducible-builds.org) em UTC, ou None fora do modo reprodutível"""
+    epoca = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoca:
+        return None
+    return datetime.datetime.fromtimestamp(int(epoca), datetime.timezone.utc)
+
+
+def data_hora_atual():
+    """Data/hora no formato das entradas do zip, com resolução de segundos
+
+    No modo reprodutível é a de SOURCE_DATE_EPOCH, e não o horário atual.
+    """
+    fonte = data_fonte()
+    if fonte is not None:
+        return max(fonte.timetuple()[:6], DATA_HORA_MINIMA)
+    return time.localtime()[:6]
+
+
+def nivel_compressao(valor):
+    """Converte nome ("armazenar", "maxima"...) ou inteiro 0-9 no nível do zlib"""
+    if isinstance(valor, str):
+        return NIVEIS_COMPRESSAO[valor]
+    return valor
+
+
+# ZipInfo.compress_level é público a partir do Python 3.13; antes o nível só
+# chega ao zipfile pelo argumento `compresslevel` de `writestr`
+_NIVEL_NO_ZIPINFO = hasattr(zipfile.ZipInfo, "compress_level")
+
+
+class _Gravador:
+    """Escreve entradas no zip com data/hora e compressão definidas"""
+
+    def __init__(self, zf, data_hora, nivel):
+        self._zf = zf
+        self._data_hora = data_hora
+        self._nivel = nivel
+
+    def _info(self, pack_uri):
+        info = zipfile.ZipInfo(pack_uri.membername, date_time=self._data_hora)
+        info.external_attr = 0o600 << 16
+        if self._nivel == 0 or pack_uri.ext.lower() in EXTENSOES_COMPRIMIDAS:
+            info.compress_type = zipfile.ZIP_STORED
+        else:
+            info.compress_type = zipfile.ZIP_DEFLATED
+            if _NIVEL_NO_ZIPINFO:
+                info.compress_level = self._nivel
+        return info
+
+    def blob(self, pack_uri, blob):
+        self._zf.writestr(self._info(pack_uri), blob, compresslevel=self._nivel)
+
+    def xml(self, pack_uri, elemento):
+        info = self._info(pack_uri)
+        if info.compress_type == zipfile.ZIP_DEFLATED and self._nivel is not None and not _NIVEL_NO_ZIPINFO:
+            self._zf.writestr(info, _xml(elemento), compresslevel=self._nivel)
+            return
+        with self._zf.open(info, "w") as entrada:
+            etree.ElementTree(elemento).write(entrada, encoding="UTF-8", standalone=True)
+
+
+def _xml(elemento):
+    saida = io.BytesIO()
+    etree.ElementTree(elemento).write(saida, encoding="UTF-8", standalone=True)
+    return saida.getvalue()
+
+
+def _elemento(parte):
+    """Árvore XML da parte, ou None se ela só tem o blob
+
+    Partes já serializadas (`emissor.ParteSerializada`) só ganham a árvore
+    quando alguém a usa; antes disso os bytes vão direto para o zip.
+    """
+    if isinstance(parte, XmlPart):
+        return vars(parte).get("_element")
+    return None
+
+
+def _serializar(parte):
+    elemento = _elemento(parte)
+    return _xml(elemento) if elemento is not None else parte.blob
+
+
+def salvar(prs, destino, data_hora=None, compressao=None, entradas=None):
+    """Grava a apresentação em `destino` (caminho ou objeto com `write()`)
+
+    `data_hora` é a tupla (ano, mês, dia, hora, minuto, segundo) usada em
+    todas as entradas do zip; sem ela vale o horário atual. `compressao`
+    aceita um nome de NIVEIS_COMPRESSAO ou um inteiro de 0 a 9.
+    `entradas` é o dict {parte: []} das partes que não mudam entre
+    gravações; o XML já serializado delas e das suas relações fica
+    guardado nessas listas.
+    """
+    data_hora = data_hora or data_hora_atual()
+    fonte = data_fonte()
+    if fonte is not None:
+        propriedades = prs.core_properties
+        propriedades.created = propriedades.modified = fonte.replace(tzinfo=None)
+    pacote = prs.part.package
+    partes = tuple(pacote.iter_parts())
+    nivel = nivel_compressao(compressao)
+
+    with zipfile.ZipFile(destino, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        gravador = _Gravador(zf, data_hora, nivel)
+        gravador.blob(CONTENT_TYPES_URI, serialize_part_xml(_ContentTypesItem.xml_for(partes)))
+        gravador.blob(PACKAGE_URI.rels_uri, pacote._rels.xml)
+        for parte in partes:
+            prontas = entradas.get(parte) if entradas else None
+            if prontas is not None:
+                if not prontas:
+                    prontas.append((parte.partname, _serializar(parte)))
+                    if parte._rels:
+                        prontas.append((parte.partname.rels_uri, parte.rels.xml))
+                for pack_uri, dados in prontas:
+                    gravador.blob(pack_uri, dados)
+                continue
+            elemento = _elemento(parte)
+            if elemento is not None:
+                gravador.xml(parte.partname, elemento)
+            else:
+                gravador.blob(parte.partname, parte.blob)
+            if parte._rels:
+                gravador.blob(parte.partname.rels_uri, parte.rels.xml)
+
+
+def salvar_atomico(prs, caminho, data_hora=None, compressao=None, entradas=None):
+    """Como `salvar`, mas grava num temporário ao lado e troca com `caminho` de uma vez
+
+    Quem abrir o arquivo durante a gravação vê a versão anterior inteira,
+    nunca um zip pela metade.
+    """
+    fd, temporario = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(caminho)), suffix=".pptx.tmp")
+    try:
+        with os.fdopen(fd, "wb") as arquivo:
+            salvar(prs, arquivo, data_hora, compressao, entradas)
+        os.chmod(temporario, 0o666 & ~_umask())
+        os.replace(temporario, caminho)
+    except BaseException:
+        os.remove(temporario)
+        raise
+
+
+def _umask():
+    atual = os.umask(0)
+    os.umask(atual)
+    return atual
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Valores padrão usados pela linha de comando e pelo motor
+
+Fica separado dos módulos que usam python-pptx e lxml para que o CLI
+monte as suas opções sem carregá-los.
+"""
+
+import getpass
+import os
+import tempfile
+
+# Níveis de compressão por nome; None usa o nível padrão do zlib
+NIVEIS_COMPRESSAO = {
+    "armazenar": 0,
+    "rapida": 1,
+    "padrao": None,
+    "maxima": 9,
+}
+
+# SOURCE_DATE_EPOCH de --reprodutivel quando o ambiente não define um: 1980-01-01 UTC,
+# a menor data que o formato zip representa
+EPOCA_REPRODUTIVEL = 315532800
+
+# Idiomas das apresentações; o primeiro é o dos textos originais (ver i18n)
+IDIOMAS = ("pt-BR", "en", "es")
+
+# Temas de cores e fontes (espelha estilos.TEMAS)
+NOMES_TEMAS = ("padrao", "alto_contraste")
+
+CACHE_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "vivafit-apresentacao")
+
+# Socket do servidor de renderização (um por usuário)
+SOCKET_PADRAO = os.path.join(tempfile.gettempdir(), f"vivafit-apresentacao-{getpass.getuser()}.sock")
+
+# Campos da especificação dos slides que apontam para arquivos lidos na renderização
+CAMPOS_ARQUIVO = ("arquivo", "relacoes")
+
+# Menor fonte, em pontos, do texto dos slides (público idoso): limite da redução
+# automática (renderizadores.ajustar_slide) e da regra fonte_minima da revisão
+FONTE_MINIMA = 14
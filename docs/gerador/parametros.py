@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+Parâmetros das apresentações: campos {autor}, {data}... nos textos dos slides
+
+Só biblioteca padrão, para que listar e validar slides não carregue o
+python-pptx.
+"""
+
+import csv
+import json
+import string
+
+
+def personalizar(valor, parametros):
+    """Substitui os campos {autor}, {data}, {link_apk}... nos textos dos slides
+
+    Percorre listas, tuplas e dicts; chaves literais devem ser escritas como {{ }}.
+    """
+    if isinstance(valor, str):
+        return valor.format_map(parametros) if "{" in valor else valor
+    if isinstance(valor, dict):
+        return {chave: personalizar(v, parametros) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return type(valor)(personalizar(v, parametros) for v in valor)
+    return valor
+
+
+def campos(valor):
+    """Nomes dos campos usados nos textos (levanta ValueError se houver chave malformada)"""
+    if isinstance(valor, str):
+        if "{" in valor:
+            for _, nome, _, _ in string.Formatter().parse(valor):
+                if nome is not None:
+                    yield nome.split(".")[0].split("[")[0]
+    elif isinstance(valor, dict):
+        for v in valor.values():
+            yield from campos(v)
+    elif isinstance(valor, (list, tuple)):
+        for v in valor:
+            yield from campos(v)
+
+
+def carregar_parametros(caminho):
+    """Lê a lista de parâmetros do lote de um arquivo JSON (lista de objetos) ou CSV"""
+    with open(caminho, encoding="utf-8", newline="") as arquivo:
+        if caminho.lower().endswith(".csv"):
+            return list(csv.DictReader(arquivo))
+        return json.load(arquivo)
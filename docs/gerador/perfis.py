@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+Análise dos perfis cadastrados a partir do dump SQL do Supabase
+
+Entrada: dumps com INSERT em lote, como `profiles_rows.sql`:
+
+    INSERT INTO "public"."profiles" ("id", ..., "created_at") VALUES
+    ('...', ..., '2025-10-23 19:05:07.760563+00'), ('...', ...);
+
+O Supabase grava cada INSERT numa linha só, então o arquivo é lido em
+blocos de TAMANHO_BLOCO caracteres e as tuplas são extraídas do buffer
+uma a uma; a memória depende do tamanho de uma tupla, não do dump.
+
+As linhas vão direto para um SQLite (em memória ou em disco) por
+`executemany` sobre o iterador do parser, numa única transação. Os
+índices de INDICES são criados depois da carga, o que é mais rápido que
+mantê-los a cada INSERT. As consultas dos slides (cadastros por período
+e distribuição por nível de atividade) percorrem só esses índices.
+
+Só biblioteca padrão.
+"""
+
+import datetime
+import functools
+import os
+import re
+import sqlite3
+from itertools import groupby
+from operator import itemgetter
+
+from .esquema import nome_tabela
+from .i18n import decimal, inteiro, marcar, traduzir
+
+TAMANHO_BLOCO = 1 << 20
+# Trecho mantido do fim do buffer enquanto se procura o próximo INSERT
+_CAUDA = 1 << 16
+
+_INSERT = re.compile(
+    r'INSERT\s+INTO\s+((?:"[^"]+"|\w+)(?:\.(?:"[^"]+"|\w+))?)\s*\(([^)]*)\)\s*VALUES\s*', re.I
+)
+# Campo entre aspas ('' é uma aspa) ou literal sem aspas (null, número, booleano)
+_CAMPO = r"(?:'([^']*(?:''[^']*)*)'|([^,\s()']+))"
+# Qualquer tupla, para distinguir tupla malformada de tupla incompleta no fim do buffer
+_TUPLA = re.compile(r"\s*\(((?:'[^']*(?:''[^']*)*'|[^'()])*)\)")
+_LITERAIS = {"null": None, "true": 1, "false": 0}
+
+# Índices criados depois da carga, por tabela
+INDICES = {"profiles": ("activity_level", "created_at")}
+# Colunas de profiles usadas pelas consultas dos slides
+COLUNAS_PERFIS = ("created_at", "activity_level", "age", "weight")
+
+# Afinidade do SQLite pelo início do tipo no schema.sql
+_AFINIDADES = (
+    (("INT", "SMALLINT", "BIGINT", "SERIAL"), "INTEGER"),
+    (("NUMERIC", "DECIMAL", "REAL", "FLOAT", "DOUBLE"), "REAL"),
+    (("BOOL",), "INTEGER"),
+)
+
+# Granularidade dos cadastros: expressão sobre created_at ('AAAA-MM-DD ...') e maior intervalo em dias
+PERIODOS = {
+    "dia": ("substr(created_at, 1, 10)", 92),
+    "semana": ("date(substr(created_at, 1, 10), '-6 days', 'weekday 1')", 731),
+    "mes": ("substr(created_at, 1, 7) || '-01'", None),
+}
+# Por período: nome, formato das datas no eixo do gráfico e texto do pico no resumo
+FORMATOS_PERIODO = {
+    "dia": (marcar("dia"), marcar("dd/mm/yy"), marcar("em {:%d/%m/%Y}")),
+    "semana": (marcar("semana"), marcar("dd/mm/yy"), marcar("na semana de {:%d/%m/%Y}")),
+    "mes": (marcar("mês"), marcar("mm/yyyy"), marcar("em {:%m/%Y}")),
+}
+
+NIVEIS_ATIVIDADE = {
+    "sedentary": marcar("Sedentário"),
+    "low": marcar("Baixo"),
+    "medium": marcar("Moderado"),
+    "high": marcar("Alto"),
+}
+SEM_NIVEL = marcar("Não informado")
+
+
+# ==================== DUMP SQL ====================
+
+def _literal(texto):
+    minusculo = texto.lower()
+    if minusculo in _LITERAIS:
+        return _LITERAIS[minusculo]
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    return texto
+
+
+@functools.lru_cache(maxsize=None)
+def _tupla(n_colunas):
+    """Regex de uma tupla com n_colunas campos e o separador seguinte (",", ";" ou nada)"""
+    return re.compile(r"\s*\(\s*" + r"\s*,\s*".join([_CAMPO] * n_colunas) + r"\s*\)\s*([,;]?)")
+
+
+def _valores(grupos):
+    return tuple([_literal(bruto) if bruto else citado.replace("''", "'")
+                  for citado, bruto in zip(grupos[0:-1:2], grupos[1:-1:2])])
+
+
+def ler_inserts(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera (tabela, colunas, valores) para cada tupla dos INSERT do dump
+
+    `tabela` vem no nome canônico de `esquema.nome_tabela`; `colunas` é a
+    mesma tupla para todas as linhas de um INSERT.
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        buffer, pos, fim = "", 0, False
+        tabela = colunas = tupla = None
+        while True:
+            if tabela is None:
+                m = _INSERT.search(buffer, pos)
+                if m is None:
+                    if fim:
+                        return
+                    pos = max(pos, len(buffer) - _CAUDA)
+                else:
+                    tabela = nome_tabela(m.group(1))
+                    colunas = tuple(nome.strip().strip('"') for nome in m.group(2).split(","))
+                    tupla = _tupla(len(colunas))
+                    pos = m.end()
+                    continue
+            else:
+                # Um match por linha: os campos saem dos grupos da regex, sem segunda passada
+                m = tupla.match(buffer, pos)
+                # Tupla ou separador podem continuar no próximo bloco
+                if m is not None and (m.end() < len(buffer) or fim):
+                    grupos = m.groups()
+                    yield tabela, colunas, _valores(grupos)
+                    pos = m.end()
+                    if grupos[-1] != ",":
+                        tabela = None
+                    continue
+                inteira = _TUPLA.match(buffer, pos)
+                if fim or (m is None and inteira and inteira.end() < len(buffer)):
+                    raise ValueError(f"{caminho}: tupla malformada ou sem {len(colunas)} campos "
+                                     f"perto de {buffer[pos:pos + 80]!r}")
+            bloco = arquivo.read(tamanho_bloco)
+            fim = not bloco
+            buffer, pos = buffer[pos:] + bloco, 0
+
+
+# ==================== SQLITE ====================
+
+def _afinidade(tipo):
+    tipo = tipo.upper()
+    for prefixos, afinidade in _AFINIDADES:
+        if tipo.startswith(prefixos):
+            return afinidade
+    return "TEXT" if tipo else ""
+
+
+def _preparar_tabela(conexao, tabela, colunas, esquema):
+    """Cria a tabela (ou as colunas que faltam) com as afinidades do esquema"""
+    declarada = esquema.tabelas.get(tabela) if esquema else None
+
+    def definicao(coluna):
+        tipo = declarada.colunas[coluna].tipo if declarada and coluna in declarada.colunas else ""
+        return f'"{coluna}" {_afinidade(tipo)}'.rstrip()
+
+    existentes = {linha[1] for linha in conexao.execute(f'PRAGMA table_info("{tabela}")')}
+    if not existentes:
+        conexao.execute(f'CREATE TABLE "{tabela}" ({", ".join(map(definicao, colunas))})')
+    for coluna in colunas:
+        if coluna not in existentes and existentes:
+            conexao.execute(f'ALTER TABLE "{tabela}" ADD COLUMN {definicao(coluna)}')
+
+
+def carregar_dump(caminho, conexao, esquema=None, tamanho_bloco=TAMANHO_BLOCO):
+    """Insere as linhas do dump na conexão SQLite e cria os índices; retorna as linhas inseridas
+
+    Com `esquema` (de `esquema.carregar_esquema`), as colunas recebem a
+    afinidade do tipo declarado, então '67' entra como inteiro em age.
+    """
+    total = 0
+    conexao.execute("PRAGMA synchronous = OFF")
+    conexao.execute("PRAGMA journal_mode = MEMORY")
+    with conexao:
+        for (tabela, colunas), linhas in groupby(ler_inserts(caminho, tamanho_bloco), key=itemgetter(0, 1)):
+            _preparar_tabela(conexao, tabela, colunas, esquema)
+            nomes = ", ".join(f'"{coluna}"' for coluna in colunas)
+            sql = f'INSERT INTO "{tabela}" ({nomes}) VALUES ({", ".join("?" * len(colunas))})'
+            total += conexao.executemany(sql, map(itemgetter(2), linhas)).rowcount
+        tabelas = {linha[0] for linha in conexao.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        for tabela, colunas in INDICES.items():
+            if tabela in tabelas:
+                for coluna in colunas:
+                    conexao.execute(f'CREATE INDEX IF NOT EXISTS "{tabela}_{coluna}" ON "{tabela}" ("{coluna}")')
+    return total
+
+
+def verificar_perfis(conexao, dump):
+    """ValueError se o banco não tem a tabela profiles com as COLUNAS_PERFIS"""
+    colunas = {linha[1] for linha in conexao.execute('PRAGMA table_info("profiles")')}
+    if not colunas:
+        raise ValueError(f"{dump}: o dump não tem INSERT INTO profiles")
+    faltam = [coluna for coluna in COLUNAS_PERFIS if coluna not in colunas]
+    if faltam:
+        raise ValueError(f"{dump}: a tabela profiles do dump não tem as colunas {', '.join(faltam)}")
+
+
+def abrir_perfis(dump, banco=":memory:", esquema=None):
+    """Conexão SQLite com o dump carregado
+
+    Em disco, o banco é reaproveitado enquanto for mais novo que o dump;
+    senão é recarregado num arquivo temporário que substitui o antigo. Um
+    dump sem a tabela profiles (ou sem as COLUNAS_PERFIS) levanta ValueError.
+    """
+    if banco == ":memory:":
+        conexao = sqlite3.connect(banco)
+        try:
+            carregar_dump(dump, conexao, esquema)
+            verificar_perfis(conexao, dump)
+        except BaseException:
+            conexao.close()
+            raise
+        return conexao
+    if not os.path.exists(banco) or os.path.getmtime(banco) < os.path.getmtime(dump):
+        temporario = f"{banco}.{os.getpid()}.tmp"
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        conexao = sqlite3.connect(temporario)
+        try:
+            carregar_dump(dump, conexao, esquema)
+            verificar_perfis(conexao, dump)
+        except BaseException:
+            conexao.close()
+            os.remove(temporario)
+            raise
+        conexao.close()
+        os.replace(temporario, banco)
+    return sqlite3.connect(banco)
+
+
+# ==================== CONSULTAS ====================
+
+def _data(texto):
+    return datetime.date.fromisoformat(texto[:10])
+
+
+def escolher_periodo(conexao):
+    """Menor granularidade de PERIODOS que cobre os cadastros sem passar do limite de dias"""
+    primeiro, ultimo = conexao.execute("SELECT min(created_at), max(created_at) FROM profiles").fetchone()
+    if primeiro is None:
+        return "dia"
+    dias = (_data(ultimo) - _data(primeiro)).days
+    return next(nome for nome, (_, limite) in PERIODOS.items() if limite is None or dias <= limite)
+
+
+def cadastros(conexao, periodo=None):
+    """Lista (data do início do período, perfis criados) em ordem cronológica"""
+    expressao = PERIODOS[periodo or escolher_periodo(conexao)][0]
+    consulta = (f"SELECT {expressao} AS periodo, count(*) FROM profiles "
+                "WHERE created_at IS NOT NULL GROUP BY periodo ORDER BY periodo")
+    return [(_data(inicio), n) for inicio, n in conexao.execute(consulta)]
+
+
+def niveis_atividade(conexao):
+    """Lista (rótulo, perfis) na ordem de NIVEIS_ATIVIDADE; níveis desconhecidos e vazios no fim"""
+    contagens = dict(conexao.execute("SELECT activity_level, count(*) FROM profiles GROUP BY activity_level"))
+    ordem = [nivel for nivel in NIVEIS_ATIVIDADE if nivel in contagens]
+    ordem += sorted(nivel for nivel in contagens if nivel not in NIVEIS_ATIVIDADE and nivel is not None)
+    ordem += [None] if None in contagens else []
+    return [(NIVEIS_ATIVIDADE.get(nivel, nivel) if nivel is not None else SEM_NIVEL, contagens[nivel])
+            for nivel in ordem]
+
+
+def resumo_perfis(conexao):
+    """Totais, data do primeiro cadastro e médias de idade e peso (None sem perfis preenchidos)"""
+    total, com_idade, idade, peso, primeiro = conexao.execute(
+        "SELECT count(*), count(age), avg(age), avg(weight), min(created_at) FROM profiles"
+    ).fetchone()
+    return {"total": total, "com_idade": com_idade, "idade_media": idade, "peso_medio": peso,
+            "primeiro_cadastro": _data(primeiro) if primeiro else None}
+
+
+# ==================== SLIDES ====================
+
+def _periodos(inicio, fim, periodo):
+    """Períodos do calendário entre o primeiro e o último cadastro, inclusive os sem cadastro"""
+    if periodo == "mes":
+        return (fim.year - inicio.year) * 12 + fim.month - inicio.month + 1
+    return (fim - inicio).days // (7 if periodo == "semana" else 1) + 1
+
+
+def slides_perfis(conexao, periodo=None):
+    """Slides de cadastros ao longo do tempo e de distribuição por nível de atividade"""
+    periodo = periodo or escolher_periodo(conexao)
+    serie = cadastros(conexao, periodo)
+    resumo = resumo_perfis(conexao)
+    niveis = niveis_atividade(conexao)
+    nome_periodo, formato_eixo, texto_pico = map(traduzir, FORMATOS_PERIODO[periodo])
+    acumulados, total = [], 0
+    for _, n in serie:
+        total += n
+        acumulados.append(total)
+
+    crescimento = [traduzir("{total} perfis").format(total=inteiro(resumo["total"]))]
+    if serie:
+        (inicio, _), (fim, _) = serie[0], serie[-1]
+        pico = max(serie, key=itemgetter(1))
+        crescimento += [
+            traduzir("Desde {data:%d/%m/%Y}").format(data=resumo["primeiro_cadastro"]),
+            traduzir("Pico: {n} {quando}").format(n=inteiro(pico[1]), quando=texto_pico.format(pico[0])),
+            traduzir("Média: {media} por {periodo}").format(
+                media=decimal(total / _periodos(inicio, fim, periodo)), periodo=nome_periodo),
+        ]
+    perfil = []
+    if resumo["idade_media"] is not None:
+        perfil.append(traduzir("Idade média: {idade} anos").format(idade=inteiro(round(resumo["idade_media"]))))
+    if resumo["peso_medio"] is not None:
+        perfil.append(traduzir("Peso médio: {peso} kg").format(peso=inteiro(round(resumo["peso_medio"]))))
+    if resumo["total"]:
+        perfil.append(traduzir("Perfis com idade: {fracao:.0%}").format(
+            fracao=resumo["com_idade"] / resumo["total"]))
+
+    return [
+        {
+            "nome": "perfis_cadastros",
+            "tipo": "grafico",
+            "titulo": traduzir("CADASTROS AO LONGO DO TEMPO"),
+            "tamanho_titulo": 36,
+            "grafico": {
+                "tipo": "linhas",
+                "categorias": [data for data, _ in serie],
+                "series": [(traduzir("Perfis cadastrados"), acumulados)],
+                "formato_categorias": formato_eixo,
+                "eixo_y": traduzir("Perfis (acumulado)"),
+            },
+            "blocos": [("secao", traduzir("Crescimento"), {"tamanho": 18}),
+                       ("lista", crescimento, {"tamanho": 14})],
+        },
+        {
+            "nome": "perfis_atividade",
+            "tipo": "grafico",
+            "titulo": traduzir("NÍVEL DE ATIVIDADE DOS USUÁRIOS"),
+            "tamanho_titulo": 36,
+            "grafico": {
+                "tipo": "barras",
+                "categorias": [traduzir(rotulo) for rotulo, _ in niveis],
+                "series": [(traduzir("Perfis"), [n for _, n in niveis])],
+                "rotulos": True,
+                "eixo_y": traduzir("Perfis"),
+            },
+            "blocos": [("secao", traduzir("Perfil"), {"tamanho": 18}), ("lista", perfil, {"tamanho": 14})],
+        },
+    ]
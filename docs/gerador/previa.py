@@ -0,0 +1,682 @@
+# -*- coding: utf-8 -*-
+"""
+Prévias PNG dos slides sem PowerPoint (--previa)
+
+Rasteriza com Pillow o subconjunto do pptx que os renderizadores geram:
+
+- caixas de texto e placeholders (posição, âncora e estilo herdados do
+  layout e do mestre), com quebra de linha pelas métricas de `metricas`;
+- formas (rect, roundRect, ellipse, diamond; as demais como retângulo),
+  grupos e conectores retos ou em cotovelo, com pontas de seta;
+- imagens, tabelas e gráficos de colunas, barras e linhas (só as séries,
+  sem eixos nem rótulos).
+
+É uma prévia para revisão, não uma reprodução fiel: não há autoajuste de
+texto, marcadores automáticos, efeitos nem rotação.
+
+Cada PNG fica em cache (em memória e, com `diretorio_cache`, em disco em
+`<diretorio_cache>/previas`) pelo hash do XML do slide e das partes que
+ele cita (layout, mestre, imagens, gráficos); a mesma prévia de outro
+deck é reaproveitada. Em
+`gerar_previas` os slides de todos os decks são divididos entre
+processos, cada um com os seus pacotes abertos uma única vez.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from lxml import etree
+from PIL import Image, ImageDraw
+
+from .leitura import NS, PacoteLido
+from .metricas import fonte
+
+# Largura da prévia de cada slide, em pixels (96 dpi num slide de 10")
+LARGURA_PADRAO = 960
+# Folha de contato: miniaturas por linha, largura de cada uma e margem
+COLUNAS = 4
+LARGURA_MINIATURA = 320
+MARGEM_FOLHA = 12
+
+# Incrementar quando o desenho mudar para o mesmo XML
+VERSAO_PREVIA = 1
+
+_R_ID = f"{{{NS['r']}}}id"
+_R_EMBED = f"{{{NS['r']}}}embed"
+
+EMU_POR_PONTO = 12700
+_INSETS_PADRAO = (91440, 45720, 91440, 45720)  # esquerda, topo, direita, base
+_RECUO_NIVEL = 457200
+_ESPESSURA_LINHA = 9525
+ENTRELINHA = 1.2
+
+_ESTILO_DO_PLACEHOLDER = {"title": "titleStyle", "ctrTitle": "titleStyle", "body": "bodyStyle",
+                          "obj": "bodyStyle", "subTitle": "bodyStyle"}
+_CORES_PADRAO = {"dk1": "000000", "lt1": "FFFFFF", "dk2": "1F497D", "lt2": "EEECE1", "accent1": "4F81BD"}
+
+
+# ==================== PACOTE ====================
+
+class PacotePptx(PacoteLido):
+    """Pacote lido (ver `leitura`) com o tamanho do slide e a chave de cache das prévias"""
+
+    def __init__(self, caminho):
+        super().__init__(caminho)
+        tamanho = self.apresentacao.find("p:sldSz", NS)
+        self.largura, self.altura = int(tamanho.get("cx")), int(tamanho.get("cy"))
+
+    def chave(self, indice, largura):
+        """Hash do XML do slide e do conteúdo das partes que ele cita, transitivamente
+
+        Os nomes das partes não entram: o mesmo slide em outra posição ou
+        noutro deck (com as imagens numeradas de outro jeito) tem a mesma chave.
+        """
+        slide = self.slides[indice]
+        citadas = sorted(self.hash(parte) for parte in self.citadas(slide))
+        dados = "\n".join([str(VERSAO_PREVIA), str(largura), self.hash(slide), *citadas])
+        return hashlib.sha256(dados.encode("ascii")).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _pacote(caminho, mtime_ns, tamanho):
+    return PacotePptx(caminho)
+
+
+def abrir_pacote(caminho):
+    """PacotePptx do arquivo, reaberto só quando o arquivo muda"""
+    estado = os.stat(caminho)
+    return _pacote(caminho, estado.st_mtime_ns, estado.st_size)
+
+
+# ==================== CORES E TEXTO ====================
+
+def _hex(cor):
+    return tuple(int(cor[i:i + 2], 16) for i in (0, 2, 4))
+
+
+class _Tema:
+    """Cores do esquema do tema (com o clrMap do mestre) e estilos de texto do mestre"""
+
+    def __init__(self, pacote, mestre):
+        self.mestre = pacote.xml(mestre)
+        tema = pacote.relacionada(mestre, "theme")
+        cores = dict(_CORES_PADRAO)
+        esquema = pacote.xml(tema).find(".//a:clrScheme", NS) if tema else None
+        for cor in (esquema if esquema is not None else ()):
+            valor = (cor[0].get("lastClr") or cor[0].get("val")) if len(cor) else None
+            if valor:
+                cores[etree.QName(cor).localname] = valor
+        mapa = self.mestre.find("p:clrMap", NS)
+        mapa = dict(mapa.attrib) if mapa is not None else {"tx1": "dk1", "bg1": "lt1", "tx2": "dk2", "bg2": "lt2"}
+        self.cores = {**cores, **{nome: cores.get(alvo, "000000") for nome, alvo in mapa.items()}}
+
+    def cor(self, elemento):
+        """RGB de um srgbClr/schemeClr/sysClr (com lumMod/lumOff/tint/shade); None se ausente"""
+        if elemento is None:
+            return None
+        local = etree.QName(elemento).localname
+        if local == "srgbClr":
+            rgb = _hex(elemento.get("val"))
+        elif local == "schemeClr":
+            rgb = _hex(self.cores.get(elemento.get("val"), "000000"))
+        elif local == "sysClr":
+            rgb = _hex(elemento.get("lastClr", "000000"))
+        else:
+            return None
+        for ajuste in elemento:
+            nome, valor = etree.QName(ajuste).localname, int(ajuste.get("val", 100000)) / 100000
+            if nome in ("lumMod", "shade"):
+                rgb = tuple(c * valor for c in rgb)
+            elif nome == "lumOff":
+                rgb = tuple(c + 255 * valor for c in rgb)
+            elif nome == "tint":
+                rgb = tuple(255 - (255 - c) * valor for c in rgb)
+        return tuple(max(0, min(255, round(c))) for c in rgb)
+
+    def preenchimento(self, pai, estilo=None, referencia="a:fillRef"):
+        """Cor do solidFill de `pai`; sem preenchimento declarado, a do p:style; None se noFill"""
+        if pai is not None:
+            if pai.find("a:noFill", NS) is not None:
+                return None
+            solido = pai.find("a:solidFill", NS)
+            if solido is not None:
+                return self.cor(solido[0] if len(solido) else None)
+        if estilo is not None:
+            ref = estilo.find(referencia, NS)
+            if ref is not None and ref.get("idx", "0") != "0" and len(ref):
+                return self.cor(ref[0])
+        return None
+
+    def estilo_texto(self, tipo_placeholder, nivel):
+        """lvlNpPr do estilo do mestre para o placeholder (otherStyle fora de placeholders)"""
+        nome = _ESTILO_DO_PLACEHOLDER.get(tipo_placeholder, "bodyStyle" if tipo_placeholder else "otherStyle")
+        return self.mestre.find(f"p:txStyles/p:{nome}/a:lvl{nivel + 1}pPr", NS)
+
+
+@lru_cache(maxsize=None)
+def _fonte(tamanho_px, negrito, italico):
+    return fonte(negrito, italico).font_variant(size=max(1, tamanho_px))
+
+
+_larguras = {}
+
+
+def _largura(fonte_px, texto):
+    chave = (id(fonte_px), texto)
+    if chave not in _larguras:
+        if len(_larguras) >= 65536:
+            _larguras.clear()
+        _larguras[chave] = fonte_px.getlength(texto)
+    return _larguras[chave]
+
+
+def _quebrar(texto, fonte_px, largura):
+    """Linhas do texto quebradas por palavras em `largura` pixels (None não quebra)
+
+    Soma as larguras das palavras (sem kerning entre elas), medidas uma vez por fonte.
+    """
+    linhas = []
+    espaco = _largura(fonte_px, " ")
+    for trecho in texto.split("\n"):
+        if largura is None:
+            linhas.append(trecho)
+            continue
+        atual, ocupado = [], 0
+        for palavra in trecho.split(" "):
+            medida = _largura(fonte_px, palavra)
+            if atual and ocupado + espaco + medida > largura:
+                linhas.append(" ".join(atual))
+                atual, ocupado = [], 0
+            ocupado += (espaco if atual else 0) + medida
+            atual.append(palavra)
+        linhas.append(" ".join(atual))
+    return linhas
+
+
+# ==================== DESENHO ====================
+
+def _xfrm(elemento):
+    """(x, y, largura, altura, flipH, flipV) do a:xfrm/p:xfrm, ou None"""
+    xfrm = elemento.find("a:xfrm", NS)
+    if xfrm is None:
+        xfrm = elemento.find("p:xfrm", NS)
+    if xfrm is None or xfrm.find("a:off", NS) is None:
+        return None
+    off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+    return (int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")),
+            xfrm.get("flipH") == "1", xfrm.get("flipV") == "1")
+
+
+class _Desenhista:
+    """Desenha os elementos de um slide numa imagem Pillow"""
+
+    def __init__(self, pacote, parte, largura):
+        self.pacote = pacote
+        self.parte = parte
+        self.escala = largura / pacote.largura
+        self.imagem = Image.new("RGB", (largura, round(pacote.altura * self.escala)), "white")
+        self.desenho = ImageDraw.Draw(self.imagem)
+        self.layout = pacote.relacionada(parte, "slideLayouts")
+        mestre = pacote.relacionada(self.layout, "slideMasters") if self.layout else None
+        self.tema = _Tema(pacote, mestre) if mestre else None
+        self._arvores = [pacote.xml(self.layout).find(".//p:spTree", NS) if self.layout else None,
+                         self.tema.mestre.find(".//p:spTree", NS) if mestre else None]
+
+    def px(self, emu):
+        return emu * self.escala
+
+    # ---------- placeholders ----------
+
+    def _herdados(self, ph):
+        """Placeholders do layout e do mestre que correspondem a `ph`, nessa ordem"""
+        tipo, idx = ph.get("type"), ph.get("idx")
+        herdados = []
+        for arvore in self._arvores:
+            if arvore is None:
+                continue
+            for sp in arvore.iterfind("p:sp", NS):
+                outro = sp.find("p:nvSpPr/p:nvPr/p:ph", NS)
+                if outro is None:
+                    continue
+                if (tipo and outro.get("type", "body") == tipo) or (not tipo and idx and outro.get("idx") == idx) \
+                        or (arvore is self._arvores[1] and not tipo and outro.get("type") == "body"):
+                    herdados.append(sp)
+                    break
+        return herdados
+
+    # ---------- elementos ----------
+
+    def arvore(self, arvore, transformar):
+        for elemento in arvore:
+            local = etree.QName(elemento).localname
+            metodo = getattr(self, f"_el_{local}", None)
+            if metodo is not None:
+                metodo(elemento, transformar)
+
+    def _caixa(self, elemento, transformar, herdados=()):
+        geometria = _xfrm(elemento.find("p:spPr", NS) if elemento.find("p:spPr", NS) is not None else elemento)
+        for sp in herdados:
+            if geometria is not None:
+                break
+            geometria = _xfrm(sp.find("p:spPr", NS))
+        if geometria is None:
+            return None
+        x, y, largura, altura, flip_h, flip_v = geometria
+        (x1, y1), (x2, y2) = transformar(x, y), transformar(x + largura, y + altura)
+        return (self.px(x1), self.px(y1), self.px(x2), self.px(y2)), flip_h, flip_v
+
+    def _el_grpSp(self, grupo, transformar):
+        xfrm = grupo.find("p:grpSpPr/a:xfrm", NS)
+        if xfrm is not None and xfrm.find("a:chExt", NS) is not None:
+            off, ext = xfrm.find("a:off", NS), xfrm.find("a:ext", NS)
+            ch_off, ch_ext = xfrm.find("a:chOff", NS), xfrm.find("a:chExt", NS)
+            ox, oy, cx, cy = (int(v) for v in (off.get("x"), off.get("y"), ext.get("cx"), ext.get("cy")))
+            chx, chy = int(ch_off.get("x")), int(ch_off.get("y"))
+            sx = cx / int(ch_ext.get("cx")) if int(ch_ext.get("cx")) else 1
+            sy = cy / int(ch_ext.get("cy")) if int(ch_ext.get("cy")) else 1
+            externo = transformar
+
+            def transformar(x, y):
+                return externo(ox + (x - chx) * sx, oy + (y - chy) * sy)
+        self.arvore(grupo, transformar)
+
+    def _el_sp(self, sp, transformar):
+        ph = sp.find("p:nvSpPr/p:nvPr/p:ph", NS)
+        herdados = self._herdados(ph) if ph is not None else ()
+        caixa = self._caixa(sp, transformar, herdados)
+        if caixa is None:
+            return
+        retangulo = caixa[0]
+        sp_pr, estilo = sp.find("p:spPr", NS), sp.find("p:style", NS)
+        geometria = sp_pr.find("a:prstGeom", NS) if sp_pr is not None else None
+        forma = geometria.get("prst") if geometria is not None else "rect"
+        preenchimento = self.tema.preenchimento(sp_pr, estilo)
+        contorno = sp_pr.find("a:ln", NS) if sp_pr is not None else None
+        cor_linha = self.tema.preenchimento(contorno, estilo, "a:lnRef")
+        largura_linha = max(1, round(self.px(int(contorno.get("w", _ESPESSURA_LINHA)) if contorno is not None
+                                             else _ESPESSURA_LINHA)))
+        self._forma(forma, retangulo, preenchimento, cor_linha, largura_linha)
+        corpo = sp.find("p:txBody", NS)
+        if corpo is not None:
+            self._texto(corpo, retangulo, ph, herdados, estilo)
+
+    def _forma(self, forma, retangulo, preenchimento, cor_linha, largura_linha):
+        if preenchimento is None and cor_linha is None:
+            return
+        x1, y1, x2, y2 = retangulo
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        opcoes = {"fill": preenchimento, "outline": cor_linha, "width": largura_linha if cor_linha else 0}
+        if forma == "ellipse":
+            self.desenho.ellipse((x1, y1, x2, y2), **opcoes)
+        elif forma == "roundRect":
+            self.desenho.rounded_rectangle((x1, y1, x2, y2), radius=min(x2 - x1, y2 - y1) * 0.16667, **opcoes)
+        elif forma == "diamond":
+            cx, cy = (x1 + x2) / 2, (y1 + y2) / 2
+            self.desenho.polygon([(cx, y1), (x2, cy), (cx, y2), (x1, cy)], **opcoes)
+        elif forma == "line":
+            self.desenho.line((x1, y1, x2, y2), fill=cor_linha, width=largura_linha)
+        else:
+            self.desenho.rectangle((x1, y1, x2, y2), **opcoes)
+
+    def _seta(self, ponta, origem, cor, largura):
+        (x, y), (ox, oy) = ponta, origem
+        comprimento = max(((x - ox) ** 2 + (y - oy) ** 2) ** 0.5, 1e-6)
+        ux, uy = (x - ox) / comprimento, (y - oy) / comprimento
+        tamanho = 3 * largura + 4
+        base = (x - ux * tamanho, y - uy * tamanho)
+        self.desenho.polygon([(x, y), (base[0] - uy * tamanho / 2, base[1] + ux * tamanho / 2),
+                              (base[0] + uy * tamanho / 2, base[1] - ux * tamanho / 2)], fill=cor)
+
+    def _el_cxnSp(self, conector, transformar):
+        caixa = self._caixa(conector, transformar)
+        if caixa is None:
+            return
+        (x1, y1, x2, y2), flip_h, flip_v = caixa
+        if flip_h:
+            x1, x2 = x2, x1
+        if flip_v:
+            y1, y2 = y2, y1
+        sp_pr, estilo = conector.find("p:spPr", NS), conector.find("p:style", NS)
+        linha = sp_pr.find("a:ln", NS)
+        cor = self.tema.preenchimento(linha, estilo, "a:lnRef") or (0, 0, 0)
+        largura = max(1, round(self.px(int(linha.get("w", _ESPESSURA_LINHA)) if linha is not None
+                                       else _ESPESSURA_LINHA)))
+        geometria = sp_pr.find("a:prstGeom", NS)
+        if geometria is not None and geometria.get("prst", "").startswith("bentConnector"):
+            meio = (x1 + x2) / 2
+            pontos = [(x1, y1), (meio, y1), (meio, y2), (x2, y2)]
+        else:
+            pontos = [(x1, y1), (x2, y2)]
+        self.desenho.line(pontos, fill=cor, width=largura, joint="curve")
+        if linha is not None:
+            if linha.find("a:tailEnd", NS) is not None and linha.find("a:tailEnd", NS).get("type", "none") != "none":
+                self._seta(pontos[-1], pontos[-2], cor, largura)
+            if linha.find("a:headEnd", NS) is not None and linha.find("a:headEnd", NS).get("type", "none") != "none":
+                self._seta(pontos[0], pontos[1], cor, largura)
+
+    def _el_pic(self, pic, transformar):
+        caixa = self._caixa(pic, transformar)
+        blip = pic.find("p:blipFill/a:blip", NS)
+        alvo = self.pacote.rels(self.parte).get(blip.get(_R_EMBED)) if blip is not None else None
+        if caixa is None or alvo is None:
+            return
+        x1, y1, x2, y2 = (round(v) for v in caixa[0])
+        if x2 <= x1 or y2 <= y1:
+            return
+        with Image.open(io.BytesIO(self.pacote.ler(alvo))) as original:
+            figura = original.convert("RGBA").resize((x2 - x1, y2 - y1), Image.BILINEAR)
+        self.imagem.paste(figura, (x1, y1), figura)
+
+    def _el_graphicFrame(self, quadro, transformar):
+        caixa = self._caixa(quadro, transformar)
+        if caixa is None:
+            return
+        tabela = quadro.find(".//a:tbl", NS)
+        grafico = quadro.find(".//c:chart", NS)
+        if tabela is not None:
+            self._tabela(tabela, caixa[0])
+        elif grafico is not None:
+            alvo = self.pacote.rels(self.parte).get(grafico.get(_R_ID))
+            if alvo:
+                self._grafico(self.pacote.xml(alvo), caixa[0])
+
+    # ---------- texto ----------
+
+    def _texto(self, corpo, retangulo, ph, herdados, estilo):
+        props = {"lIns": None, "tIns": None, "rIns": None, "bIns": None, "anchor": None, "wrap": None}
+        for body_pr in [corpo.find("a:bodyPr", NS)] + [sp.find("p:txBody/a:bodyPr", NS) for sp in herdados]:
+            for chave in props:
+                if props[chave] is None and body_pr is not None:
+                    props[chave] = body_pr.get(chave)
+        insets = [self.px(int(props[chave]) if props[chave] else padrao)
+                  for chave, padrao in zip(("lIns", "tIns", "rIns", "bIns"), _INSETS_PADRAO)]
+        x1, y1, x2, y2 = retangulo
+        esquerda, topo, direita, base = x1 + insets[0], y1 + insets[1], x2 - insets[2], y2 - insets[3]
+        tipo = ph.get("type", "body") if ph is not None else None
+        cor_estilo = None
+        if estilo is not None and estilo.find("a:fontRef", NS) is not None and len(estilo.find("a:fontRef", NS)):
+            cor_estilo = self.tema.cor(estilo.find("a:fontRef", NS)[0])
+
+        blocos, altura_total = [], 0
+        for paragrafo in corpo.iterfind("a:p", NS):
+            p_pr = paragrafo.find("a:pPr", NS)
+            nivel = int(p_pr.get("lvl", 0)) if p_pr is not None else 0
+            cadeia = [p_pr, corpo.find(f"a:lstStyle/a:lvl{nivel + 1}pPr", NS)]
+            cadeia += [sp.find(f"p:txBody/a:lstStyle/a:lvl{nivel + 1}pPr", NS) for sp in herdados]
+            cadeia.append(self.tema.estilo_texto(tipo, nivel))
+            cadeia = [elemento for elemento in cadeia if elemento is not None]
+            textos = []
+            for filho in paragrafo:
+                local = etree.QName(filho).localname
+                if local in ("r", "fld"):
+                    textos.append(filho.findtext("a:t", "", NS))
+                elif local == "br":
+                    textos.append("\n")
+            primeiro = paragrafo.find("a:r/a:rPr", NS)
+            run_props = ([primeiro] if primeiro is not None else []) + [
+                elemento.find("a:defRPr", NS) for elemento in cadeia if elemento.find("a:defRPr", NS) is not None]
+
+            def atributo(nome, padrao=None):
+                return next((elemento.get(nome) for elemento in run_props if elemento.get(nome) is not None), padrao)
+
+            def de_paragrafo(nome, padrao=None):
+                return next((elemento.get(nome) for elemento in cadeia if elemento.get(nome) is not None), padrao)
+
+            cor = next((self.tema.preenchimento(elemento) for elemento in run_props
+                        if elemento.find("a:solidFill", NS) is not None), None)
+            cor = cor or cor_estilo or self.tema.cor(etree.fromstring(
+                f'<a:schemeClr xmlns:a="{NS["a"]}" val="tx1"/>'))
+            tamanho = int(atributo("sz", 1800)) / 100
+            negrito, italico = atributo("b") in ("1", "true"), atributo("i") in ("1", "true")
+            fonte_px = _fonte(round(self.px(tamanho * EMU_POR_PONTO)), negrito, italico)
+            margem = self.px(int(de_paragrafo("marL", nivel * _RECUO_NIVEL if tipo is None else 0)))
+            espaco_depois = next((int(e.find("a:spcAft/a:spcPts", NS).get("val")) for e in cadeia
+                                  if e.find("a:spcAft/a:spcPts", NS) is not None), 0) / 100
+            largura_util = None if props["wrap"] == "none" else max(direita - esquerda - margem, 1)
+            linhas = _quebrar("".join(textos), fonte_px, largura_util)
+            altura_linha = self.px(tamanho * EMU_POR_PONTO) * ENTRELINHA
+            depois = self.px(espaco_depois * EMU_POR_PONTO)
+            blocos.append((linhas, fonte_px, cor, de_paragrafo("algn", "l"), margem, altura_linha, depois))
+            altura_total += altura_linha * len(linhas) + depois
+
+        ancora = props["anchor"] or "t"
+        y = topo if ancora == "t" else (base - altura_total if ancora == "b" else (topo + base - altura_total) / 2)
+        for linhas, fonte_px, cor, alinhamento, margem, altura_linha, depois in blocos:
+            for linha in linhas:
+                largura_linha = fonte_px.getlength(linha)
+                if alinhamento == "ctr":
+                    x = (esquerda + margem + direita - largura_linha) / 2
+                elif alinhamento == "r":
+                    x = direita - largura_linha
+                else:
+                    x = esquerda + margem
+                self.desenho.text((x, y + (altura_linha - fonte_px.size) / 2), linha, font=fonte_px, fill=cor)
+                y += altura_linha
+            y += depois
+
+    # ---------- tabelas e gráficos ----------
+
+    def _tabela(self, tabela, retangulo):
+        x0, y0 = retangulo[0], retangulo[1]
+        larguras = [self.px(int(coluna.get("w"))) for coluna in tabela.iterfind("a:tblGrid/a:gridCol", NS)]
+        propriedades = tabela.find("a:tblPr", NS)
+        primeira = propriedades is not None and propriedades.get("firstRow") == "1"
+        faixas = propriedades is not None and propriedades.get("bandRow") == "1"
+        destaque = _hex(self.tema.cores.get("accent1", "4F81BD"))
+        clara = tuple(round(255 - (255 - c) * 0.2) for c in destaque)
+        media = tuple(round(255 - (255 - c) * 0.4) for c in destaque)
+        y = y0
+        for i, linha in enumerate(tabela.iterfind("a:tr", NS)):
+            altura = self.px(int(linha.get("h")))
+            x = x0
+            for j, celula in enumerate(linha.iterfind("a:tc", NS)):
+                largura = larguras[j] if j < len(larguras) else 0
+                fundo = self.tema.preenchimento(celula.find("a:tcPr", NS))
+                if fundo is None:
+                    fundo = destaque if primeira and i == 0 else (media if faixas and i % 2 else clara)
+                self.desenho.rectangle((x, y, x + largura, y + altura), fill=fundo, outline=(255, 255, 255))
+                corpo = celula.find("a:txBody", NS)
+                if corpo is not None:
+                    self._texto(corpo, (x, y, x + largura, y + altura), None, (), None)
+                x += largura
+            y += altura
+
+    def _grafico(self, grafico, retangulo):
+        x1, y1, x2, y2 = retangulo
+        margem = min(x2 - x1, y2 - y1) * 0.08
+        x1, y1, x2, y2 = x1 + margem, y1 + margem, x2 - margem, y2 - margem
+        plot = grafico.find(".//c:plotArea", NS)
+        tipo = next((filho for filho in plot if etree.QName(filho).localname in ("barChart", "lineChart")), None)
+        cinza = (191, 191, 191)
+        self.desenho.line([(x1, y1), (x1, y2), (x2, y2)], fill=cinza, width=1)
+        if tipo is None:
+            return
+        series = []
+        for serie in tipo.iterfind("c:ser", NS):
+            pontos = {int(pt.get("idx")): float(pt.findtext("c:v", "0", NS))
+                      for pt in serie.iterfind("c:val//c:pt", NS)}
+            n = int(serie.find("c:val//c:ptCount", NS).get("val")) if serie.find("c:val//c:ptCount", NS) is not None \
+                else len(pontos)
+            sp_pr = serie.find("c:spPr", NS)
+            cor = self.tema.preenchimento(sp_pr) or self.tema.preenchimento(
+                sp_pr.find("a:ln", NS) if sp_pr is not None else None) or _hex(self.tema.cores["accent1"])
+            series.append(([pontos.get(i) for i in range(n)], cor))
+        valores = [v for pontos, _ in series for v in pontos if v is not None]
+        if not valores:
+            return
+        maximo = max(max(valores), 0) or 1
+        n = max(len(pontos) for pontos, _ in series)
+        horizontal = etree.QName(tipo).localname == "barChart" and tipo.find("c:barDir", NS).get("val") == "bar"
+        if etree.QName(tipo).localname == "lineChart":
+            for pontos, cor in series:
+                coordenadas = [(x1 + (x2 - x1) * (i + 0.5) / n, y2 - (y2 - y1) * v / maximo)
+                               for i, v in enumerate(pontos) if v is not None]
+                if len(coordenadas) > 1:
+                    self.desenho.line(coordenadas, fill=cor, width=2)
+            return
+        passo = ((y2 - y1) if horizontal else (x2 - x1)) / n
+        largura_barra = passo * 0.7 / len(series)
+        for s, (pontos, cor) in enumerate(series):
+            for i, v in enumerate(pontos):
+                if not v:
+                    continue
+                inicio = i * passo + passo * 0.15 + s * largura_barra
+                if horizontal:
+                    # Primeira categoria no topo, como o eixo invertido dos gráficos de barras
+                    self.desenho.rectangle((x1, y1 + inicio, x1 + (x2 - x1) * v / maximo,
+                                            y1 + inicio + largura_barra), fill=cor)
+                else:
+                    self.desenho.rectangle((x1 + inicio, y2 - (y2 - y1) * v / maximo,
+                                            x1 + inicio + largura_barra, y2), fill=cor)
+
+
+def renderizar_slide(pacote, indice, largura=LARGURA_PADRAO):
+    """Imagem Pillow (RGB) do slide `indice` (a partir de 0) do PacotePptx"""
+    parte = pacote.slides[indice]
+    desenhista = _Desenhista(pacote, parte, largura)
+    desenhista.arvore(pacote.xml(parte).find("p:cSld/p:spTree", NS), lambda x, y: (x, y))
+    return desenhista.imagem
+
+
+# ==================== CACHE E LOTE ====================
+
+# Prévias e miniaturas guardadas em memória (--observar refaz as prévias a cada
+# edição); acima disso sai a usada há mais tempo
+LIMITE_MEMORIA = 512
+
+_memoria = {}
+_miniaturas = {}
+
+
+def _lembrar(memoria, chave, valor):
+    memoria[chave] = valor
+    if len(memoria) > LIMITE_MEMORIA:
+        del memoria[next(iter(memoria))]
+    return valor
+
+
+def _png(imagem):
+    saida = io.BytesIO()
+    imagem.save(saida, "PNG", compress_level=1)
+    return saida.getvalue()
+
+
+def previa_png(caminho, indice, largura=LARGURA_PADRAO, diretorio_cache=None):
+    """PNG do slide `indice` do .pptx, do cache quando o XML do slide e as suas partes não mudaram"""
+    pacote = abrir_pacote(caminho)
+    chave = pacote.chave(indice, largura)
+    if chave in _memoria:
+        return _lembrar(_memoria, chave, _memoria.pop(chave))
+    diretorio = os.path.join(diretorio_cache, "previas") if diretorio_cache else None
+    arquivo = os.path.join(diretorio, f"{chave}.png") if diretorio else None
+    if arquivo and os.path.exists(arquivo):
+        with open(arquivo, "rb") as entrada:
+            png = entrada.read()
+    else:
+        png = _png(renderizar_slide(pacote, indice, largura))
+        if arquivo:
+            os.makedirs(diretorio, exist_ok=True)
+            fd, temporario = tempfile.mkstemp(dir=diretorio, suffix=".tmp")
+            with os.fdopen(fd, "wb") as saida:
+                saida.write(png)
+            os.replace(temporario, arquivo)
+    return _lembrar(_memoria, chave, png)
+
+
+def limpar_memoria():
+    """Esquece as prévias e miniaturas guardadas em memória (o cache em disco continua)"""
+    _memoria.clear()
+    _miniaturas.clear()
+
+
+def _novo_processo():
+    # Os zips abertos antes do fork compartilham a posição do arquivo com o processo pai
+    _pacote.cache_clear()
+
+
+def _previa_na_tarefa(tarefa):
+    return previa_png(*tarefa)
+
+
+def previas(caminhos, largura=LARGURA_PADRAO, jobs=1, diretorio_cache=None):
+    """{caminho: [PNG de cada slide]} para os decks, com os slides divididos entre `jobs` processos"""
+    tarefas = [(caminho, indice, largura, diretorio_cache)
+               for caminho in caminhos for indice in range(len(abrir_pacote(caminho).slides))]
+    if jobs <= 1 or len(tarefas) <= 1:
+        pngs = [_previa_na_tarefa(tarefa) for tarefa in tarefas]
+    else:
+        with ProcessPoolExecutor(min(jobs, len(tarefas)), initializer=_novo_processo) as pool:
+            pngs = list(pool.map(_previa_na_tarefa, tarefas, chunksize=max(1, len(tarefas) // (jobs * 4))))
+    resultado = {caminho: [] for caminho in caminhos}
+    for (caminho, *_), png in zip(tarefas, pngs):
+        resultado[caminho].append(png)
+    return resultado
+
+
+def _miniatura(png, largura):
+    # Decodificar e reduzir custa mais que desenhar; slides iguais entre decks têm o mesmo PNG
+    chave = (png, largura)
+    if chave in _miniaturas:
+        return _lembrar(_miniaturas, chave, _miniaturas.pop(chave))
+    with Image.open(io.BytesIO(png)) as imagem:
+        altura = round(imagem.height * largura / imagem.width)
+        miniatura = imagem.convert("RGB").resize((largura, altura), Image.BILINEAR, reducing_gap=2.0)
+    return _lembrar(_miniaturas, chave, miniatura)
+
+
+def folha_de_contato(pngs, colunas=COLUNAS, largura_miniatura=LARGURA_MINIATURA):
+    """Imagem com as miniaturas dos slides em grade, numeradas"""
+    miniaturas = [_miniatura(png, largura_miniatura) for png in pngs]
+    if not miniaturas:
+        return Image.new("RGB", (largura_miniatura + 2 * MARGEM_FOLHA, 2 * MARGEM_FOLHA), "white")
+    altura_celula = max(m.height for m in miniaturas) + MARGEM_FOLHA * 2
+    colunas = min(colunas, len(miniaturas))
+    linhas = -(-len(miniaturas) // colunas)
+    folha = Image.new("RGB", (colunas * (largura_miniatura + MARGEM_FOLHA) + MARGEM_FOLHA,
+                              linhas * altura_celula + MARGEM_FOLHA), (230, 230, 230))
+    desenho = ImageDraw.Draw(folha)
+    rotulo = _fonte(MARGEM_FOLHA, False, False)
+    for i, miniatura in enumerate(miniaturas):
+        x = MARGEM_FOLHA + (i % colunas) * (largura_miniatura + MARGEM_FOLHA)
+        y = MARGEM_FOLHA * 2 + (i // colunas) * altura_celula
+        folha.paste(miniatura, (x, y))
+        desenho.text((x, y - MARGEM_FOLHA - 2), str(i + 1), font=rotulo, fill=(80, 80, 80))
+    return folha
+
+
+def _nomes(caminhos):
+    """Nome de cada deck relativo ao diretório comum a todos, sem a extensão"""
+    absolutos = [os.path.abspath(caminho) for caminho in caminhos]
+    if not absolutos:
+        return {}
+    base = os.path.commonpath([os.path.dirname(caminho) for caminho in absolutos])
+    return {caminho: os.path.splitext(os.path.relpath(absoluto, base))[0]
+            for caminho, absoluto in zip(caminhos, absolutos)}
+
+
+def gerar_previas(caminhos, diretorio, largura=LARGURA_PADRAO, jobs=1, diretorio_cache=None, slides=True):
+    """Grava `<deck>.png` (folha de contato) e, com `slides`, `<deck>/NN.png` em `diretorio`
+
+    `<deck>` é o caminho do deck relativo ao diretório comum a todos, de modo
+    que decks de mesmo nome em diretórios diferentes não se sobrescrevem.
+    Retorna a lista de folhas de contato, na ordem de `caminhos`.
+    """
+    nomes = _nomes(caminhos)
+    folhas = []
+    for caminho, pngs in previas(caminhos, largura, jobs, diretorio_cache).items():
+        nome = nomes[caminho]
+        os.makedirs(os.path.join(diretorio, os.path.dirname(nome)), exist_ok=True)
+        if slides:
+            os.makedirs(os.path.join(diretorio, nome), exist_ok=True)
+            for i, png in enumerate(pngs, 1):
+                with open(os.path.join(diretorio, nome, f"{i:02d}.png"), "wb") as saida:
+                    saida.write(png)
+        folha = os.path.join(diretorio, f"{nome}.png")
+        folha_de_contato(pngs).save(folha, compress_level=1)
+        folhas.append(folha)
+    return folhas
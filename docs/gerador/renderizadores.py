@@ -0,0 +1,563 @@
+# -*- coding: utf-8 -*-
+"""
+Renderizadores de slides a partir da especificação declarativa
+
+Um slide é um dict com "tipo" e os dados do seu conteúdo:
+
+    {"tipo": "conteudo", "titulo": "INTRODUÇÃO", "blocos": [
+        ("secao", "OBJETIVO GERAL"),
+        ("lista", ["item 1", "item 2"], {"tamanho": 15}),
+    ]}
+
+    {"tipo": "caixas", "caixas": [
+        ((0.5, 2, 9, 1), "VIVAFIT SENIORS", "destaque"),
+    ]}
+
+Cada bloco é (tipo, conteudo) ou (tipo, conteudo, opcoes), onde as opções
+ajustam o estilo base do bloco (tamanho, negrito, cor, nivel, espaco_depois...).
+
+    {"tipo": "tabela", "titulo": "TABELA profiles", "descricao": "...",
+     "cabecalho": ["Coluna", "Tipo"], "linhas": [["id", "UUID"]],
+     "larguras": (4.5, 4.5)}
+
+    {"tipo": "diagrama", "titulo": "ARQUITETURA", "arquivo": "docs/arquitetura.drawio"}
+
+    {"tipo": "er", "titulo": "MODELO DE DADOS", "arquivo": "vivafit_seniors.json",
+     "relacoes": "relationships.csv", "max_campos": 6}
+
+    {"tipo": "grafico", "titulo": "MÉTRICAS", "grafico": {...}, "blocos": [...]}
+
+(o formato de "grafico" está em `graficos`).
+
+Slides de conteúdo que não cabem na caixa são reduzidos ou divididos
+antes de renderizar; ver `ajustar_slide`.
+
+Renderizar é montar o slide no modelo intermediário (`montar_slide`, ver
+`modelo`) e rebaixá-lo para o XML do pptx numa passada (`baixar_slide`).
+
+Qualquer slide pode ter também "imagens": uma lista de (caminho, caixa),
+com a caixa em polegadas; ver `imagens.galeria`.
+
+Slides só de texto são escritos direto como XML (`emissor`); "emissor":
+"pptx" num slide o faz passar pelas formas do python-pptx, e "xml" exige
+o emissor direto.
+"""
+
+import io
+import weakref
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.parts.slide import SlidePart
+from pptx.util import Inches
+
+from .diagrama_er import carregar_diagrama_er
+from .drawio import CONVERSOR, desenhar
+from .emissor import ParteSerializada, emitir_slide
+from .estilos import aplicar_estilo, aplicar_estilo_setters, escalar, estilo, tema_atual
+from .graficos import adicionar_grafico
+from .i18n import traduzir
+from .imagens import PIPELINE, encaixar
+from .metricas import MARGEM_VERTICAL, altura_paragrafo
+from .modelo import CaixaTexto, Paragrafo, Quadro, Slide, Tabela, baixar_quadro, paragrafos_do_texto
+from .padroes import CAMPOS_ARQUIVO, FONTE_MINIMA
+
+LAYOUT_TITULO = 5
+LAYOUT_BRANCO = 6
+
+# Caixa de conteúdo padrão dos slides com título
+CAIXA_CONTEUDO = (0.5, 1.5, 9, 5.5)
+# Slides de gráfico com texto: gráfico à esquerda, blocos à direita
+CAIXA_GRAFICO = (0.5, 1.5, 6.2, 5.5)
+CAIXA_LATERAL = (6.8, 1.5, 2.7, 5.5)
+
+# Altura das linhas e da descrição dos slides de tabela, em polegadas
+ALTURA_LINHA = 0.4
+ALTURA_DESCRICAO = 0.5
+
+
+class _Coletor:
+    """Recebe os parágrafos que os blocos produzem, já escalados"""
+
+    def __init__(self, escala=1):
+        self._escala = escala
+        self.paragrafos = []
+
+    def paragrafo(self, texto, est):
+        if self._escala != 1:
+            est = escalar(est, self._escala)
+        self.paragrafos.append(Paragrafo(texto, est))
+
+
+# ==================== BLOCOS ====================
+
+def _bloco_paragrafo(nome):
+    def renderizar(esc, texto, opcoes):
+        esc.paragrafo(texto, estilo(nome, **opcoes))
+    return renderizar
+
+
+def _bloco_espaco(esc, pontos, opcoes):
+    esc.paragrafo("", estilo("espaco", espaco_depois=pontos, **opcoes))
+
+
+def _bloco_lista(esc, itens, opcoes):
+    opcoes = dict(opcoes)
+    marcador = opcoes.pop("marcador", "• ")
+    est = estilo("marcador", **opcoes)
+    for item in itens:
+        esc.paragrafo(f"{marcador}{item}", est)
+
+
+def _bloco_pares(esc, pares, opcoes):
+    """Pares (titulo, desc), como limitacoes e recomendacoes"""
+    marcador = opcoes.get("marcador", "")
+    est_titulo = estilo("item_titulo", **opcoes.get("titulo", {}))
+    est_desc = estilo("item_desc", **opcoes.get("desc", {}))
+    for titulo, desc in pares:
+        esc.paragrafo(f"{marcador}{titulo}", est_titulo)
+        esc.paragrafo(desc, est_desc)
+
+
+def _bloco_topicos(esc, topicos, opcoes):
+    """Trincas (topico, autores, desc) da fundamentação teórica"""
+    est_titulo = estilo("item_titulo", **opcoes.get("titulo", {}))
+    est_autores = estilo("autores", **opcoes.get("autores", {}))
+    est_desc = estilo("item_desc", **opcoes.get("desc", {}))
+    for topico, autores, desc in topicos:
+        esc.paragrafo(topico, est_titulo)
+        esc.paragrafo(traduzir("Autores: {autores}").format(autores=autores), est_autores)
+        esc.paragrafo(desc, est_desc)
+
+
+def _bloco_grupos(esc, grupos, opcoes):
+    """Grupos (titulo, [itens]) seguidos de um espaçamento"""
+    est_titulo = estilo("item_titulo", **opcoes.get("titulo", {}))
+    lista = opcoes.get("itens", {})
+    espaco = opcoes.get("espaco", 6)
+    for titulo, itens in grupos:
+        esc.paragrafo(titulo, est_titulo)
+        _bloco_lista(esc, itens, lista)
+        _bloco_espaco(esc, espaco, {})
+
+
+BLOCOS = {
+    "secao": _bloco_paragrafo("secao"),
+    "texto": _bloco_paragrafo("texto"),
+    "nota": _bloco_paragrafo("nota"),
+    "espaco": _bloco_espaco,
+    "lista": _bloco_lista,
+    "pares": _bloco_pares,
+    "topicos": _bloco_topicos,
+    "grupos": _bloco_grupos,
+}
+
+
+def _escrever(esc, blocos):
+    for bloco in blocos:
+        tipo, conteudo = bloco[0], bloco[1]
+        opcoes = bloco[2] if len(bloco) > 2 else {}
+        BLOCOS[tipo](esc, conteudo, opcoes)
+
+
+def paragrafos_dos_blocos(blocos, escala=1):
+    """Parágrafos (`modelo.Paragrafo`) que os blocos produzem"""
+    coletor = _Coletor(escala)
+    _escrever(coletor, blocos)
+    return coletor.paragrafos
+
+
+# ==================== SLIDES ====================
+
+def _titulo(spec):
+    est = estilo("titulo", tamanho=spec.get("tamanho_titulo", 40))
+    return Quadro(paragrafos_do_texto(spec["titulo"], est, so_primeiro=True))
+
+
+def _montar_conteudo(spec):
+    """Slide com título e caixa de conteúdo"""
+    conteudo = Quadro(paragrafos_dos_blocos(spec["blocos"], spec.get("escala", 1)), quebra=True)
+    return Slide(spec, layout_do_slide(spec), _titulo(spec), [CaixaTexto("conteúdo", CAIXA_CONTEUDO, conteudo)])
+
+
+def _montar_caixas(spec):
+    """Slide em branco com caixas de texto posicionadas livremente"""
+    caixas = []
+    for caixa in spec["caixas"]:
+        pos, texto, nome = caixa[0], caixa[1], caixa[2]
+        est = estilo(nome, **(caixa[3] if len(caixa) > 3 else {}))
+        rotulo = f"caixa {texto.splitlines()[0][:30]!r}" if texto else "caixa"
+        caixas.append(CaixaTexto(rotulo, pos, Quadro(paragrafos_do_texto(texto, est))))
+    return Slide(spec, layout_do_slide(spec), None, caixas)
+
+
+def _montar_tabela(spec):
+    """Slide com título, descrição opcional e tabela (cabeçalho + linhas)"""
+    x, y, largura, _ = CAIXA_CONTEUDO
+    caixas = []
+    if spec.get("descricao"):
+        descricao = paragrafos_dos_blocos([("nota", spec["descricao"], {"alinhamento": "esquerda"})])
+        caixas.append(CaixaTexto("descrição", (x, y, largura, ALTURA_DESCRICAO), Quadro(descricao, quebra=True)))
+        y += ALTURA_DESCRICAO
+
+    cabecalho, linhas = spec["cabecalho"], spec["linhas"]
+    larguras = spec.get("larguras") or [largura / len(cabecalho)] * len(cabecalho)
+    est_cabecalho, est_celula = estilo("cabecalho_tabela"), estilo("celula")
+    celulas = [[Quadro(paragrafos_do_texto(texto, est_cabecalho)) for texto in cabecalho]]
+    celulas += [[Quadro(paragrafos_do_texto(texto, est_celula)) for texto in valores] for valores in linhas]
+    posicao = (x, y, sum(larguras), ALTURA_LINHA * (len(linhas) + 1))
+    return Slide(spec, layout_do_slide(spec), _titulo(spec), caixas,
+                 Tabela(posicao, larguras, celulas, tema_atual().primaria))
+
+
+def _montar_com_titulo(spec):
+    """Slide com título e conteúdo nativo (diagramas), desenhado no rebaixamento"""
+    return Slide(spec, layout_do_slide(spec), _titulo(spec))
+
+
+def _montar_grafico(spec):
+    """Slide com título, gráfico nativo e, se houver blocos, texto ao lado"""
+    caixas = []
+    if spec.get("blocos"):
+        lateral = Quadro(paragrafos_dos_blocos(spec["blocos"]), quebra=True)
+        caixas.append(CaixaTexto("texto ao lado do gráfico", CAIXA_LATERAL, lateral))
+    return Slide(spec, layout_do_slide(spec), _titulo(spec), caixas)
+
+
+MONTADORES = {
+    "conteudo": _montar_conteudo,
+    "caixas": _montar_caixas,
+    "tabela": _montar_tabela,
+    "diagrama": _montar_com_titulo,
+    "er": _montar_com_titulo,
+    "grafico": _montar_grafico,
+}
+
+
+def montar_slide(spec):
+    """Modelo intermediário (`modelo.Slide`) do slide descrito por `spec`"""
+    return MONTADORES[spec["tipo"]](spec)
+
+
+# ==================== CONTEÚDO NATIVO ====================
+
+def _desenhar_diagrama(slide, spec):
+    """Diagrama do draw.io desenhado com formas nativas"""
+    desenhar(slide, CONVERSOR.converter(spec["arquivo"]), spec.get("caixa", CAIXA_CONTEUDO))
+
+
+def _desenhar_er(slide, spec):
+    """Diagrama entidade-relacionamento com layout automático"""
+    opcoes = {chave: spec[chave] for chave in ("largura_camada", "max_campos", "rotulos") if chave in spec}
+    diagrama = carregar_diagrama_er(spec["arquivo"], spec.get("relacoes"), tema=tema_atual(), **opcoes)
+    desenhar(slide, diagrama, spec.get("caixa", CAIXA_CONTEUDO))
+
+
+def _desenhar_grafico(slide, spec):
+    caixa = CAIXA_GRAFICO if spec.get("blocos") else CAIXA_CONTEUDO
+    adicionar_grafico(slide, spec["grafico"], spec.get("caixa", caixa))
+
+
+# Conteúdo desenhado pelo python-pptx depois do texto do slide
+NATIVOS = {
+    "diagrama": _desenhar_diagrama,
+    "er": _desenhar_er,
+    "grafico": _desenhar_grafico,
+}
+
+LAYOUTS_PADRAO = {
+    "conteudo": LAYOUT_TITULO,
+    "caixas": LAYOUT_BRANCO,
+    "tabela": LAYOUT_TITULO,
+    "diagrama": LAYOUT_TITULO,
+    "er": LAYOUT_TITULO,
+    "grafico": LAYOUT_TITULO,
+}
+
+
+def arquivos_do_slide(spec):
+    """Arquivos lidos pelo renderizador do slide (o conteúdo deles entra na chave do cache)"""
+    return [spec[campo] for campo in CAMPOS_ARQUIVO if spec.get(campo)]
+
+
+def layout_do_slide(spec):
+    """Índice do layout do template usado pelo slide"""
+    return spec.get("layout", LAYOUTS_PADRAO[spec["tipo"]])
+
+
+# ==================== AJUSTE ====================
+
+# Passo da redução da fonte antes de dividir o conteúdo em slides de continuação
+PASSO_ESCALA = 0.05
+
+# Blocos cujo conteúdo é uma lista que pode ser dividida entre slides
+BLOCOS_DIVISIVEIS = {"lista", "pares", "topicos", "grupos"}
+
+
+def _altura_util(spec):
+    """Altura disponível para os parágrafos, em pontos, até a primeira imagem dentro da caixa"""
+    _, topo, _, altura = CAIXA_CONTEUDO
+    base = min([caixa[1] for _, caixa in spec.get("imagens", ()) if topo < caixa[1] < topo + altura],
+               default=topo + altura)
+    return (base - topo) * 72 - MARGEM_VERTICAL
+
+
+def _altura(blocos, escala=1):
+    largura = CAIXA_CONTEUDO[2] * 72
+    return sum(altura_paragrafo(texto, est, largura) for texto, est in paragrafos_dos_blocos(blocos, escala))
+
+
+def _escala_minima(blocos):
+    """Menor escala que não deixa parágrafo nenhum abaixo de FONTE_MINIMA
+
+    Com algum parágrafo já abaixo do mínimo (ou sem tamanho definido) a
+    fonte não é reduzida.
+    """
+    tamanhos = [est.tamanho for texto, est in paragrafos_dos_blocos(blocos) if texto.strip()]
+    if not tamanhos or None in tamanhos or min(tamanhos) < FONTE_MINIMA:
+        return 1
+    return FONTE_MINIMA / min(tamanhos)
+
+
+def _unidades(blocos):
+    """Divide os blocos nas menores partes renderizadas juntas (um item, um par...)"""
+    for bloco in blocos:
+        if bloco[0] in BLOCOS_DIVISIVEIS and len(bloco[1]) > 1:
+            for item in bloco[1]:
+                yield (bloco[0], [item]) + tuple(bloco[2:])
+        else:
+            yield bloco
+
+
+def _juntar(blocos):
+    """Reagrupa unidades consecutivas do mesmo bloco"""
+    juntos = []
+    for bloco in blocos:
+        anterior = juntos[-1] if juntos else None
+        if anterior and bloco[0] in BLOCOS_DIVISIVEIS and anterior[0] == bloco[0] and anterior[2:] == bloco[2:]:
+            juntos[-1] = (bloco[0], anterior[1] + bloco[1]) + tuple(bloco[2:])
+        else:
+            juntos.append(bloco)
+    return juntos
+
+
+def _paginar(blocos, limite):
+    """Distribui os blocos em páginas de até `limite` pontos"""
+    paginas, atual, ocupado = [], [], 0.0
+    for unidade in _unidades(blocos):
+        if unidade[0] == "espaco" and not atual:
+            continue
+        altura = _altura([unidade])
+        if atual and ocupado + altura > limite:
+            # Título de seção não fica sozinho no fim da página
+            pendentes = []
+            while atual and atual[-1][0][0] == "secao":
+                pendentes.insert(0, atual.pop())
+            paginas.append(_juntar(bloco for bloco, _ in atual))
+            atual = pendentes
+            ocupado = sum(alt for _, alt in atual)
+        atual.append((unidade, altura))
+        ocupado += altura
+    paginas.append(_juntar(bloco for bloco, _ in atual))
+    return [pagina for pagina in paginas if pagina]
+
+
+def ajustar_slide(spec):
+    """Slides resultantes de `spec` com o conteúdo cabendo na caixa
+
+    Slides de conteúdo que transbordam têm a fonte reduzida em passos de
+    PASSO_ESCALA enquanto nenhum parágrafo fica abaixo de FONTE_MINIMA
+    (`_escala_minima`); se ainda não couberem, os blocos são
+    divididos em slides de continuação. "ajuste" na especificação controla
+    o comportamento: "paginar" não reduz a fonte e False desliga o ajuste.
+    """
+    ajuste = spec.get("ajuste", True)
+    if spec["tipo"] != "conteudo" or ajuste is False:
+        return [spec]
+    blocos = spec["blocos"]
+    limite = _altura_util(spec)
+    if _altura(blocos) <= limite:
+        return [spec]
+
+    escala, minima = 1 - PASSO_ESCALA, _escala_minima(blocos)
+    while ajuste != "paginar" and escala >= minima - 1e-9:
+        if _altura(blocos, escala) <= limite:
+            return [{**spec, "escala": escala}]
+        escala = round(escala - PASSO_ESCALA, 2)
+
+    paginas = _paginar(blocos, limite)
+    slides = [{**spec, "blocos": paginas[0]}]
+    titulo = traduzir("{titulo} (cont.)").format(titulo=spec["titulo"])
+    for i, pagina in enumerate(paginas[1:], start=2):
+        continuacao = {**spec, "titulo": titulo, "blocos": pagina}
+        continuacao.pop("imagens", None)
+        if "nome" in spec:
+            continuacao["nome"] = f"{spec['nome']}_{i}"
+        slides.append(continuacao)
+    return slides
+
+
+def ajustar_slides(slides):
+    """Aplica `ajustar_slide` a toda a lista"""
+    return [ajustado for spec in slides for ajustado in ajustar_slide(spec)]
+
+
+# ==================== REBAIXAMENTO ====================
+
+# Menor id de slide válido (p:sldId)
+MENOR_ID_SLIDE = 256
+
+# {parte da apresentação: (número de slides, último <p:sldId>)}
+_contagens = weakref.WeakKeyDictionary()
+
+
+def contar_slides(prs):
+    """Número de slides da apresentação, sem percorrer a lista a cada slide novo
+
+    len() de um elemento do lxml conta os filhos um a um. A contagem fica
+    guardada com o último <p:sldId> e só é refeita se a lista mudou por fora.
+    """
+    lista = prs.slides._sldIdLst
+    ultimo = next(reversed(lista), None)
+    contagem, visto = _contagens.get(prs.part, (0, None))
+    if visto is not ultimo:
+        contagem = len(lista)
+    return contagem
+
+
+def _nome_slide(prs):
+    return PackURI(f"/ppt/slides/slide{contar_slides(prs) + 1}.xml")
+
+
+def acrescentar_parte(prs, parte):
+    """Relaciona a parte de um slide à apresentação e a põe no fim da lista de slides
+
+    O python-pptx procura uma relação igual e o maior id de slide a cada
+    slide novo, percorrendo todos os anteriores. Aqui a relação é sempre
+    nova e os ids são crescentes (os slides só são acrescentados no fim),
+    então o custo de um slide não depende de quantos já existem.
+    """
+    lista = prs.slides._sldIdLst
+    ultimo = next(reversed(lista), None)
+    contagem = contar_slides(prs)
+    rId = prs.part.rels._add_relationship(RT.SLIDE, parte)
+    novo = lista._add_sldId(id=(ultimo.id if ultimo is not None else MENOR_ID_SLIDE - 1) + 1, rId=rId)
+    _contagens[prs.part] = (contagem + 1, novo)
+    return rId
+
+
+def acrescentar_xml(prs, layout, xml):
+    """Acrescenta à apresentação um slide cujo XML já está serializado; retorna a parte"""
+    parte = ParteSerializada(_nome_slide(prs), prs.part.package, xml)
+    parte.relate_to(layout.part, RT.SLIDE_LAYOUT)
+    acrescentar_parte(prs, parte)
+    return parte
+
+
+def novo_slide(prs, layout):
+    """Slide vazio no fim da apresentação, com os placeholders do layout"""
+    parte = SlidePart.new(_nome_slide(prs), prs.part.package, layout.part)
+    parte.slide.shapes.clone_layout_placeholders(layout)
+    acrescentar_parte(prs, parte)
+    return parte.slide
+
+
+def _baixar_tabela(slide, tabela, aplicar):
+    x, y, largura, altura = tabela.posicao
+    forma = slide.shapes.add_table(len(tabela.linhas), len(tabela.larguras),
+                                   Inches(x), Inches(y), Inches(largura), Inches(altura))
+    for coluna, larg in zip(forma.table.columns, tabela.larguras):
+        coluna.width = Inches(larg)
+    for i, (linha, quadros) in enumerate(zip(forma.table.rows, tabela.linhas)):
+        for celula, quadro in zip(linha.cells, quadros):
+            if i == 0:
+                celula.fill.solid()
+                celula.fill.fore_color.rgb = tabela.fundo
+            baixar_quadro(celula._tc.get_or_add_txBody(), quadro, aplicar)
+
+
+def _inserir_imagens(slide, imagens):
+    """Imagens redimensionadas pelo pipeline e centralizadas nas suas caixas"""
+    for caminho, caixa in imagens:
+        preparada = PIPELINE.preparar(caminho, caixa[2], caixa[3])
+        x, y, largura, altura = encaixar(preparada, caixa)
+        slide.shapes.add_picture(io.BytesIO(preparada.dados), Inches(x), Inches(y), Inches(largura), Inches(altura))
+
+
+def so_texto(modelo):
+    """Slides só com título e caixas de texto, que o `emissor` escreve sozinho"""
+    spec = modelo.spec
+    return modelo.tabela is None and spec["tipo"] not in NATIVOS and not spec.get("imagens")
+
+
+def _emitir(modelo, aplicar):
+    """Se o slide vai pelo emissor direto: "xml" força, "pptx" evita; o padrão é quando dá"""
+    emissor = modelo.spec.get("emissor")
+    if emissor == "xml" and not so_texto(modelo):
+        raise ValueError("emissor 'xml' só escreve slides de texto, sem tabela, gráfico, diagrama ou imagem")
+    if emissor is None:
+        return aplicar is aplicar_estilo and so_texto(modelo)
+    return emissor == "xml"
+
+
+def baixar_slide(prs, modelo, aplicar=aplicar_estilo):
+    """Escreve o slide do modelo na apresentação, numa passada; retorna a parte do slide
+
+    Slides de texto são escritos direto como XML (`emissor`). Nos demais,
+    título, caixas de texto e células recebem os parágrafos prontos
+    (`modelo.baixar_quadro`); gráficos, diagramas e imagens são
+    desenhados pelo python-pptx depois do texto.
+    """
+    layout = prs.slide_layouts[modelo.layout]
+    if _emitir(modelo, aplicar):
+        return acrescentar_xml(prs, layout, emitir_slide(modelo, layout))
+    slide = novo_slide(prs, layout)
+    if modelo.titulo is not None:
+        baixar_quadro(slide.shapes.title._element.txBody, modelo.titulo, aplicar)
+    for caixa in modelo.caixas:
+        forma = slide.shapes.add_textbox(*(Inches(v) for v in caixa.posicao))
+        if caixa.quadro.quebra:
+            forma.text_frame.word_wrap = True
+        baixar_quadro(forma._element.txBody, caixa.quadro, aplicar)
+    if modelo.tabela is not None:
+        _baixar_tabela(slide, modelo.tabela, aplicar)
+    if modelo.spec["tipo"] in NATIVOS:
+        NATIVOS[modelo.spec["tipo"]](slide, modelo.spec)
+    _inserir_imagens(slide, modelo.spec.get("imagens", ()))
+    return slide.part
+
+
+def renderizar_slide(prs, spec, aplicar=aplicar_estilo):
+    """Adiciona à apresentação o slide descrito por `spec`; retorna a parte do slide"""
+    return baixar_slide(prs, montar_slide(spec), aplicar)
+
+
+def nova_apresentacao(template=None):
+    """Cria apresentação vazia no formato 4:3 usado pelo TCC"""
+    prs = Presentation(template)
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    return prs
+
+
+def construir_apresentacao(slides, compilado=True, prs=None, cache=None, ajustar=True):
+    """Constrói a apresentação completa a partir da lista de slides
+
+    `prs` permite partir de uma apresentação já carregada (ver `lote`) e
+    `cache` (um `cache.CacheSlides`) reaproveita slides já renderizados.
+    Com `compilado=False` os estilos são aplicados pelos setters do
+    python-pptx, o que serve de referência no benchmark. `ajustar` passa
+    os slides por `ajustar_slides` antes de renderizar.
+    """
+    aplicar = aplicar_estilo if compilado else aplicar_estilo_setters
+    if prs is None:
+        prs = nova_apresentacao()
+    if ajustar:
+        slides = ajustar_slides(slides)
+    for spec in slides:
+        if cache is None:
+            renderizar_slide(prs, spec, aplicar)
+        else:
+            cache.renderizar(prs, spec, aplicar)
+    return prs
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+Revisão dos slides finais antes de salvar
+
+Onde `validacao` confere a estrutura da especificação, aqui as regras
+olham o que vai para a tela: os slides já personalizados e ajustados,
+montados no mesmo modelo intermediário que `construir_apresentacao`
+rebaixa para o pptx (ver `modelo`). Cada slide é reduzido uma vez às
+suas caixas de texto (posição, parágrafos com o estilo resolvido pelo
+tema, cor de fundo) e as regras de REGRAS rodam sobre elas:
+
+    fonte_minima     fonte abaixo de FONTE_MINIMA (público idoso), exceto o
+                     padrão de tabelas e gráficos (FONTE_DENSA)
+    contraste        razão de contraste WCAG da cor do texto sobre o fundo
+    transbordamento  texto maior que a caixa, tabela ou caixa fora do slide
+    links            URLs malformadas, com campos {…} sem valor ou (online) sem resposta
+    ortografia       palavras grudadas, como "Perguntascontextual", pela lista
+                     de palavras em VOCABULARIO
+
+Diagramas (draw.io e ER) e o interior dos gráficos ficam de fora: as
+formas são desenhadas pelo conversor e o texto do gráfico pelo PowerPoint;
+do gráfico só a fonte e a cor entram na revisão.
+
+`revisar` recebe várias apresentações, revisa cada slide distinto uma
+única vez (em lote, os slides que não dependem dos parâmetros se repetem
+em todas) e distribui os slides entre processos com `jobs > 1`. O tempo
+de cada regra é somado e devolvido com os problemas.
+"""
+
+import bisect
+import os
+import re
+import time
+import urllib.error
+import urllib.request
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from .estilos import ESTILOS, Estilo, tema_atual, usar_tema
+from .graficos import TAMANHO_FONTE, preparar
+from .i18n import idioma_atual, usar_idioma
+from .metricas import MARGEM_HORIZONTAL, TAMANHO_PADRAO, altura_texto, largura_palavra
+from .padroes import FONTE_MINIMA
+from .renderizadores import ALTURA_LINHA, CAIXA_CONTEUDO, CAIXA_GRAFICO, montar_slide
+
+# Contraste mínimo WCAG AA; texto grande (>= 18 pt, ou 14 pt em negrito) aceita 3:1
+CONTRASTE_MINIMO = 4.5
+CONTRASTE_TEXTO_GRANDE = 3.0
+
+# Slide 4:3 e caixa do título do layout "Somente título" do template, em polegadas
+TAMANHO_SLIDE = (10, 7.5)
+CAIXA_TITULO = (0.5, 0.3, 9, 1.25)
+
+# Tabelas e gráficos são conteúdo denso e ficam de propósito abaixo de FONTE_MINIMA:
+# {caixa: tamanho padrão do gerador (antes do tema)} que fonte_minima não aponta
+FONTE_DENSA = {
+    "tabela": ESTILOS["celula"].tamanho,
+    "gráfico": TAMANHO_FONTE,
+}
+
+# Lista de palavras da regra de ortografia, uma por linha
+VOCABULARIO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vocabulario.txt")
+# Palavras grudadas: duas partes conhecidas de pelo menos PARTE_MINIMA letras; advérbios
+# em -mente são uma junção legítima
+PARTE_MINIMA = 5
+SUFIXOS_LEGITIMOS = ("mente",)
+RADICAL_MINIMO = 7  # primeira parte a partir da qual vale outra flexão do mesmo radical
+
+TEMPO_LINK = 5  # segundos por requisição na verificação online
+
+# Caixa de texto do slide: posição (x, y, largura, altura) em polegadas, parágrafos
+# (texto, estilo resolvido), cor de fundo e quebra de linha (None: texto não medido)
+Caixa = namedtuple("Caixa", "nome posicao paragrafos fundo quebra")
+Problema = namedtuple("Problema", "apresentacao slide nome regra mensagem")
+Revisao = namedtuple("Revisao", "problemas tempos slides revisados")
+
+
+# ==================== CAIXAS ====================
+
+def _caixa_conteudo(spec):
+    """Caixa de conteúdo até a primeira imagem que começa dentro dela"""
+    x, topo, largura, altura = CAIXA_CONTEUDO
+    base = min([caixa[1] for _, caixa in spec.get("imagens", ()) if topo < caixa[1] < topo + altura],
+               default=topo + altura)
+    return x, topo, largura, base - topo
+
+
+def _paragrafos(quadro):
+    return [(p.texto, p.estilo) for p in quadro.paragrafos if p.estilo is not None]
+
+
+def _celulas(tabela):
+    """Caixas das células da tabela, linha a linha, na altura mínima da linha"""
+    x, y, _, _ = tabela.posicao
+    for i, quadros in enumerate(tabela.linhas):
+        fundo = tabela.fundo if i == 0 else tema_atual().clara
+        esquerda = x
+        for quadro, largura in zip(quadros, tabela.larguras):
+            yield Caixa("tabela", (esquerda, y + i * ALTURA_LINHA, largura, ALTURA_LINHA), _paragrafos(quadro),
+                        fundo, True)
+            esquerda += largura
+
+
+def caixas_do_slide(spec):
+    """Caixas de texto do slide no modelo intermediário (`renderizadores.montar_slide`)"""
+    tema = tema_atual()
+    modelo = montar_slide(spec)
+    caixas = []
+    if modelo.titulo is not None:
+        # O título do layout tem autoajuste (normAutofit): o PowerPoint reduz a fonte em vez de transbordar
+        caixas.append(Caixa("título", CAIXA_TITULO, _paragrafos(modelo.titulo), tema.clara, None))
+    for caixa in modelo.caixas:
+        posicao = _caixa_conteudo(spec) if caixa.nome == "conteúdo" else caixa.posicao
+        caixas.append(Caixa(caixa.nome, posicao, _paragrafos(caixa.quadro), tema.clara, bool(caixa.quadro.quebra)))
+    if modelo.tabela is not None:
+        caixas.extend(_celulas(modelo.tabela))
+    if spec["tipo"] == "grafico":
+        categorias, series = preparar(spec["grafico"])
+        rotulos = [str(c) for c in categorias] + [nome for nome, _ in series]
+        rotulos += [spec["grafico"][eixo] for eixo in ("eixo_x", "eixo_y") if spec["grafico"].get(eixo)]
+        est = Estilo(tamanho=tema.tamanho(TAMANHO_FONTE), cor=tema.texto)
+        caixa = spec.get("caixa", CAIXA_GRAFICO if spec.get("blocos") else CAIXA_CONTEUDO)
+        caixas.append(Caixa("gráfico", caixa, [(r, est) for r in rotulos], tema.clara, None))
+    return caixas
+
+
+def _trecho(texto, limite=40):
+    texto = " ".join(texto.split())
+    return repr(texto if len(texto) <= limite else texto[:limite - 1] + "…")
+
+
+# ==================== REGRAS ====================
+
+def _regra_fonte_minima(spec, caixas):
+    tema, pequenos = tema_atual(), {}
+    for caixa in caixas:
+        minimo = min(FONTE_MINIMA, tema.tamanho(FONTE_DENSA.get(caixa.nome, FONTE_MINIMA)))
+        for texto, est in caixa.paragrafos:
+            if texto.strip() and est.tamanho and est.tamanho < minimo:
+                pequenos.setdefault((caixa.nome, minimo), []).append((est.tamanho, texto))
+    for (nome, minimo), lista in pequenos.items():
+        tamanho, texto = min(lista)
+        yield (f"fonte de {tamanho:g} pt em {nome} (mínimo {minimo:g} pt), "
+               f"{len(lista)} parágrafo(s), ex.: {_trecho(texto)}")
+
+
+def _luminancia(cor):
+    def canal(valor):
+        valor /= 255
+        return valor / 12.92 if valor <= 0.03928 else ((valor + 0.055) / 1.055) ** 2.4
+    r, g, b = (canal(v) for v in cor)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+@lru_cache(maxsize=None)
+def contraste(cor, fundo):
+    """Razão de contraste WCAG 2 entre duas cores RGB (de 1 a 21)"""
+    claro, escuro = sorted((_luminancia(cor), _luminancia(fundo)), reverse=True)
+    return (claro + 0.05) / (escuro + 0.05)
+
+
+def _texto_grande(est):
+    return (est.tamanho or 0) >= 18 or (est.negrito and (est.tamanho or 0) >= 14)
+
+
+def _regra_contraste(spec, caixas):
+    vistos = set()
+    for caixa in caixas:
+        for texto, est in caixa.paragrafos:
+            if not texto.strip() or est.cor is None:
+                continue
+            minimo = CONTRASTE_TEXTO_GRANDE if _texto_grande(est) else CONTRASTE_MINIMO
+            razao = contraste(tuple(est.cor), tuple(caixa.fundo))
+            chave = (str(est.cor), str(caixa.fundo), minimo)
+            if razao < minimo and chave not in vistos:
+                vistos.add(chave)
+                yield (f"contraste {razao:.2f}:1 de #{est.cor} sobre #{caixa.fundo} em {caixa.nome} "
+                       f"(mínimo {minimo:g}:1 a {est.tamanho:g} pt), ex.: {_trecho(texto)}")
+
+
+def _largura_linha(texto, est):
+    """Largura em polegadas de uma linha sem quebra, com as margens da caixa"""
+    return (largura_palavra(texto, est.negrito, est.italico) * (est.tamanho or TAMANHO_PADRAO) + MARGEM_HORIZONTAL) / 72
+
+
+def _regra_transbordamento(spec, caixas):
+    largura_slide, altura_slide = TAMANHO_SLIDE
+    linhas_tabela = {}
+    for caixa in caixas:
+        x, y, largura, altura = caixa.posicao
+        if caixa.quebra is None:
+            continue
+        if not caixa.quebra:
+            # Sem quebra de linha a caixa cresce com o texto: só não pode sair do slide
+            largura = max(_largura_linha(texto, est) for texto, est in caixa.paragrafos)
+            necessaria = altura_texto(caixa.paragrafos, float("inf")) / 72
+            if x + largura > largura_slide:
+                yield f"{caixa.nome} passa da borda direita do slide em {x + largura - largura_slide:.2f}\""
+            if y + necessaria > altura_slide:
+                yield f"{caixa.nome} passa da borda inferior do slide em {y + necessaria - altura_slide:.2f}\""
+            continue
+        necessaria = altura_texto(caixa.paragrafos, largura * 72) / 72
+        if caixa.nome == "tabela":
+            # As linhas da tabela crescem com o texto da célula mais alta
+            linhas_tabela[y] = max(linhas_tabela.get(y, altura), necessaria)
+        elif necessaria > altura + 0.005:
+            yield (f"texto transborda {caixa.nome} em {necessaria - altura:.2f}\" "
+                   f"({necessaria:.2f}\" numa caixa de {altura:.2f}\")")
+    if linhas_tabela:
+        base = min(linhas_tabela) + sum(linhas_tabela.values())
+        if base > altura_slide:
+            yield (f"tabela passa da borda inferior do slide em {base - altura_slide:.2f}\" "
+                   f"({len(linhas_tabela)} linhas)")
+
+
+_URL = re.compile(r"(?:https?://|www\.)[^\s<>\"')\]]+")
+
+
+@lru_cache(maxsize=None)
+def _responde(url):
+    pedido = urllib.request.Request(url, method="HEAD", headers={"User-Agent": "vivafit-apresentacao"})
+    try:
+        with urllib.request.urlopen(pedido, timeout=TEMPO_LINK) as resposta:
+            return resposta.status < 400, str(resposta.status)
+    except urllib.error.HTTPError as erro:
+        # Alguns servidores não aceitam HEAD: só 404 e 410 contam como link quebrado
+        return erro.code not in (404, 410), str(erro.code)
+    except (urllib.error.URLError, OSError) as erro:
+        return False, str(getattr(erro, "reason", erro))
+
+
+def _erro_url(url):
+    if "{" in url or "}" in url:
+        return "campo sem valor"
+    partes = urlsplit(url if "://" in url else f"http://{url}")
+    if partes.scheme not in ("http", "https"):
+        return f"esquema {partes.scheme!r}"
+    if not partes.hostname or "." not in partes.hostname:
+        return "domínio inválido"
+    return None
+
+
+def _regra_links(spec, caixas):
+    urls = {url.rstrip(".,;:") for caixa in caixas for texto, _ in caixa.paragrafos for url in _URL.findall(texto)}
+    for url in sorted(urls):
+        erro = _erro_url(url)
+        if erro is None and _processo.get("online"):
+            ok, situacao = _responde(url if "://" in url else f"http://{url}")
+            erro = None if ok else f"sem resposta ({situacao})"
+        if erro:
+            yield f"link quebrado, {erro}: {url}"
+
+
+@lru_cache(maxsize=None)
+def vocabulario(caminho=VOCABULARIO):
+    """Palavras (minúsculas, em ordem) da lista `caminho`; linhas com # são comentários"""
+    with open(caminho, encoding="utf-8") as f:
+        return sorted({linha.strip().lower() for linha in f if linha.strip() and not linha.startswith("#")})
+
+
+def _contem(palavras, palavra):
+    i = bisect.bisect_left(palavras, palavra)
+    return i < len(palavras) and palavras[i] == palavra
+
+
+def _conhecida(parte, palavras, flexao=False):
+    """A parte é uma palavra do vocabulário ou o seu plural; com `flexao`, também outra
+    flexão de mesmo tamanho (±1) que só difere na última letra, como perguntas/perguntar"""
+    formas = [parte]
+    if parte.endswith("s"):
+        formas += [parte[:-1], parte[:-2]] if parte.endswith("es") else [parte[:-1]]
+    if any(_contem(palavras, forma) for forma in formas):
+        return True
+    if not flexao or len(parte) < RADICAL_MINIMO:
+        return False
+    radical = parte[:-1]
+    i = bisect.bisect_left(palavras, radical)
+    while i < len(palavras) and palavras[i].startswith(radical):
+        if abs(len(palavras[i]) - len(parte)) <= 1:
+            return True
+        i += 1
+    return False
+
+
+def _grudadas(palavra, palavras):
+    """(início, fim) se a palavra desconhecida for duas palavras sem o espaço, senão None"""
+    minuscula = palavra.lower()
+    if len(minuscula) < 2 * PARTE_MINIMA or minuscula.endswith(SUFIXOS_LEGITIMOS) or _conhecida(minuscula, palavras):
+        return None
+    for corte in range(PARTE_MINIMA, len(minuscula) - PARTE_MINIMA + 1):
+        if _conhecida(minuscula[:corte], palavras, flexao=True) and _conhecida(minuscula[corte:], palavras):
+            return palavra[:corte], palavra[corte:]
+    return None
+
+
+def _regra_ortografia(spec, caixas):
+    palavras = vocabulario()
+    vistas = set()
+    for caixa in caixas:
+        for texto, _ in caixa.paragrafos:
+            for palavra in re.findall(r"[^\W\d_]+", _URL.sub(" ", texto)):
+                partes = palavra not in vistas and _grudadas(palavra, palavras)
+                vistas.add(palavra)
+                if partes:
+                    yield f"palavras grudadas? {palavra!r} ({' '.join(partes)!r}) em {caixa.nome}"
+
+
+REGRAS = {
+    "fonte_minima": _regra_fonte_minima,
+    "contraste": _regra_contraste,
+    "transbordamento": _regra_transbordamento,
+    "links": _regra_links,
+    "ortografia": _regra_ortografia,
+}
+
+
+# ==================== REVISÃO ====================
+
+def revisar_slide(spec):
+    """([(regra, mensagem)], {regra: segundos}) de um slide, no tema e idioma ativos"""
+    tempos = {}
+    inicio = time.perf_counter()
+    caixas = caixas_do_slide(spec)
+    tempos["caixas"] = time.perf_counter() - inicio
+    problemas = []
+    for nome, regra in REGRAS.items():
+        inicio = time.perf_counter()
+        problemas += [(nome, mensagem) for mensagem in regra(spec, caixas)]
+        tempos[nome] = time.perf_counter() - inicio
+    return problemas, tempos
+
+
+# Estado de cada processo do pool (e do processo principal em série)
+_processo = {}
+
+
+def _iniciar_processo(tema, online):
+    if tema is not None:
+        usar_tema(tema)
+    _processo["online"] = online
+
+
+def _revisar_no_processo(tarefa):
+    idioma, spec = tarefa
+    if idioma is not None and idioma != idioma_atual():
+        usar_idioma(idioma)
+    return revisar_slide(spec)
+
+
+def revisar(decks, jobs=1, tema=None, online=False):
+    """Revisa os slides finais de cada apresentação
+
+    `decks` é uma lista de (nome, slides) ou (nome, slides, idioma), com
+    os slides já personalizados e ajustados. Slides iguais (mesma
+    especificação e idioma) são revisados uma vez. Com `jobs > 1` os slides
+    são distribuídos entre processos, cada um com o `tema` ativado; `online`
+    confere também se os links respondem. Retorna uma `Revisao` com os
+    problemas na ordem das apresentações e dos slides, o tempo somado de
+    cada regra e o número de slides e de slides revisados.
+    """
+    tarefas, indices, ocorrencias = [], {}, []
+    for nome, slides, *idioma in decks:
+        idioma = idioma[0] if idioma else None
+        for i, spec in enumerate(slides, 1):
+            chave = (idioma, repr(spec))
+            if chave not in indices:
+                indices[chave] = len(tarefas)
+                tarefas.append((idioma, spec))
+            ocorrencias.append((nome, i, spec.get("nome", ""), indices[chave]))
+
+    anterior, online_anterior = (tema_atual(), idioma_atual()), _processo.get("online")
+    if jobs <= 1 or len(tarefas) <= 1:
+        _iniciar_processo(tema, online)
+        try:
+            resultados = [_revisar_no_processo(tarefa) for tarefa in tarefas]
+        finally:
+            usar_tema(anterior[0])
+            usar_idioma(anterior[1])
+            _processo["online"] = online_anterior
+    else:
+        jobs = min(jobs, len(tarefas))
+        with ProcessPoolExecutor(jobs, initializer=_iniciar_processo, initargs=(tema, online)) as pool:
+            resultados = list(pool.map(_revisar_no_processo, tarefas,
+                                       chunksize=max(1, len(tarefas) // (jobs * 4))))
+
+    tempos = Counter()
+    for _, tempos_slide in resultados:
+        tempos.update(tempos_slide)
+    problemas = [Problema(nome, i, nome_slide, regra, mensagem)
+                 for nome, i, nome_slide, indice in ocorrencias
+                 for regra, mensagem in resultados[indice][0]]
+    return Revisao(problemas, dict(tempos), len(ocorrencias), len(tarefas))
+
+
+def formatar(revisao, tempos=True, marca="✗"):
+    """Linhas de texto com os problemas e, com `tempos`, o tempo de cada regra"""
+    for p in revisao.problemas:
+        rotulo = f"slide {p.slide}" + (f" ({p.nome})" if p.nome else "")
+        yield f"{marca} {p.apresentacao + ': ' if p.apresentacao else ''}{rotulo}: [{p.regra}] {p.mensagem}"
+    if not tempos:
+        return
+    contagem = Counter(p.regra for p in revisao.problemas)
+    for regra in ("caixas", *REGRAS):
+        yield f"  {regra:<16} {revisao.tempos.get(regra, 0) * 1000:8.1f} ms  {contagem.get(regra, 0):4d} problema(s)"
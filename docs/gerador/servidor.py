@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Servidor de renderização num socket Unix local
+
+O servidor importa o motor, carrega o template e renderiza a apresentação
+uma vez para aquecer os caches (estilos compilados, medições de texto,
+imagens); depois atende pedidos de renderização sem pagar de novo a
+importação do python-pptx e do lxml. Os pedidos são atendidos um por vez.
+Os caches em memória têm tamanho limitado (estilos e <a:pPr> compilados,
+imagens e diagramas por LIMITE_MEMORIA), então o processo não cresce sem
+fim num servidor de longa duração.
+
+Protocolo: uma linha JSON por conexão, respondida com outra linha JSON.
+
+    {"saida": "/abs/apresentacao.pptx", "parametros": {"autor": "..."},
+     "compressao": "padrao"}
+    -> {"ok": true, "saida": "...", "ms": 41.2}
+
+    {"comando": "parar"} -> {"ok": true}
+
+Um pedido que falha (inclusive uma linha que não é um objeto JSON) é
+respondido com {"ok": false, "erro": "..."} e o servidor segue atendendo.
+
+O cliente (`enviar`) só usa a biblioteca padrão.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import stat
+import time
+
+
+def enviar(caminho_socket, pedido):
+    """Envia um pedido ao servidor e retorna a resposta"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        conexao.connect(caminho_socket)
+        with conexao.makefile("rwb") as canal:
+            canal.write(json.dumps(pedido, ensure_ascii=False).encode("utf-8") + b"\n")
+            canal.flush()
+            return json.loads(canal.readline())
+
+
+def _remover_socket(caminho):
+    """Remove um socket antigo; recusa apagar qualquer outro tipo de arquivo"""
+    try:
+        modo = os.stat(caminho).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(modo):
+        raise FileExistsError(f"{caminho} existe e não é um socket")
+    os.unlink(caminho)
+
+
+def servir(caminho_socket, slides, padrao=None, template=None, diretorio_cache=None, compressao=None):
+    """Atende pedidos de renderização até receber {"comando": "parar"}
+
+    `slides`, `padrao`, `template` e `diretorio_cache` têm o mesmo papel que
+    em `lote.gerar_lote`; `compressao` é o padrão dos pedidos que não a
+    informam.
+    """
+    from . import lote
+    from .pacote import salvar
+    from .renderizadores import construir_apresentacao
+
+    modelo = lote.ModeloBase(template)
+    cache = lote._abrir_cache(diretorio_cache, template)
+    salvar(construir_apresentacao(lote.personalizar(slides, padrao or {}), prs=modelo.clonar()), io.BytesIO(),
+           compressao=compressao, entradas=modelo.entradas)
+
+    _remover_socket(caminho_socket)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as servidor:
+        servidor.bind(caminho_socket)
+        os.chmod(caminho_socket, 0o600)
+        servidor.listen()
+        print(f"✓ Servidor pronto em {caminho_socket}", flush=True)
+        try:
+            while True:
+                conexao, _ = servidor.accept()
+                pedido = {}
+                try:
+                    with conexao, conexao.makefile("rwb") as canal:
+                        try:
+                            pedido = _ler_pedido(canal)
+                        except ValueError as erro:
+                            resposta = {"ok": False, "erro": f"pedido inválido: {erro}"}
+                        else:
+                            if pedido.get("comando") == "parar":
+                                resposta = {"ok": True}
+                            else:
+                                resposta = _atender(modelo, cache, slides, padrao, compressao, pedido)
+                        canal.write(json.dumps(resposta, ensure_ascii=False).encode("utf-8") + b"\n")
+                except OSError:  # o cliente desistiu antes da resposta
+                    pass
+                if pedido.get("comando") == "parar":
+                    break
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(caminho_socket)
+
+
+def _ler_pedido(canal):
+    """Pedido JSON de uma linha; ValueError se não for um objeto JSON"""
+    pedido = json.loads(canal.readline() or "{}")
+    if not isinstance(pedido, dict):
+        raise ValueError(f"esperado um objeto JSON, recebido {type(pedido).__name__}")
+    return pedido
+
+
+def _atender(modelo, cache, slides, padrao, compressao, pedido):
+    from . import lote
+
+    inicio = time.perf_counter()
+    try:
+        parametros = {**(padrao or {}), **pedido.get("parametros", {})}
+        data_hora = tuple(pedido["data_hora"]) if pedido.get("data_hora") else None
+        saida = lote._gerar(modelo, cache, slides, parametros, pedido["saida"], data_hora,
+                            pedido.get("compressao", compressao))
+    except Exception as erro:  # o servidor continua atendendo os próximos pedidos
+        return {"ok": False, "erro": f"{type(erro).__name__}: {erro}"}
+    return {"ok": True, "saida": saida, "ms": round((time.perf_counter() - inicio) * 1000, 1)}
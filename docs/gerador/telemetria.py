@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+Métricas de cache e latência lidas dos logs do app
+
+Entrada: JSONL com uma entrada do `src/lib/logger.ts` por linha (ou o
+array exportado por `exportLogs()`). Os campos vêm de `data` ou, em
+amostras planas, do próprio objeto:
+
+    {"timestamp": "...", "level": "debug", "message": "exercicio",
+     "data": {"cache": "hit", "ms": 12.5}}
+    {"cache": "miss", "latencia_ms": 840}
+
+`cache` ("hit"/"miss") conta acertos e falhas; a latência vem do primeiro
+de CAMPOS_LATENCIA presente. Linhas que não citam nenhum desses campos
+são descartadas sem passar pelo parser JSON; JSON malformado e latências
+que não são um número finito e não negativo (o parser aceita Infinity e
+NaN) são contados em `Telemetria.invalidas`.
+
+Os arquivos são lidos numa única passada e as amostras não são guardadas:
+cada latência cai num histograma logarítmico (baldes de razão
+1 + PRECISAO), então p50/p95/p99 saem com erro relativo de no máximo
+PRECISAO e a memória depende só da faixa de valores, não do número de
+amostras. Só biblioteca padrão.
+"""
+
+import json
+import math
+import re
+from collections import Counter
+
+from .agregacao import passo_redondo
+from .i18n import inteiro, marcar, traduzir
+
+CAMPO_CACHE = "cache"
+CAMPOS_LATENCIA = ("ms", "latencia_ms", "duration_ms")
+_RELEVANTE = re.compile(r'"(?:cache|ms|latencia_ms|duration_ms)"')
+_decodificar = json.JSONDecoder().decode
+
+# Erro relativo máximo dos quantis
+PRECISAO = 0.01
+_LOG_RAZAO = math.log1p(PRECISAO)
+_POR_LOG_RAZAO = 1 / _LOG_RAZAO
+QUANTIS = (0.5, 0.95, 0.99)
+
+
+class HistogramaLatencia:
+    """Latências em baldes logarítmicos: quantis aproximados em memória constante"""
+
+    def __init__(self):
+        self.contagens = Counter()
+        self.total = 0
+        self.soma = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+
+    def adicionar(self, ms):
+        """Registra uma amostra em milissegundos (número finito)"""
+        self.contagens[math.ceil(math.log(ms) * _POR_LOG_RAZAO) if ms > 0 else -math.inf] += 1
+        self.total += 1
+        self.soma += ms
+        if ms < self.minimo:
+            self.minimo = ms
+        if ms > self.maximo:
+            self.maximo = ms
+
+    def mesclar(self, outro):
+        """Soma as amostras de outro histograma a este"""
+        self.contagens.update(outro.contagens)
+        self.total += outro.total
+        self.soma += outro.soma
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+
+    def _valor(self, indice):
+        valor = 0.0 if indice == -math.inf else math.exp(indice * _LOG_RAZAO)
+        return min(max(valor, self.minimo), self.maximo)
+
+    def media(self):
+        return self.soma / self.total if self.total else None
+
+    def quantil(self, q):
+        """Valor no quantil `q` (0 a 1) pelo posto mais próximo; None sem amostras"""
+        if not self.total:
+            return None
+        alvo = max(1, math.ceil(q * self.total))
+        acumulado = 0
+        for indice in sorted(self.contagens):
+            acumulado += self.contagens[indice]
+            if acumulado >= alvo:
+                return self._valor(indice)
+        return self.maximo
+
+    def faixas(self, n_faixas=20, limite=None):
+        """Histograma linear (inicio, fim, contagem) de 0 até `limite` (padrão: p99)
+
+        A largura das faixas é arredondada para 1, 2 ou 5 × 10^k; amostras
+        acima do limite vão para a última faixa, que fica aberta (fim None).
+        """
+        if not self.total:
+            return []
+        limite = limite or self.quantil(0.99) or self.maximo or 1
+        largura = passo_redondo(limite / n_faixas)
+        n = min(n_faixas, math.ceil(limite / largura))
+        contagens = [0] * (n + 1)
+        for indice, contagem in self.contagens.items():
+            contagens[min(int(self._valor(indice) // largura), n)] += contagem
+        faixas = [(i * largura, (i + 1) * largura, contagens[i]) for i in range(n)]
+        if contagens[n]:
+            faixas.append((n * largura, None, contagens[n]))
+        return faixas
+
+
+class Telemetria:
+    """Acertos e falhas de cache e latências por resultado do cache"""
+
+    def __init__(self):
+        self.acertos = 0
+        self.falhas = 0
+        self.invalidas = 0
+        self.latencias_acerto = HistogramaLatencia()
+        self.latencias_falha = HistogramaLatencia()
+        self.latencias_sem_cache = HistogramaLatencia()
+
+    @property
+    def latencias(self):
+        """Histograma de todas as latências"""
+        todas = HistogramaLatencia()
+        for parcial in (self.latencias_acerto, self.latencias_falha, self.latencias_sem_cache):
+            todas.mesclar(parcial)
+        return todas
+
+    def registrar(self, entrada):
+        """Conta uma entrada do log (dict)"""
+        dados = entrada.get("data")
+        if not isinstance(dados, dict):
+            dados = entrada
+        cache = dados.get(CAMPO_CACHE)
+        if cache == "hit":
+            self.acertos += 1
+            latencias = self.latencias_acerto
+        elif cache == "miss":
+            self.falhas += 1
+            latencias = self.latencias_falha
+        else:
+            latencias = self.latencias_sem_cache
+        for campo in CAMPOS_LATENCIA:
+            ms = dados.get(campo)
+            if ms is not None:
+                if type(ms) in (int, float) and math.isfinite(ms) and ms >= 0:
+                    latencias.adicionar(ms)
+                else:
+                    self.invalidas += 1
+                break
+
+    def taxa_acerto(self):
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else None
+
+    def reducao_latencia(self):
+        """Redução da mediana de latência dos acertos em relação às falhas (requisições diretas)"""
+        acerto, falha = self.latencias_acerto.quantil(0.5), self.latencias_falha.quantil(0.5)
+        return 1 - acerto / falha if acerto is not None and falha else None
+
+
+def _entradas(arquivo, telemetria):
+    for linha in arquivo:
+        texto = linha.strip()
+        if not texto:
+            continue
+        if texto[0] == "[":
+            # Array de exportLogs(): o logger guarda poucas entradas, então cabe em memória
+            yield from json.loads(texto + arquivo.read())
+            return
+        if not _RELEVANTE.search(texto):
+            continue
+        try:
+            entrada = _decodificar(texto)
+        except ValueError:
+            telemetria.invalidas += 1
+            continue
+        if isinstance(entrada, dict):
+            yield entrada
+
+
+def ler_telemetria(caminhos, telemetria=None):
+    """Acumula os arquivos de log (JSONL ou array JSON) numa Telemetria"""
+    telemetria = telemetria or Telemetria()
+    for caminho in caminhos:
+        with open(caminho, encoding="utf-8") as arquivo:
+            for entrada in _entradas(arquivo, telemetria):
+                telemetria.registrar(entrada)
+    return telemetria
+
+
+# ==================== SLIDES ====================
+
+def _percentual(fracao):
+    return f"{fracao:.0%}"
+
+
+def parametros_metricas(telemetria):
+    """Campos {taxa_cache} e {reducao_latencia} dos slides com os valores medidos"""
+    parametros = {}
+    if telemetria.taxa_acerto() is not None:
+        parametros["taxa_cache"] = _percentual(telemetria.taxa_acerto())
+    if telemetria.reducao_latencia() is not None:
+        parametros["reducao_latencia"] = _percentual(telemetria.reducao_latencia())
+    return parametros
+
+
+def slide_metricas(telemetria, n_faixas=20, titulo=marcar("MÉTRICAS DE DESEMPENHO")):
+    """Slide com o histograma de latência e o resumo de cache e quantis"""
+    latencias = telemetria.latencias
+    cache = []
+    if telemetria.taxa_acerto() is not None:
+        cache = [
+            traduzir("Taxa de acerto: {taxa}").format(taxa=_percentual(telemetria.taxa_acerto())),
+            traduzir("{acertos} acertos, {falhas} falhas").format(acertos=inteiro(telemetria.acertos),
+                                                                  falhas=inteiro(telemetria.falhas)),
+        ]
+        if telemetria.reducao_latencia() is not None:
+            cache.append(traduzir("Redução de latência: {reducao}").format(
+                reducao=_percentual(telemetria.reducao_latencia())))
+    quantis = [f"p{round(q * 100)}: {inteiro(round(latencias.quantil(q)))} ms" for q in QUANTIS
+               if latencias.total]
+    blocos = []
+    if cache:
+        blocos += [("secao", traduzir("Cache"), {"tamanho": 18}), ("lista", cache, {"tamanho": 14})]
+    blocos += [
+        ("secao", traduzir("Latência"), {"tamanho": 18}),
+        ("lista", quantis + [traduzir("{amostras} amostras").format(amostras=inteiro(latencias.total))],
+         {"tamanho": 14}),
+    ]
+    return {
+        "nome": "metricas",
+        "tipo": "grafico",
+        "titulo": traduzir(titulo),
+        "tamanho_titulo": 36,
+        "grafico": {
+            "tipo": "histograma",
+            "faixas": latencias.faixas(n_faixas),
+            "eixo_x": traduzir("Latência (ms)"),
+            "eixo_y": traduzir("Requisições"),
+        },
+        "blocos": blocos,
+    }
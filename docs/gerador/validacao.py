@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Validação da especificação dos slides sem renderizar
+
+Confere tipos de slide, de bloco e de gráfico, campos obrigatórios, nomes
+repetidos, imagens e diagramas ausentes e campos {…} sem valor nos
+parâmetros. Só usa a biblioteca padrão; os tipos aceitos espelham os
+registros MONTADORES e BLOCOS de `renderizadores` e TIPOS_GRAFICO de
+`graficos`.
+"""
+
+import os
+
+from .padroes import CAMPOS_ARQUIVO
+from .parametros import campos
+
+# Campos obrigatórios por tipo de slide
+CAMPOS_SLIDE = {
+    "conteudo": ("titulo", "blocos"),
+    "caixas": ("caixas",),
+    "tabela": ("titulo", "cabecalho", "linhas"),
+    "diagrama": ("titulo", "arquivo"),
+    "er": ("titulo", "arquivo"),
+    "grafico": ("titulo", "grafico"),
+}
+
+# Slides que o emissor direto de XML escreve (ver `emissor`) e os valores de "emissor"
+TIPOS_SO_TEXTO = {"conteudo", "caixas"}
+EMISSORES = {"pptx", "xml"}
+
+TIPOS_BLOCO = {"secao", "texto", "nota", "espaco", "lista", "pares", "topicos", "grupos"}
+
+# Dados obrigatórios por tipo de gráfico (um dos campos de cada tupla)
+DADOS_GRAFICO = {
+    "colunas": (("categorias",), ("series",)),
+    "barras": (("categorias",), ("series",)),
+    "linhas": (("categorias",), ("series",)),
+    "histograma": (("valores", "faixas"),),
+}
+
+
+def _erros_grafico(grafico):
+    tipo = grafico.get("tipo", "colunas")
+    if tipo not in DADOS_GRAFICO:
+        yield f"tipo de gráfico desconhecido: {tipo!r}"
+        return
+    for alternativas in DADOS_GRAFICO[tipo]:
+        if not any(campo in grafico for campo in alternativas):
+            yield f"gráfico sem {' ou '.join(map(repr, alternativas))}"
+    for nome, valores in grafico.get("series", ()):
+        if len(valores) > len(grafico.get("categorias", ())):
+            yield f"série {nome!r} com mais valores que categorias"
+
+
+def _erros_slide(spec):
+    tipo = spec.get("tipo")
+    if tipo not in CAMPOS_SLIDE:
+        yield f"tipo de slide desconhecido: {tipo!r}"
+        return
+    for campo in CAMPOS_SLIDE[tipo]:
+        if campo not in spec:
+            yield f"campo obrigatório ausente: {campo!r}"
+    for bloco in spec.get("blocos", ()):
+        if len(bloco) < 2:
+            yield f"bloco sem conteúdo: {bloco!r}"
+        elif bloco[0] not in TIPOS_BLOCO:
+            yield f"tipo de bloco desconhecido: {bloco[0]!r}"
+    if "grafico" in spec:
+        yield from _erros_grafico(spec["grafico"])
+    for linha in spec.get("linhas", ()):
+        if len(linha) != len(spec.get("cabecalho", ())):
+            yield f"linha da tabela com {len(linha)} colunas: {linha!r}"
+    for caminho, _ in spec.get("imagens", ()):
+        if not os.path.exists(caminho):
+            yield f"imagem não encontrada: {caminho}"
+    emissor = spec.get("emissor")
+    if emissor is not None and emissor not in EMISSORES:
+        yield f"emissor desconhecido: {emissor!r}"
+    elif emissor == "xml" and (tipo not in TIPOS_SO_TEXTO or spec.get("imagens")):
+        yield "emissor 'xml' só escreve slides de texto, sem tabela, gráfico, diagrama ou imagem"
+    for campo in CAMPOS_ARQUIVO:
+        if spec.get(campo) and not os.path.exists(spec[campo]):
+            yield f"arquivo não encontrado: {spec[campo]}"
+
+
+def validar(slides, parametros=()):
+    """Lista de erros (vazia se a especificação for válida)
+
+    `parametros` é a lista de conjuntos de parâmetros das apresentações;
+    cada campo {…} usado nos slides precisa de valor em todos eles.
+    """
+    erros = []
+    vistos = set()
+    for i, spec in enumerate(slides, 1):
+        rotulo = f"slide {i}" + (f" ({spec['nome']})" if spec.get("nome") else "")
+        erros += [f"{rotulo}: {erro}" for erro in _erros_slide(spec)]
+        if spec.get("nome"):
+            if spec["nome"] in vistos:
+                erros.append(f"{rotulo}: nome repetido")
+            vistos.add(spec["nome"])
+        try:
+            usados = set(campos(spec))
+        except ValueError as erro:
+            erros.append(f"{rotulo}: texto com chaves malformadas ({erro})")
+            continue
+        for j, conjunto in enumerate(parametros, 1):
+            for campo in sorted(usados - set(conjunto)):
+                erros.append(f"{rotulo}: campo {{{campo}}} sem valor nos parâmetros {j}")
+    return erros
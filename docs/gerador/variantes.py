@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Variantes de uma apresentação derivadas dos slides nomeados de uma base
+
+Uma variante escolhe slides pelo `nome` e troca campos de alguns deles:
+
+    VARIANTES = {
+        "defesa": Variante(),
+        "pitch": Variante(slides=("capa", "introducao", "resultados", "encerramento"),
+                          substituicoes={"resultados": {"titulo": "RESULTADOS"}}),
+        "poster": Variante(base="pitch", slides=("capa", "resultados")),
+    }
+
+Sem `slides`, a variante fica com todos os slides da base; `base` aponta
+para outra variante, cujas substituições e parâmetros são herdados. As
+substituições trocam campos inteiros (como em `dict.update`).
+
+Slides iguais em várias variantes têm a mesma especificação, então, com
+as variantes geradas juntas (`lote.gerar_variantes`), são renderizados
+uma única vez. Só biblioteca padrão.
+"""
+
+from collections import namedtuple
+
+Variante = namedtuple("Variante", "slides base substituicoes parametros", defaults=(None, None, {}, {}))
+
+
+def resolver_variante(nome, variantes):
+    """Variante com a herança de `base` aplicada: (nomes dos slides ou None, substituições, parâmetros)"""
+    cadeia, atual = [], nome
+    while atual is not None:
+        if atual not in variantes:
+            raise ValueError(f"variante desconhecida: {atual!r}")
+        if atual in cadeia:
+            raise ValueError(f"herança circular entre variantes: {' -> '.join(cadeia + [atual])}")
+        cadeia.append(atual)
+        atual = variantes[atual].base
+
+    selecao, substituicoes, parametros = None, {}, {}
+    for variante in map(variantes.get, reversed(cadeia)):
+        if variante.slides is not None:
+            selecao = tuple(variante.slides)
+        for slide, campos in variante.substituicoes.items():
+            substituicoes[slide] = {**substituicoes.get(slide, {}), **campos}
+        parametros = {**parametros, **variante.parametros}
+    return selecao, substituicoes, parametros
+
+
+def derivar(slides, nome, variantes):
+    """(slides, parâmetros) da variante `nome` a partir da lista de slides base
+
+    Os slides não substituídos são os mesmos objetos da base.
+    """
+    selecao, substituicoes, parametros = resolver_variante(nome, variantes)
+    por_nome = {spec["nome"]: spec for spec in slides if spec.get("nome")}
+    for slide in (selecao or ()) + tuple(substituicoes):
+        if slide not in por_nome:
+            raise ValueError(f"variante {nome!r}: slide desconhecido: {slide!r}")
+    escolhidos = [por_nome[slide] for slide in selecao] if selecao is not None else list(slides)
+    return [{**spec, **substituicoes[spec.get("nome")]} if spec.get("nome") in substituicoes else spec
+            for spec in escolhidos], parametros
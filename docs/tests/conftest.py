@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Testes do gerador: `python -m pytest -q` a partir de docs/"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
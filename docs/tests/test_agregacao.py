@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Agregação das séries (gerador/agregacao.py) e métricas dos logs que chegam aos slides"""
+
+import json
+
+import pytest
+
+import apresentacao_tcc
+from gerador.agregacao import contar_faixas, indices_min_max, passo_redondo, reduzir_series
+from gerador.parametros import personalizar
+from gerador.renderizadores import construir_apresentacao
+from gerador.telemetria import PRECISAO, ler_telemetria, parametros_metricas, slide_metricas
+
+# 8 acertos e 2 falhas: taxa de acerto de 80%; medianas 10 ms e 100 ms: redução de 90%
+LOG = [
+    {"level": "debug", "message": "exercicio", "data": {"cache": "hit", "ms": 10}},
+    {"level": "debug", "message": "exercicio", "data": {"cache": "hit", "ms": 10}},
+    {"level": "debug", "message": "treino", "data": {"cache": "hit", "latencia_ms": 10}},
+    {"cache": "hit", "ms": 10},
+    {"cache": "hit", "ms": 20},
+    {"cache": "hit", "ms": 20},
+    {"cache": "hit", "duration_ms": 20},
+    {"cache": "hit", "ms": 20},
+    {"level": "info", "message": "rede", "data": {"cache": "miss", "ms": 100}},
+    {"cache": "miss", "ms": 300},
+]
+
+
+@pytest.fixture
+def telemetria(tmp_path):
+    caminho = tmp_path / "app.jsonl"
+    linhas = [json.dumps(entrada) for entrada in LOG]
+    linhas += ['{"level": "info", "message": "sem métricas"}', '{"cache": "hit", "ms": ', ""]
+    caminho.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+    return ler_telemetria([str(caminho)])
+
+
+def test_passo_redondo():
+    assert [passo_redondo(v) for v in (0, 0.3, 1, 1.5, 3, 7, 12, 480)] == [1, 0.5, 1, 2, 5, 10, 20, 500]
+
+
+def test_contar_faixas():
+    assert contar_faixas([]) == [] and contar_faixas([None]) == []
+    assert contar_faixas([3, 3, None]) == [(3, 4, 2)]
+    assert contar_faixas([0, 1, 9, 10, 25, None], n_faixas=5) == [
+        (0, 5, 2), (5, 10, 1), (10, 15, 1), (15, 20, 0), (20, 25, 0), (25, 30, 1)]
+
+
+def test_reducao_min_max_preserva_extremos():
+    valores = [0] * 1000
+    valores[123], valores[877] = 50, -50
+    categorias = list(range(1000))
+    reduzidas, [(nome, serie)] = reduzir_series(categorias, [("s", valores)], pontos=20)
+    assert nome == "s" and len(serie) <= 20 and len(reduzidas) == len(serie)
+    assert 123 in reduzidas and 877 in reduzidas
+    assert max(serie) == 50 and min(serie) == -50
+    assert indices_min_max([[1, 2, 3]], pontos=20) == [0, 1, 2]
+
+
+def test_telemetria(telemetria):
+    assert (telemetria.acertos, telemetria.falhas, telemetria.invalidas) == (8, 2, 1)
+    assert telemetria.taxa_acerto() == pytest.approx(0.8)
+    latencias = telemetria.latencias
+    assert latencias.total == 10 and (latencias.minimo, latencias.maximo) == (10, 300)
+    for q, esperado in ((0.5, 20), (0.95, 300), (0.99, 300)):
+        assert latencias.quantil(q) == pytest.approx(esperado, rel=PRECISAO)
+    assert telemetria.reducao_latencia() == pytest.approx(0.9, abs=PRECISAO)
+
+
+def test_histograma_de_latencia(telemetria):
+    faixas = telemetria.latencias.faixas(n_faixas=10, limite=100)
+    assert sum(contagem for *_, contagem in faixas) == 10
+    assert faixas[1] == (10, 20, 4)
+    assert faixas[-1] == (100, None, 2)
+
+
+def test_percentuais_nos_slides(telemetria):
+    assert parametros_metricas(telemetria) == {"taxa_cache": "80%", "reducao_latencia": "90%"}
+    metricas = slide_metricas(telemetria)
+    cache = [bloco[1] for bloco in metricas["blocos"] if bloco[0] == "lista"][0]
+    assert cache[0] == "Taxa de acerto: 80%" and cache[2] == "Redução de latência: 90%"
+
+    slides = apresentacao_tcc.montar_slides(telemetria=telemetria)
+    prs = construir_apresentacao(personalizar(slides, {**apresentacao_tcc.DECK_PADRAO,
+                                                       **parametros_metricas(telemetria)}))
+    texto = "\n".join(forma.text_frame.text for slide in prs.slides for forma in slide.shapes
+                      if forma.has_text_frame)
+    assert "taxa de acerto 80%" in texto
+    assert "Taxa de acerto: 80%" in texto and "Redução de latência: 90%" in texto
+    assert "~85%" not in texto and "73%" not in texto
+
+
+def test_latencias_invalidas(tmp_path):
+    caminho = tmp_path / "app.jsonl"
+    caminho.write_text('{"cache": "hit", "ms": Infinity}\n{"cache": "hit", "ms": NaN}\n'
+                       '{"cache": "miss", "ms": -Infinity}\n{"cache": "miss", "ms": -5}\n'
+                       '{"cache": "hit", "ms": "10"}\n{"cache": "hit", "ms": 10}\n', encoding="utf-8")
+    telemetria = ler_telemetria([str(caminho)])
+    assert (telemetria.acertos, telemetria.falhas, telemetria.invalidas) == (4, 2, 5)
+    latencias = telemetria.latencias
+    assert latencias.total == 1 and latencias.soma == 10 and latencias.quantil(0.5) == 10
+
+
+def test_linhas_invalidas_na_saida(tmp_path, capsys):
+    caminho = tmp_path / "app.jsonl"
+    caminho.write_text('{"cache": "hit", "ms": Infinity}\n{"cache": "hit", "ms": \n', encoding="utf-8")
+    assert apresentacao_tcc._ler_metricas([str(caminho)]).invalidas == 2
+    assert "2 linha(s) inválida(s)" in capsys.readouterr().err
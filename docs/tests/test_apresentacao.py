@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Montagem das apresentações e das variantes (apresentacao_tcc.py)"""
+
+import argparse
+
+from apresentacao_tcc import SLIDES, VARIANTES, criar_variantes, montar_slides
+from gerador.i18n import IDIOMA_ORIGEM
+from gerador.leitura import PacoteLido
+from gerador.variantes import derivar
+
+
+def _nomes(slides):
+    return [spec.get("nome") for spec in slides]
+
+
+def test_modelo_de_dados_antes_do_encerramento():
+    nomes = _nomes(montar_slides(esquema=True))
+    assert nomes[-1] == "encerramento"
+    assert nomes.index("esquema") < nomes.index("encerramento")
+    assert nomes[:nomes.index("esquema")] == _nomes(SLIDES)[:-1]
+
+
+def test_modelo_de_dados_no_fim_sem_encerramento():
+    poster, _ = derivar(SLIDES, "poster", VARIANTES)
+    nomes = _nomes(montar_slides(poster, esquema=True))
+    assert nomes[:len(poster)] == _nomes(poster)
+    assert "esquema" in nomes[len(poster):]
+
+
+def test_variante_conta_as_paginas_de_continuacao(tmp_path, capsys):
+    longo = {"nome": "longo", "tipo": "conteudo", "titulo": "LONGO", "ajuste": "paginar",
+             "blocos": [("lista", [f"Item {i}" for i in range(40)], {"tamanho": 18})]}
+    args = argparse.Namespace(saida=str(tmp_path / "deck.pptx"), compressao=None, cache=None)
+    [caminho] = criar_variantes(args, [("longa", [SLIDES[0], longo], {}, IDIOMA_ORIGEM)])
+    pacote = PacoteLido(caminho)
+    total = len(pacote.slides)
+    pacote.fechar()
+    assert total > 2 and f"deck_longa.pptx ({total} slides)" in capsys.readouterr().out
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Leitura de diagramas do draw.io (gerador/drawio.py)"""
+
+import base64
+import io
+import zlib
+from urllib.parse import quote
+
+import pytest
+from lxml import etree
+
+from gerador.drawio import VERSAO_DRAWIO, ConversorDrawio, ler_drawio
+
+MODELO = """<mxGraphModel><root>
+  <mxCell id="0"/>
+  <mxCell id="1" parent="0"/>
+  <mxCell id="app" value="App &lt;b&gt;Expo&lt;/b&gt;&lt;br&gt;React Native" vertex="1" parent="1"
+          style="rounded=1;whiteSpace=wrap;html=1;fillColor=#dae8fc;strokeColor=#6c8ebf;fontStyle=1;">
+    <mxGeometry x="40" y="60" width="120" height="60" as="geometry"/>
+  </mxCell>
+  <object id="banco" label="Supabase">
+    <mxCell vertex="1" parent="1" style="ellipse;fillColor=#d5e8d4;fontColor=#333333;fontSize=14;">
+      <mxGeometry x="320" y="60" width="80" height="80" as="geometry"/>
+    </mxCell>
+  </object>
+  <mxCell id="decisao" value="Online?" vertex="1" parent="1" style="rhombus;">
+    <mxGeometry x="180" y="200" width="60" height="60" as="geometry"/>
+  </mxCell>
+  <mxCell id="seta" value="consulta" edge="1" parent="1" source="app" target="banco"
+          style="edgeStyle=orthogonalEdgeStyle;dashed=1;startArrow=classic;strokeWidth=2;">
+    <mxGeometry relative="1" as="geometry"/>
+  </mxCell>
+  <mxCell id="rotulo" value="HTTPS" vertex="1" connectable="0" parent="seta" style="edgeLabel;html=1;">
+    <mxGeometry x="-0.2" relative="1" as="geometry"/>
+  </mxCell>
+  <mxCell id="solta" edge="1" parent="1" source="decisao" style="endArrow=none;">
+    <mxGeometry relative="1" as="geometry">
+      <mxPoint x="210" y="320" as="targetPoint"/>
+    </mxGeometry>
+  </mxCell>
+</root></mxGraphModel>"""
+
+
+def _arquivo(tmp_path, conteudo, nome="diagrama.drawio"):
+    caminho = tmp_path / nome
+    caminho.write_text(conteudo, encoding="utf-8")
+    return str(caminho)
+
+
+def _comprimido(modelo):
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    dados = compressor.compress(quote(modelo, safe="").encode("ascii")) + compressor.flush()
+    return f'<mxfile><diagram id="d" name="Página-1">{base64.b64encode(dados).decode("ascii")}</diagram></mxfile>'
+
+
+@pytest.fixture
+def diagrama(tmp_path):
+    return ler_drawio(_arquivo(tmp_path, f'<mxfile><diagram id="d">{MODELO}</diagram></mxfile>'))
+
+
+def test_formas(diagrama):
+    formas = {forma.id: forma for forma in diagrama.formas}
+    assert [(f.id, f.tipo) for f in diagrama.formas] == [
+        ("app", "arredondado"), ("banco", "elipse"), ("decisao", "losango")]
+    app = formas["app"]
+    assert app.texto == "App Expo\nReact Native"
+    assert (app.x, app.y, app.largura, app.altura) == (40, 60, 120, 60)
+    assert (app.preenchimento, app.borda, app.negrito) == ("DAE8FC", "6C8EBF", True)
+    assert formas["banco"].texto == "Supabase" and formas["banco"].tamanho_fonte == 14
+
+
+def test_conectores(diagrama):
+    seta, solta = diagrama.conectores
+    assert (seta.origem, seta.destino, seta.texto) == ("app", "banco", "consulta\nHTTPS")
+    assert (seta.x1, seta.y1, seta.x2, seta.y2) == (160, 90, 320, 100)
+    assert seta.cotovelo and seta.tracejado and seta.seta_inicio and seta.seta_fim and seta.espessura == 2
+    assert (solta.origem, solta.destino, solta.x2, solta.y2) == ("decisao", None, 210, 320)
+    assert not solta.seta_fim
+    assert (diagrama.x, diagrama.y, diagrama.largura, diagrama.altura) == (40, 60, 360, 260)
+
+
+def test_diagrama_comprimido(tmp_path, diagrama):
+    assert ler_drawio(_arquivo(tmp_path, _comprimido(MODELO), "comprimido.drawio")) == diagrama
+
+
+def test_xml_truncado(tmp_path):
+    with pytest.raises(etree.XMLSyntaxError):
+        ler_drawio(_arquivo(tmp_path, f'<mxfile><diagram id="d">{MODELO[:-40]}'))
+
+
+@pytest.mark.parametrize("conteudo", ["não é base64!", base64.b64encode(b"nem deflate").decode("ascii")])
+def test_comprimido_invalido(tmp_path, conteudo):
+    caminho = _arquivo(tmp_path, f'<mxfile><diagram id="d">{conteudo}</diagram></mxfile>')
+    with pytest.raises(ValueError, match="diagrama comprimido inválido"):
+        ler_drawio(caminho)
+
+
+def test_arquivo_vazio(tmp_path):
+    with pytest.raises(etree.XMLSyntaxError):
+        ler_drawio(io.BytesIO(b""))
+
+
+def test_cache_em_disco(tmp_path, diagrama):
+    caminho = _arquivo(tmp_path, _comprimido(MODELO))
+    cache = str(tmp_path / "cache")
+    assert ConversorDrawio(cache).converter(caminho) == diagrama
+    # Outro processo lê o JSON do disco em vez de converter de novo
+    assert ConversorDrawio(cache)._ler_disco(f"{ConversorDrawio().hash(caminho)}-{VERSAO_DRAWIO}") == diagrama
+
+
+@pytest.mark.parametrize("conteudo", ['{"formas": [[', "", '{"formas": []}', "[1, 2]", "\xff"])
+def test_cache_em_disco_corrompido(tmp_path, diagrama, conteudo):
+    caminho = _arquivo(tmp_path, _comprimido(MODELO))
+    cache = str(tmp_path / "cache")
+    chave = f"{ConversorDrawio().hash(caminho)}-{VERSAO_DRAWIO}"
+    ConversorDrawio(cache).converter(caminho)
+    with open(ConversorDrawio(cache)._caminho_disco(chave), "w", encoding="latin-1") as arquivo:
+        arquivo.write(conteudo)
+    assert ConversorDrawio(cache).converter(caminho) == diagrama
+    # A entrada ilegível foi regravada
+    assert ConversorDrawio(cache)._ler_disco(chave) == diagrama
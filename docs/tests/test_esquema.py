@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Leitura do schema.sql e do DB.csv (gerador/esquema.py)"""
+
+import pytest
+
+from gerador.esquema import Esquema, ler_db_csv, ler_schema_sql, nome_tabela
+
+SCHEMA = """
+-- Perfis dos usuários
+CREATE TABLE IF NOT EXISTS public.profiles (
+    id UUID PRIMARY KEY REFERENCES auth.users(id) ON DELETE CASCADE,
+    full_name VARCHAR(120) NOT NULL, -- nome, sobrenome
+    age INTEGER CHECK (age > 0 AND age < 130),
+    weight NUMERIC(5, 2),
+    email TEXT UNIQUE
+);
+
+CREATE TABLE "public"."workout_exercises" (
+    "id" BIGSERIAL,
+    "workout_id" UUID NOT NULL,
+    "exercise_id" UUID,
+    "ordem" INT DEFAULT 0,
+    CONSTRAINT workout_exercises_pkey PRIMARY KEY (id),
+    UNIQUE (workout_id, exercise_id),
+    FOREIGN KEY (workout_id) REFERENCES public.workouts(id)
+);
+
+COMMENT ON TABLE public.profiles IS 'Perfil do idoso (o ''titular'')';
+"""
+
+
+@pytest.fixture
+def esquema(tmp_path):
+    caminho = tmp_path / "schema.sql"
+    caminho.write_text(SCHEMA, encoding="utf-8")
+    return ler_schema_sql(str(caminho))
+
+
+def test_nome_tabela():
+    assert nome_tabela('"public"."profiles"') == "profiles"
+    assert nome_tabela("auth.users") == "auth.users"
+    assert nome_tabela("users", esquema="auth") == "auth.users"
+
+
+def test_colunas_e_tipos(esquema):
+    assert list(esquema.tabelas) == ["profiles", "workout_exercises"]
+    perfis = esquema.tabelas["profiles"]
+    assert [(c.nome, c.tipo) for c in perfis.colunas.values()] == [
+        ("id", "UUID"), ("full_name", "VARCHAR(120)"), ("age", "INTEGER"), ("weight", "NUMERIC(5, 2)"),
+        ("email", "TEXT")]
+    assert perfis.descricao == "Perfil do idoso (o 'titular')"
+
+
+def test_chaves_de_coluna(esquema):
+    colunas = esquema.tabelas["profiles"].colunas
+    assert colunas["id"].chaves() == "PK, FK → auth.users.id"
+    assert colunas["full_name"].chaves() == "NOT NULL"
+    assert colunas["email"].chaves() == "UNIQUE"
+    assert colunas["age"].chaves() == ""
+
+
+def test_restricoes_de_tabela(esquema):
+    colunas = esquema.tabelas["workout_exercises"].colunas
+    assert colunas["id"].chaves() == "PK"
+    assert colunas["workout_id"].chaves() == "FK → workouts.id, UNIQUE (workout_id, exercise_id), NOT NULL"
+    assert colunas["exercise_id"].unica == "UNIQUE (workout_id, exercise_id)"
+    assert [r[:4] for r in esquema.relacoes()] == [
+        ("profiles", "id", "auth.users", "id"), ("workout_exercises", "workout_id", "workouts", "id")]
+
+
+def test_create_table_sem_fechamento(tmp_path):
+    caminho = tmp_path / "schema.sql"
+    caminho.write_text("CREATE TABLE profiles (\n    id UUID PRIMARY KEY,\n    age INT\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="profiles"):
+        ler_schema_sql(str(caminho))
+
+
+def test_db_csv(tmp_path, esquema):
+    caminho = tmp_path / "DB.csv"
+    caminho.write_text(
+        "dbms,table_catalog,table_schema,table_name,column_name,ordinal_position,data_type,"
+        "character_maximum_length,constraint_type\n"
+        "postgresql,postgres,null,null,null,1,uuid,null,PRIMARY KEY\n"
+        "postgresql,postgres,public,profiles,phone,6,character varying,20,UNIQUE\n"
+        "postgresql,postgres,public,profiles,id,1,uuid,null,FOREIGN KEY\n"
+        "postgresql,postgres,public,user_progress,id,1,uuid,null,PRIMARY KEY\n"
+        "postgresql,postgres,auth,sessions,id,1,uuid,null,PRIMARY KEY\n",
+        encoding="utf-8")
+    ler_db_csv(str(caminho), esquema)
+    assert esquema.sem_tabela == {"PRIMARY KEY": 1}
+    perfis = esquema.tabelas["profiles"]
+    assert perfis.colunas["phone"].tipo == "character varying(20)" and perfis.colunas["phone"].unica == "UNIQUE"
+    assert perfis.referenciada == 1
+    assert esquema.tabelas["user_progress"].colunas["id"].primaria
+    assert "auth.sessions" not in esquema.tabelas
+
+
+def test_db_csv_sem_colunas(tmp_path):
+    caminho = tmp_path / "DB.csv"
+    caminho.write_text("table_name,column_name\nprofiles,id\n", encoding="utf-8")
+    with pytest.raises(KeyError):
+        ler_db_csv(str(caminho), Esquema())
+
+
+def test_literais_e_parentese_na_linha_seguinte(tmp_path):
+    caminho = tmp_path / "schema.sql"
+    caminho.write_text("""
+CREATE TABLE public.exercises
+(
+    id UUID PRIMARY KEY, -- chave (gerada)
+    nome TEXT DEFAULT 'sem nome -- (ainda)' NOT NULL,
+    nivel TEXT CHECK (nivel IN ('baixo)', '(alto', 'it''s')),
+    "coluna -- com (aspas" INT,
+    nota TEXT DEFAULT 'linha 1
+linha 2 ) -- ainda no literal',
+    criado_em TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS workouts
+
+    (id UUID PRIMARY KEY, exercise_id UUID REFERENCES exercises(id));
+""", encoding="utf-8")
+    esquema = ler_schema_sql(str(caminho))
+    assert list(esquema.tabelas) == ["exercises", "workouts"]
+    colunas = esquema.tabelas["exercises"].colunas
+    assert list(colunas) == ["id", "nome", "nivel", "coluna -- com (aspas", "nota", "criado_em"]
+    assert colunas["nome"].tipo == "TEXT" and colunas["nome"].obrigatoria
+    assert colunas["criado_em"].tipo == "TIMESTAMP"
+    assert esquema.tabelas["workouts"].colunas["exercise_id"].referencia == ("exercises", "id")
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Catálogos compilados e idioma ativo (gerador/i18n.py)"""
+
+import json
+import os
+
+import pytest
+
+from gerador import i18n
+from gerador.renderizadores import ajustar_slide
+
+
+@pytest.fixture
+def idioma(tmp_path):
+    anterior = dict(i18n._cache)
+    i18n.usar_cache_em_disco(str(tmp_path / "cache"))
+    yield
+    i18n.usar_idioma(i18n.IDIOMA_ORIGEM)
+    i18n._cache.update(anterior)
+
+
+def _catalogo(diretorio, traducoes):
+    caminho = i18n.caminho_catalogo("en", str(diretorio))
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(traducoes, arquivo, ensure_ascii=False)
+    return caminho
+
+
+def test_catalogo_recompilado_no_idioma_ativo(tmp_path, idioma):
+    caminho = _catalogo(tmp_path, {"Olá": "Hello"})
+    i18n.usar_idioma("en", str(tmp_path))
+    assert i18n.traduzir("Olá") == "Hello"
+
+    _catalogo(tmp_path, {"Olá": "Hi there", "Tchau": "Bye"})
+    os.utime(caminho, ns=(0, os.stat(caminho).st_mtime_ns + 1))
+    novo = i18n.abrir_catalogo("en", str(tmp_path))
+    assert i18n.versao_idioma() == ("en", novo.mtime_ns, novo.tamanho)
+    assert i18n.traduzir("Olá") == "Hi there" and i18n.traduzir("Tchau") == "Bye"
+
+
+def test_titulo_de_continuacao_traduzido(idioma):
+    blocos = [("lista", [f"Item {i}" for i in range(40)], {"tamanho": 18})]
+    spec = {"tipo": "conteudo", "titulo": "RESULTS", "blocos": blocos, "ajuste": "paginar"}
+    i18n.usar_idioma("en")
+    titulos = [slide["titulo"] for slide in ajustar_slide(spec)]
+    assert titulos[0] == "RESULTS" and set(titulos[1:]) == {"RESULTS (continued)"}
+    i18n.usar_idioma("es")
+    assert ajustar_slide(spec)[1]["titulo"] == "RESULTS (continuación)"
+    i18n.usar_idioma(i18n.IDIOMA_ORIGEM)
+    assert ajustar_slide(spec)[1]["titulo"] == "RESULTS (cont.)"
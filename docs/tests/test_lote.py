@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""Nomes dos arquivos de saída do lote (gerador/lote.py)"""
+
+import os
+
+import pytest
+
+from gerador.lote import caminho_saida, gerar_lote
+
+
+def test_nome_derivado_do_autor(tmp_path):
+    diretorio = str(tmp_path)
+    assert caminho_saida(diretorio, 7, {"autor": "João da Silva"}) == os.path.join(diretorio, "007_joao_da_silva.pptx")
+    assert caminho_saida(diretorio, 1, {"arquivo": "sub/../a.pptx"}) == os.path.join(diretorio, "sub/../a.pptx")
+
+
+@pytest.mark.parametrize("arquivo", ["../fora.pptx", "a/../../fora.pptx", "/tmp/fora.pptx", ".", "link/x.pptx"])
+def test_arquivo_fora_do_diretorio(tmp_path, arquivo):
+    saida = tmp_path / "saida"
+    saida.mkdir()
+    (saida / "link").symlink_to(tmp_path)
+    with pytest.raises(ValueError, match="fora do diretório de saída"):
+        caminho_saida(str(saida), 1, {"arquivo": arquivo})
+
+
+def test_lote_recusa_antes_de_gravar(tmp_path):
+    saida = tmp_path / "saida"
+    lista = [{"autor": "Ana"}, {"autor": "Bia", "arquivo": "../bia.pptx"}]
+    with pytest.raises(ValueError):
+        gerar_lote([], lista, str(saida))
+    assert os.listdir(saida) == [] and not (tmp_path / "bia.pptx").exists()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Medição de texto (gerador/metricas.py) e ajuste dos slides que transbordam"""
+
+from gerador.estilos import Estilo
+from gerador.metricas import altura_paragrafo, linhas
+from gerador.renderizadores import ajustar_slide
+
+
+def test_quebra_por_palavras():
+    assert linhas("", 16, 500) == 1
+    assert linhas("curto curto", 16, 500) == 1
+    assert linhas(" ".join(["palavra"] * 40), 16, 500) > 1
+
+
+def test_quebras_forcadas():
+    assert linhas("curto\ncurto", 16, 500) == 2
+    assert linhas("curto\n\ncurto", 16, 500) == 3
+    longa = " ".join(["palavra"] * 40)
+    assert linhas(f"{longa}\ncurto", 16, 500) == linhas(longa, 16, 500) + 1
+    est = Estilo(tamanho=16)
+    assert altura_paragrafo("curto\ncurto\ncurto", est, 600) > altura_paragrafo("curto curto curto", est, 600)
+
+
+def test_slide_com_quebras_forcadas_e_ajustado():
+    def slide(linhas_por_bloco, separador="\n"):
+        texto = separador.join(f"Linha {i}" for i in range(linhas_por_bloco))
+        return {"tipo": "conteudo", "titulo": "QUEBRAS", "blocos": [("texto", texto, {"tamanho": 16})] * 3}
+
+    assert ajustar_slide(slide(8, " ")) == [slide(8, " ")]
+    assert ajustar_slide(slide(6))[0]["escala"] < 1
+    paginas = ajustar_slide(slide(8))
+    assert len(paginas) == 2 and paginas[1]["titulo"] == "QUEBRAS (cont.)"
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Parser de tuplas dos INSERT do dump SQL (gerador/perfis.py)"""
+
+import sqlite3
+
+import pytest
+
+from gerador.perfis import abrir_perfis, carregar_dump, ler_inserts
+
+
+def _dump(tmp_path, texto):
+    caminho = tmp_path / "dump.sql"
+    caminho.write_text(texto, encoding="utf-8")
+    return str(caminho)
+
+
+def _linhas(caminho, **opcoes):
+    return list(ler_inserts(caminho, **opcoes))
+
+
+def test_virgula_entre_aspas(tmp_path):
+    caminho = _dump(tmp_path, """INSERT INTO "public"."profiles" ("id", "nome") VALUES ('1', 'Silva, Maria');""")
+    assert _linhas(caminho) == [("profiles", ("id", "nome"), ("1", "Silva, Maria"))]
+
+
+def test_aspas_escapadas(tmp_path):
+    caminho = _dump(tmp_path, """INSERT INTO profiles (id, nome) VALUES ('1', 'D''Ávila'), ('2', '''x''');""")
+    assert [valores for _, _, valores in _linhas(caminho)] == [("1", "D'Ávila"), ("2", "'x'")]
+
+
+def test_null_e_literais(tmp_path):
+    caminho = _dump(tmp_path, "INSERT INTO profiles (id, idade, peso, ativo, nivel) "
+                              "VALUES ('1', 67, 71.5, true, NULL), ('2', null, -3, FALSE, 'null');")
+    assert [valores for _, _, valores in _linhas(caminho)] == [
+        ("1", 67, 71.5, 1, None),
+        ("2", None, -3, 0, "null"),
+    ]
+
+
+def test_varios_inserts_com_varias_linhas(tmp_path):
+    caminho = _dump(tmp_path, """
+        INSERT INTO "public"."profiles" ("id", "nome") VALUES ('1', 'Ana'), ('2', 'Bia'),
+            ('3', 'Caio');
+        -- comentário entre os INSERT
+        INSERT INTO "public"."workouts" ("id") VALUES ('w1'), ('w2');
+        INSERT INTO "public"."profiles" ("id", "nome") VALUES ('4', 'Davi')
+    """)
+    assert _linhas(caminho) == [
+        ("profiles", ("id", "nome"), ("1", "Ana")),
+        ("profiles", ("id", "nome"), ("2", "Bia")),
+        ("profiles", ("id", "nome"), ("3", "Caio")),
+        ("workouts", ("id",), ("w1",)),
+        ("workouts", ("id",), ("w2",)),
+        ("profiles", ("id", "nome"), ("4", "Davi")),
+    ]
+
+
+def test_tuplas_partidas_entre_blocos(tmp_path):
+    linhas = ", ".join(f"('{i}', 'nome, {i}', NULL)" for i in range(200))
+    caminho = _dump(tmp_path, f"INSERT INTO profiles (id, nome, idade) VALUES {linhas};")
+    esperado = _linhas(caminho)
+    assert len(esperado) == 200
+    assert esperado[7][2] == ("7", "nome, 7", None)
+    for tamanho in (1, 7, 64):
+        assert _linhas(caminho, tamanho_bloco=tamanho) == esperado
+
+
+def test_tupla_com_campos_a_menos(tmp_path):
+    caminho = _dump(tmp_path, "INSERT INTO profiles (id, nome) VALUES ('1', 'Ana'), ('2');")
+    with pytest.raises(ValueError, match="tupla malformada"):
+        _linhas(caminho)
+
+
+def test_carregar_dump(tmp_path):
+    caminho = _dump(tmp_path, "INSERT INTO profiles (id, activity_level, created_at) VALUES "
+                              "('1', 'low', '2025-10-23 19:05:07+00'), ('2', NULL, '2025-10-24 08:00:00+00');")
+    conexao = sqlite3.connect(":memory:")
+    assert carregar_dump(caminho, conexao) == 2
+    assert conexao.execute("SELECT id, activity_level FROM profiles ORDER BY id").fetchall() == [
+        ("1", "low"), ("2", None)]
+    indices = {linha[0] for linha in conexao.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert indices == {"profiles_activity_level", "profiles_created_at"}
+
+
+@pytest.mark.parametrize("banco", [":memory:", "perfis.db"])
+def test_dump_sem_profiles(tmp_path, banco):
+    caminho = _dump(tmp_path, "INSERT INTO workouts (id) VALUES ('w1');")
+    banco = banco if banco == ":memory:" else str(tmp_path / banco)
+    with pytest.raises(ValueError, match="não tem INSERT INTO profiles"):
+        abrir_perfis(caminho, banco)
+    assert not (tmp_path / "perfis.db").exists()
+
+
+def test_profiles_sem_as_colunas_dos_slides(tmp_path):
+    caminho = _dump(tmp_path, "INSERT INTO profiles (id, age) VALUES ('1', 67);")
+    with pytest.raises(ValueError, match="não tem as colunas created_at, activity_level, weight"):
+        abrir_perfis(caminho)
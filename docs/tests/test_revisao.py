@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Regras da revisão dos slides (gerador/revisao.py)"""
+
+from gerador.revisao import caixas_do_slide, revisar
+
+TABELA = {"nome": "tabela", "tipo": "tabela", "titulo": "TABELA profiles",
+          "cabecalho": ["Coluna", "Tipo"], "linhas": [["id", "UUID"], ["age", "INTEGER"]]}
+GRAFICO = {"nome": "grafico", "tipo": "grafico", "titulo": "MÉTRICAS DE DESEMPENHO",
+           "grafico": {"tipo": "histograma", "valores": [10, 20, 20, 300], "n_faixas": 4, "eixo_x": "ms"}}
+
+
+def _problemas(*slides, regra="fonte_minima"):
+    return [p for p in revisar([("deck", list(slides))]).problemas if p.regra == regra]
+
+
+def test_fonte_padrao_de_tabelas_e_graficos():
+    assert _problemas(TABELA, GRAFICO) == []
+
+
+def test_texto_do_grafico():
+    [grafico] = [caixa for caixa in caixas_do_slide(GRAFICO) if caixa.nome == "gráfico"]
+    textos = [texto for texto, _ in grafico.paragrafos]
+    assert "MÉTRICAS DE DESEMPENHO" not in textos
+    assert "ms" in textos and len(textos) == 4 + 2
+
+
+def test_fonte_pequena_no_conteudo():
+    spec = {"nome": "texto", "tipo": "conteudo", "titulo": "T", "blocos": [("texto", "Letra miúda", {"tamanho": 12})]}
+    [problema] = _problemas(spec)
+    assert "fonte de 12 pt em conteúdo (mínimo 14 pt)" in problema.mensagem
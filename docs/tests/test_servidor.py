@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Servidor de renderização (gerador/servidor.py)"""
+
+import json
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from gerador.servidor import enviar, servir
+
+SLIDES = [{"nome": "capa", "tipo": "conteudo", "titulo": "{titulo}", "blocos": [("texto", "Olá, {autor}")]}]
+
+
+def _linha(caminho_socket, dados):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conexao:
+        conexao.connect(caminho_socket)
+        with conexao.makefile("rwb") as canal:
+            canal.write(dados)
+            canal.flush()
+            return json.loads(canal.readline())
+
+
+def _conectar(caminho_socket):
+    for _ in range(500):
+        try:
+            return enviar(caminho_socket, {"comando": "ping"})
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.01)
+    raise TimeoutError(caminho_socket)
+
+
+@pytest.fixture
+def servidor(tmp_path):
+    caminho, erros = str(tmp_path / "servidor.sock"), []
+
+    def rodar():
+        try:
+            servir(caminho, SLIDES, {"titulo": "T", "autor": "A"})
+        except Exception as erro:
+            erros.append(erro)
+
+    thread = threading.Thread(target=rodar, daemon=True)
+    thread.start()
+    _conectar(caminho)
+    yield caminho
+    if os.path.exists(caminho):
+        enviar(caminho, {"comando": "parar"})
+    thread.join(5)
+    assert not thread.is_alive() and erros == [] and not os.path.exists(caminho)
+
+
+@pytest.mark.parametrize("dados", [b"not json\n", b"[1, 2]\n", b"\xff\n", b'{"saida": 1}\n'])
+def test_pedido_invalido_nao_derruba_o_servidor(servidor, tmp_path, dados):
+    resposta = _linha(servidor, dados)
+    assert resposta["ok"] is False and resposta["erro"]
+    saida = str(tmp_path / "deck.pptx")
+    resposta = enviar(servidor, {"saida": saida, "parametros": {"autor": "Maria"}})
+    assert resposta["ok"] and resposta["saida"] == saida and os.path.exists(saida)
+
+
+def test_parar_com_o_socket_ja_removido(servidor, tmp_path):
+    outro = str(tmp_path / "outro.sock")
+    os.link(servidor, outro)
+    os.unlink(servidor)
+    assert enviar(outro, {"comando": "parar"}) == {"ok": True}